@@ -0,0 +1,291 @@
+"""
+Decision Conflict Index
+Contradiction-keyword buckets with MinHash/LSH, so only likely same-topic decision pairs are compared
+"""
+import logging
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from ai.meeting_index import meeting_key
+from config import settings
+from keyword_matcher import compile_keywords
+from text_embedding import STOPWORDS
+
+logger = logging.getLogger(__name__)
+
+# (earlier decision keyword, later decision keyword)
+CONTRADICTION_PAIRS = [
+    ("approve", "reject"),
+    ("increase", "decrease"),
+    ("add", "remove"),
+    ("start", "cancel"),
+    ("hire", "layoff")
+]
+
+# "Same topic": the two decisions share more than this many words
+MIN_SHARED_WORDS = 3
+
+_PRIME = (1 << 31) - 1  # hash values and coefficients stay below 2**31, products fit in uint64
+
+
+class MinHasher:
+    """MinHash signatures over word sets (universal hashing of CRC32 word hashes)"""
+
+    def __init__(self, num_perm: int, seed: int = 42):
+        rng = np.random.RandomState(seed)
+        self.a = rng.randint(1, _PRIME, size=num_perm).astype(np.uint64)
+        self.b = rng.randint(0, _PRIME, size=num_perm).astype(np.uint64)
+
+    def signature(self, words: Iterable[str]) -> np.ndarray:
+        hashes = np.fromiter((zlib.crc32(w.encode()) % _PRIME for w in words), dtype=np.uint64)
+        if not hashes.size:
+            return np.full(self.a.size, _PRIME, dtype=np.uint64)
+        return ((np.outer(self.a, hashes) + self.b[:, None]) % _PRIME).min(axis=1)
+
+
+@dataclass
+class IndexedDecision:
+    text: str  # lowercased
+    meeting: str
+    date: Any
+    words: FrozenSet[str]
+
+
+class DecisionConflictIndex:
+    """
+    Incremental index of decisions for contradiction detection
+
+    A conflict is a pair (earlier, later) where the earlier decision contains
+    the first keyword of a contradiction pair, the later one the second, and
+    they share more than MIN_SHARED_WORDS words.
+
+    Decisions are bucketed by the contradiction keywords they contain; within
+    a keyword, LSH tables over MinHash signatures of the decision's content
+    words (stopwords dropped) group decisions about the same topic. A new
+    decision is only compared with earlier decisions that hold the opposing
+    keyword and share at least one LSH band with it, so work per decision
+    depends on how many near-duplicates exist, not on the total. Conflicts
+    are found as decisions arrive and kept.
+
+    LSH makes this approximate: pairs whose overlap is mostly stopwords,
+    or whose content words are too dissimilar, may not become candidates
+    (see benchmark_conflict_index for recall).
+    """
+
+    def __init__(
+        self,
+        bands: int = settings.DECISION_LSH_BANDS,
+        rows: int = settings.DECISION_LSH_ROWS,
+        contradiction_pairs: List[Tuple[str, str]] = CONTRADICTION_PAIRS
+    ):
+        self.bands = bands
+        self.rows = rows
+        self.contradiction_pairs = contradiction_pairs
+        self.minhasher = MinHasher(bands * rows)
+        self._keyword_set = frozenset(word for pair in contradiction_pairs for word in pair)
+        self.matcher = compile_keywords(self._keyword_set)
+
+        self.decisions: List[IndexedDecision] = []
+        self.conflicts: List[Tuple[int, int, int]] = []  # (earlier, later, pair index)
+        self.candidates_checked = 0
+
+        # (keyword, band, band hash) -> decision indices
+        self._tables: Dict[Tuple[str, int, int], List[int]] = defaultdict(list)
+
+        self._indexed_meetings: Set[str] = set()
+        self._synced_list: Optional[List[Dict[str, Any]]] = None
+        self._synced_count = 0
+
+    def __len__(self) -> int:
+        return len(self.decisions)
+
+    # ========================================================================
+    # UPDATES
+    # ========================================================================
+
+    def add_decision(self, text: str, meeting: str = "Unknown", date: Any = None) -> int:
+        """Index a decision (newer than everything indexed so far); returns its index"""
+
+        text = text.lower()
+        index = len(self.decisions)
+        words = frozenset(text.split())
+        self.decisions.append(IndexedDecision(text=text, meeting=meeting, date=date, words=words))
+
+        keywords = self.matcher.matched(text, lowered=True)
+        if not keywords:
+            return index
+
+        # Topic words only: stopwords say nothing about the subject, and the
+        # contradiction keywords themselves differ by construction
+        signature = self.minhasher.signature(
+            w for w in words if w not in STOPWORDS and w not in self._keyword_set
+        )
+        band_keys = [
+            (band, hash(signature[band * self.rows:(band + 1) * self.rows].tobytes()))
+            for band in range(self.bands)
+        ]
+
+        # Compare with earlier decisions holding the opposing keyword
+        for pair_index, (word1, word2) in enumerate(self.contradiction_pairs):
+            if word2 not in keywords:
+                continue
+
+            candidates: Set[int] = set()
+            for band, key in band_keys:
+                candidates.update(self._tables.get((word1, band, key), ()))
+
+            self.candidates_checked += len(candidates)
+            for other in sorted(candidates):
+                if len(self.decisions[other].words & words) > MIN_SHARED_WORDS:
+                    self.conflicts.append((other, index, pair_index))
+
+        for keyword in keywords:
+            for band, key in band_keys:
+                self._tables[(keyword, band, key)].append(index)
+
+        return index
+
+    def add_meeting(self, meeting: Dict[str, Any]):
+        key = meeting_key(meeting)
+        if key in self._indexed_meetings:
+            return
+        self._indexed_meetings.add(key)
+
+        for decision in meeting.get("decisions", []):
+            self.add_decision(decision, meeting.get("title", "Unknown"), meeting.get("meeting_date"))
+
+    def sync(self, meetings: List[Dict[str, Any]]):
+        """Index decisions of meetings not seen yet (only the new tail of a list synced before)"""
+
+        if meetings is self._synced_list and len(meetings) >= self._synced_count:
+            new_meetings = meetings[self._synced_count:]
+        else:
+            new_meetings = meetings
+        self._synced_list, self._synced_count = meetings, len(meetings)
+
+        for meeting in new_meetings:
+            self.add_meeting(meeting)
+
+    # ========================================================================
+    # QUERIES
+    # ========================================================================
+
+    def conflict_pairs(self) -> List[Tuple[int, int, int]]:
+        """(earlier, later, pair index) in the order the full pairwise scan reports them"""
+        return sorted(self.conflicts)
+
+    def conflict_reports(self) -> List[Dict[str, Any]]:
+        reports = []
+        for i, j, _ in self.conflict_pairs():
+            first, second = self.decisions[i], self.decisions[j]
+            reports.append({
+                "type": "decision_conflict",
+                "severity": "medium",
+                "message": "Potentially conflicting decisions detected",
+                "decision1": first.text,
+                "decision2": second.text,
+                "meetings": [first.meeting, second.meeting]
+            })
+        return reports
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def exact_conflicts(texts: List[str], contradiction_pairs: List[Tuple[str, str]] = CONTRADICTION_PAIRS) -> List[Tuple[int, int, int]]:
+    """Reference: every keyword-bucketed pair, overlap checked exhaustively"""
+
+    matcher = compile_keywords(word for pair in contradiction_pairs for word in pair)
+    lowered = [t.lower() for t in texts]
+    words = [set(t.split()) for t in lowered]
+
+    decisions_with = defaultdict(list)
+    for index, text in enumerate(lowered):
+        for word in matcher.matched(text, lowered=True):
+            decisions_with[word].append(index)
+
+    conflicts = []
+    for pair_index, (word1, word2) in enumerate(contradiction_pairs):
+        for i in decisions_with.get(word1, []):
+            for j in decisions_with.get(word2, []):
+                if j > i and len(words[i] & words[j]) > MIN_SHARED_WORDS:
+                    conflicts.append((i, j, pair_index))
+    return sorted(conflicts)
+
+
+def benchmark_conflict_index(
+    decisions: int = 100_000,
+    exact_sample: int = 10_000,
+    topics: int = 5_000,
+    seed: int = 11
+) -> Dict[str, Any]:
+    """
+    Synthetic decision stream: each decision is about one of `topics` topics
+    (4-6 of the topic's 6 words), uses a random action verb (a contradiction
+    keyword about half the time) and conversational filler.
+
+    On the first `exact_sample` decisions the index is compared with the
+    exhaustive scan: overall recall, and recall on conflicts between
+    decisions about the same topic (the rest only share filler words). The
+    index is then timed on all `decisions`.
+    """
+    import random
+    import time
+
+    rng = random.Random(seed)
+
+    vocabulary = [f"w{i}" for i in range(20_000)]
+    topic_words = [rng.sample(vocabulary, 6) for _ in range(topics)]
+    verbs = [w for pair in CONTRADICTION_PAIRS for w in pair] + [
+        "discuss", "review", "revisit", "postpone", "keep", "move", "merge", "ship", "plan", "defer"
+    ]
+    filler = "the team will we to for and on next in of with by a".split()
+
+    texts, text_topics = [], []
+    for _ in range(decisions):
+        topic = rng.randrange(topics)
+        words = rng.sample(topic_words[topic], rng.randint(4, 6))
+        words += rng.sample(filler, rng.randint(2, 5))
+        words.append(rng.choice(verbs))
+        rng.shuffle(words)
+        texts.append(" ".join(words))
+        text_topics.append(topic)
+
+    start = time.perf_counter()
+    exact = set(exact_conflicts(texts[:exact_sample]))
+    exact_seconds = time.perf_counter() - start
+    exact_topical = {c for c in exact if text_topics[c[0]] == text_topics[c[1]]}
+
+    sample_index = DecisionConflictIndex()
+    for text in texts[:exact_sample]:
+        sample_index.add_decision(text)
+    found = set(sample_index.conflict_pairs())
+    assert found <= exact, "index reported a pair the exhaustive scan rejects"
+
+    index = DecisionConflictIndex()
+    start = time.perf_counter()
+    for text in texts:
+        index.add_decision(text)
+    index_seconds = time.perf_counter() - start
+
+    return {
+        "sample_decisions": exact_sample,
+        "sample_exact_seconds": round(exact_seconds, 2),
+        "sample_exact_conflicts": len(exact),
+        "sample_recall": round(len(found) / len(exact), 3) if exact else 1.0,
+        "sample_same_topic_recall": round(len(found & exact_topical) / len(exact_topical), 3) if exact_topical else 1.0,
+        "decisions": decisions,
+        "index_seconds": round(index_seconds, 2),
+        "index_conflicts": len(index.conflicts),
+        "candidates_checked": index.candidates_checked,
+        "per_decision_ms": round(index_seconds / decisions * 1000, 3)
+    }
+
+
+if __name__ == "__main__":
+    print(benchmark_conflict_index())
@@ -0,0 +1,494 @@
+"""
+Task Dependency Graph
+Blocking relations between action items per organization, with critical-path, blocked-by and cycle queries
+"""
+import json
+import logging
+import os
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session
+
+from ai.meeting_index import DEFAULT_ORGANIZATION
+from ai.shared_log import SharedLog
+from config import settings
+from deadline_index import deadline_indexes, is_open_status
+from models import ActionItem, Meeting
+
+logger = logging.getLogger(__name__)
+
+GRAPH_FILENAME = "dependencies.jsonl"
+
+# session.info key for task changes flushed but not yet committed
+_PENDING_CHANGES = "dependency_graph_changes"
+
+
+@dataclass
+class TaskNode:
+    """A task (action item or classified task) in the dependency graph"""
+    task_id: str
+    text: str = ""
+    project_id: Optional[str] = None
+    project_name: Optional[str] = None
+    is_open: bool = True
+    due_date: Optional[str] = None  # ISO date
+
+
+@dataclass
+class BlockingTask:
+    """An open task in a blocking chain"""
+    task: TaskNode
+    depth: int  # 1 = direct
+    via: str  # the task it directly blocks (or waits on) in the chain
+
+
+@dataclass
+class CriticalPath:
+    """The longest chain of open tasks, first to be done first"""
+    tasks: List[TaskNode]
+    cyclic: bool  # the chain runs through a dependency cycle (its tasks are listed together)
+
+
+class _Analysis:
+    """
+    Whole-graph results, computed once per change to the graph
+
+    Open tasks are grouped into strongly connected components (Tarjan), so
+    cycles are found and the component graph is acyclic. Components come out
+    blockers first, which makes the longest chain up to and from every
+    component one pass each way.
+    """
+
+    def __init__(self, nodes: Dict[str, TaskNode], blockers: Dict[str, Set[str]], dependents: Dict[str, Set[str]]):
+        open_ids = [task_id for task_id, node in nodes.items() if node.is_open]
+        is_open = set(open_ids)
+
+        def open_neighbours(adjacency: Dict[str, Set[str]], task_id: str) -> List[str]:
+            return [other for other in adjacency.get(task_id, ()) if other in is_open]
+
+        self.components = self._strongly_connected(open_ids, lambda task_id: open_neighbours(blockers, task_id))
+        self.component_of: Dict[str, int] = {
+            task_id: index for index, component in enumerate(self.components) for task_id in component
+        }
+
+        count = len(self.components)
+        self.blocker_components: List[Set[int]] = [set() for _ in range(count)]
+        self.dependent_components: List[Set[int]] = [set() for _ in range(count)]
+        for index, component in enumerate(self.components):
+            for task_id in component:
+                for blocker in open_neighbours(blockers, task_id):
+                    other = self.component_of[blocker]
+                    if other != index:
+                        self.blocker_components[index].add(other)
+                        self.dependent_components[other].add(index)
+
+        # Open tasks in the longest chain ending with / starting from each component
+        self.upstream = [0] * count
+        for index in range(count):
+            self.upstream[index] = len(self.components[index]) + max(
+                (self.upstream[other] for other in self.blocker_components[index]), default=0
+            )
+        self.downstream = [0] * count
+        for index in reversed(range(count)):
+            self.downstream[index] = len(self.components[index]) + max(
+                (self.downstream[other] for other in self.dependent_components[index]), default=0
+            )
+
+        self.cycles = [sorted(component) for component in self.components if len(component) > 1]
+
+    @staticmethod
+    def _strongly_connected(task_ids: Iterable[str], successors) -> List[List[str]]:
+        """Tarjan's algorithm without recursion; components in reverse topological order"""
+
+        index_of: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack: Set[str] = set()
+        components: List[List[str]] = []
+
+        for root in task_ids:
+            if root in index_of:
+                continue
+            work = [(root, iter(successors(root)))]
+            index_of[root] = lowlink[root] = len(index_of)
+            stack.append(root)
+            on_stack.add(root)
+
+            while work:
+                task_id, children = work[-1]
+                for child in children:
+                    if child not in index_of:
+                        index_of[child] = lowlink[child] = len(index_of)
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(successors(child))))
+                        break
+                    if child in on_stack:
+                        lowlink[task_id] = min(lowlink[task_id], index_of[child])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[task_id])
+                    if lowlink[task_id] == index_of[task_id]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == task_id:
+                                break
+                        components.append(component)
+
+        return components
+
+    def critical_components(self, candidates: Iterable[int]) -> List[int]:
+        """Components of the longest chain through the best candidate, first to be done first"""
+
+        best = max(candidates, key=lambda index: self.upstream[index] + self.downstream[index], default=None)
+        if best is None:
+            return []
+
+        before = []
+        index = best
+        while self.blocker_components[index]:
+            index = max(self.blocker_components[index], key=lambda other: self.upstream[other])
+            before.append(index)
+
+        after = []
+        index = best
+        while self.dependent_components[index]:
+            index = max(self.dependent_components[index], key=lambda other: self.downstream[other])
+            after.append(index)
+
+        return before[::-1] + [best] + after
+
+
+class DependencyGraph(SharedLog):
+    """
+    One organization's task dependencies as adjacency lists
+
+    Each task keeps the set of tasks it waits on (blockers) and the set of
+    tasks waiting on it (dependents), so edges are added and removed in O(1)
+    and blocking chains are walked without scanning the graph. Critical path
+    and cycle queries read from an analysis of the open tasks that is
+    rebuilt, in linear time, on the first query after a change.
+
+    The graph is persisted as a shared append-only log (see SharedLog), so
+    every worker sees edges added by the others.
+    """
+
+    def __init__(self, path: Optional[str]):
+        super().__init__(path)
+        self._clear()
+
+        if self.path and os.path.exists(self.path):
+            self.refresh()
+            if self._log_lines > 2 * (len(self.nodes) + self.edge_count) + 1000:
+                self._compact()
+            logger.info(f"🕸️ Dependency graph loaded from {self.path}: {len(self.nodes)} tasks, {self.edge_count} edges")
+
+    def _clear(self):
+        self.nodes: Dict[str, TaskNode] = {}
+        self.blockers: Dict[str, Set[str]] = {}  # task -> tasks it waits on
+        self.dependents: Dict[str, Set[str]] = {}  # task -> tasks waiting on it
+        self.edge_count = 0
+        self._analysis: Optional[_Analysis] = None
+        self._reset_log()
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, task_id: str) -> bool:
+        return str(task_id) in self.nodes
+
+    # ========================================================================
+    # UPDATES
+    # ========================================================================
+
+    def upsert_tasks(self, tasks: Sequence[TaskNode]):
+        """Add tasks or update their text, project or status (unchanged tasks are not rewritten)"""
+
+        self.refresh()
+        with self._lock:
+            changed = [task for task in tasks if self.nodes.get(str(task.task_id)) != task]
+        if changed:
+            self._write([
+                ["task", str(task.task_id), task.text, task.project_id, task.project_name, task.is_open, task.due_date]
+                for task in changed
+            ])
+
+    def update_task(self, task_id: Any, text: str, is_open: bool, due_date: Optional[str]):
+        """Update a task's text, status and due date, keeping its project (no-op for unknown tasks)"""
+
+        task_id = str(task_id)
+        self.refresh()
+        with self._lock:
+            node = self.nodes.get(task_id)
+        if node is not None:
+            self.upsert_tasks([TaskNode(task_id, text, node.project_id, node.project_name, is_open, due_date)])
+
+    def add_dependencies(self, edges: Iterable[Tuple[Any, Any]]) -> List[Tuple[str, str]]:
+        """
+        Record that each `task` waits on `blocker`, for (task, blocker) pairs
+
+        Meant for batches (e.g. all dependencies extracted from one meeting);
+        edges already present and self-dependencies are skipped. Returns the
+        edges added.
+        """
+
+        self.refresh()
+        added: List[Tuple[str, str]] = []
+        seen: Set[Tuple[str, str]] = set()
+        with self._lock:
+            for task_id, blocker_id in edges:
+                edge = (str(task_id), str(blocker_id))
+                if edge[0] == edge[1] or edge in seen or edge[1] in self.blockers.get(edge[0], ()):
+                    continue
+                seen.add(edge)
+                added.append(edge)
+
+        if added:
+            self._write([["edge", task_id, blocker_id] for task_id, blocker_id in added])
+        return added
+
+    def remove_dependency(self, task_id: Any, blocker_id: Any):
+        self._write([["unedge", str(task_id), str(blocker_id)]])
+
+    def remove_task(self, task_id: Any):
+        """Drop a task and every dependency on or of it"""
+        self._write([["drop", str(task_id)]])
+
+    def _apply(self, record: list):
+        kind = record[0]
+        if kind == "task":
+            _, task_id, text, project_id, project_name, is_open, due_date = record
+            self.nodes[task_id] = TaskNode(task_id, text, project_id, project_name, bool(is_open), due_date)
+        elif kind == "edge":
+            _, task_id, blocker_id = record
+            waits_on = self.blockers.setdefault(task_id, set())
+            if blocker_id not in waits_on:
+                waits_on.add(blocker_id)
+                self.dependents.setdefault(blocker_id, set()).add(task_id)
+                self.edge_count += 1
+        elif kind == "unedge":
+            self._unlink(record[1], record[2])
+        elif kind == "drop":
+            task_id = record[1]
+            for blocker_id in list(self.blockers.get(task_id, ())):
+                self._unlink(task_id, blocker_id)
+            for dependent_id in list(self.dependents.get(task_id, ())):
+                self._unlink(dependent_id, task_id)
+            self.nodes.pop(task_id, None)
+        else:
+            raise ValueError(f"Unknown dependency record: {kind}")
+
+        self._analysis = None
+
+    def _unlink(self, task_id: str, blocker_id: str):
+        waits_on = self.blockers.get(task_id)
+        if not waits_on or blocker_id not in waits_on:
+            return
+        waits_on.discard(blocker_id)
+        if not waits_on:
+            del self.blockers[task_id]
+        waiting = self.dependents[blocker_id]
+        waiting.discard(task_id)
+        if not waiting:
+            del self.dependents[blocker_id]
+        self.edge_count -= 1
+
+    # ========================================================================
+    # QUERIES
+    # ========================================================================
+
+    def waits_on(self, task_id: Any) -> List[str]:
+        """IDs of the tasks `task_id` directly waits on, open or not"""
+        self.refresh()
+        with self._lock:
+            return sorted(self.blockers.get(str(task_id), ()))
+
+    def blocked_by(self, task_id: Any, max_depth: Optional[int] = None) -> List[BlockingTask]:
+        """Open tasks `task_id` waits on, directly or through other open tasks, nearest first"""
+        return self._walk(str(task_id), self.blockers, max_depth)
+
+    def blocking(self, task_id: Any, max_depth: Optional[int] = None) -> List[BlockingTask]:
+        """Open tasks waiting on `task_id`, directly or through other open tasks, nearest first"""
+        return self._walk(str(task_id), self.dependents, max_depth)
+
+    def critical_path(self, project_id: Optional[str] = None) -> CriticalPath:
+        """
+        The longest chain of open tasks (through a task of `project_id`, if given)
+
+        The chain may cross into other projects: those are the tasks holding
+        the project up, or held up by it.
+        """
+
+        self.refresh()
+        with self._lock:
+            analysis = self._analyze()
+            if project_id is None:
+                candidates: Iterable[int] = range(len(analysis.components))
+            else:
+                candidates = {
+                    analysis.component_of[task_id]
+                    for task_id, node in self.nodes.items()
+                    if node.is_open and node.project_id == project_id
+                }
+
+            components = analysis.critical_components(candidates)
+            return CriticalPath(
+                tasks=[self.nodes[task_id] for index in components for task_id in sorted(analysis.components[index])],
+                cyclic=any(len(analysis.components[index]) > 1 for index in components)
+            )
+
+    def cycles(self, project_id: Optional[str] = None) -> List[List[TaskNode]]:
+        """Groups of open tasks that (transitively) wait on each other, optionally only those touching a project"""
+
+        self.refresh()
+        with self._lock:
+            return [
+                [self.nodes[task_id] for task_id in cycle]
+                for cycle in self._analyze().cycles
+                if project_id is None or any(self.nodes[task_id].project_id == project_id for task_id in cycle)
+            ]
+
+    def _walk(self, start: str, adjacency: Dict[str, Set[str]], max_depth: Optional[int]) -> List[BlockingTask]:
+        """Breadth-first over open tasks; closed tasks neither appear nor pass the chain on"""
+
+        self.refresh()
+        with self._lock:
+            found: List[BlockingTask] = []
+            seen = {start}
+            queue = deque([(start, 0)])
+            while queue:
+                task_id, depth = queue.popleft()
+                if max_depth is not None and depth >= max_depth:
+                    continue
+                for other in adjacency.get(task_id, ()):
+                    node = self.nodes.get(other)
+                    if other in seen or node is None or not node.is_open:
+                        continue
+                    seen.add(other)
+                    found.append(BlockingTask(node, depth + 1, task_id))
+                    queue.append((other, depth + 1))
+            return found
+
+    def _analyze(self) -> _Analysis:
+        if self._analysis is None:
+            self._analysis = _Analysis(self.nodes, self.blockers, self.dependents)
+        return self._analysis
+
+    # ========================================================================
+    # MAINTENANCE
+    # ========================================================================
+
+    def _compact(self):
+        """Rewrite the log with only the current tasks and edges"""
+
+        tmp_path = self.path + ".tmp"
+        with self._locked_log():
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for node in self.nodes.values():
+                    record = ["task", node.task_id, node.text, node.project_id, node.project_name, node.is_open, node.due_date]
+                    f.write(json.dumps(record, separators=(",", ":"), default=str) + "\n")
+                for task_id, waits_on in self.blockers.items():
+                    for blocker_id in waits_on:
+                        f.write(json.dumps(["edge", task_id, blocker_id], separators=(",", ":")) + "\n")
+            os.replace(tmp_path, self.path)
+
+        self._clear()
+        self.refresh()
+
+
+class DependencyGraphs:
+    """Dependency graphs by organization, loaded on first use"""
+
+    def __init__(self, directory: Optional[str] = settings.DEPENDENCY_GRAPH_PATH):
+        self.directory = directory
+        self.graphs: Dict[str, DependencyGraph] = {}
+        self._graphs_lock = threading.Lock()
+
+    def graph(self, organization_id: Optional[Any] = None) -> DependencyGraph:
+        key = str(organization_id) if organization_id else DEFAULT_ORGANIZATION
+        graph = self.graphs.get(key)
+        if graph is None:
+            with self._graphs_lock:
+                graph = self.graphs.get(key)
+                if graph is None:
+                    path = os.path.join(self.directory, key, GRAPH_FILENAME) if self.directory else None
+                    graph = self.graphs[key] = DependencyGraph(path)
+        return graph
+
+
+# Shared dependency graphs
+dependency_graphs = DependencyGraphs()
+
+
+# ============================================================================
+# ORM EVENTS
+# ============================================================================
+# Tasks already in a graph follow their ActionItem: edits update them,
+# deleting the item (or soft-deleting its meeting) drops them
+
+@event.listens_for(Session, "after_flush")
+def _collect_task_changes(session, flush_context):
+    """Snapshot flushed ActionItem changes; they reach the graphs only if the transaction commits"""
+
+    edited = [obj for obj in session.dirty if isinstance(obj, ActionItem)]
+    deleted = [obj for obj in session.deleted if isinstance(obj, ActionItem)]
+    meetings_deleted = {
+        obj.id: obj.organization_id
+        for obj in session.dirty
+        if isinstance(obj, Meeting) and obj.deleted_at is not None and inspect(obj).attrs.deleted_at.history.added
+    }
+    if not (edited or deleted or meetings_deleted):
+        return
+
+    organizations = deadline_indexes.meeting_organizations_for(
+        session, [obj.meeting_id for obj in edited + deleted]
+    )
+
+    changes = session.info.setdefault(_PENDING_CHANGES, [])
+    for obj in edited:
+        changes.append((organizations[str(obj.meeting_id)], str(obj.id), (
+            obj.description, is_open_status(obj.status), obj.due_date.isoformat() if obj.due_date else None
+        )))
+    for obj in deleted:
+        changes.append((organizations[str(obj.meeting_id)], str(obj.id), None))
+    if meetings_deleted:
+        rows = session.execute(
+            select(ActionItem.id, ActionItem.meeting_id).where(ActionItem.meeting_id.in_(meetings_deleted))
+        ).all()
+        for item_id, meeting_id in rows:
+            changes.append((meetings_deleted[meeting_id], str(item_id), None))
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_task_changes(session):
+    changes = session.info.pop(_PENDING_CHANGES, None)
+    if not changes:
+        return
+
+    for organization_id, task_id, fields in changes:
+        if organization_id is None:
+            continue
+        try:
+            graph = dependency_graphs.graph(organization_id)
+            if task_id not in graph:
+                continue
+            if fields is None:
+                graph.remove_task(task_id)
+            else:
+                graph.update_task(task_id, *fields)
+        except Exception as e:
+            logger.error(f"❌ Dependency graph update failed for task {task_id}: {e}")
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_task_changes(session):
+    session.info.pop(_PENDING_CHANGES, None)
@@ -0,0 +1,188 @@
+"""
+Shared Meeting Context
+One incremental pass over an organization's meetings feeds every proactive detector
+"""
+import bisect
+import os
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from ai.decision_index import DecisionConflictIndex
+from ai.meeting_index import DEFAULT_ORGANIZATION, RelatedMeetingIndex, meeting_key
+from ai.passage_index import passage_index
+from ai.vector_index import VectorPartition, vector_index
+from config import settings
+from deadline_index import DeadlineIndex
+
+
+@dataclass(frozen=True)
+class MeetingFeatureVector:
+    """What the detectors need from one meeting, extracted once"""
+    key: str
+    title: str
+    speakers: FrozenSet[str]
+    topics: FrozenSet[str]
+    attendees_present: FrozenSet[str]
+    action_count: int
+    decision_count: int
+    actions_start: int  # offset of the meeting's rows in MeetingContext.actions
+
+    @classmethod
+    def of(cls, meeting: Dict[str, Any], actions_start: int) -> "MeetingFeatureVector":
+        return cls(
+            key=meeting_key(meeting),
+            title=meeting.get("title", "Unknown"),
+            speakers=frozenset(s["name"] for s in meeting.get("speakers") or [] if s.get("name")),
+            topics=frozenset(meeting.get("topics") or []),
+            attendees_present=frozenset(
+                a["name"] for a in meeting.get("attendees") or [] if a.get("attended") and a.get("name")
+            ),
+            action_count=len(meeting.get("action_items") or []),
+            decision_count=len(meeting.get("decisions") or []),
+            actions_start=actions_start
+        )
+
+
+@dataclass
+class ActionRow:
+    meeting: int  # position in MeetingContext.meetings
+    action: Dict[str, Any]
+    due: Optional[datetime]
+
+
+@dataclass
+class DecisionRow:
+    meeting: int
+    text: str  # lowercased
+
+
+class MeetingContext:
+    """
+    Everything the proactive detectors derive from an organization's meeting
+    history, built in a single pass and kept up to date incrementally
+
+    - per-meeting feature vectors (speakers, topics, attendance, counts)
+    - flattened action item and decision tables
+    - running aggregates (topic counts and last mention, open due dates in
+      order)
+    - the related-meeting, decision-conflict and deadline indexes, and the
+      organization's passage search and semantic vector partitions
+
+    `update()` with the same history plus newly appended meetings only
+    processes the new ones; any other change to the history rebuilds.
+    Updates and detector reads run in worker threads and hold `lock`.
+    """
+
+    def __init__(self, organization_id: str = DEFAULT_ORGANIZATION):
+        self.organization_id = organization_id
+        self.lock = threading.Lock()
+        self.meeting_index = RelatedMeetingIndex(
+            os.path.join(settings.SEARCH_INDEX_PATH, organization_id) if settings.SEARCH_INDEX_PATH else None
+        )
+        self.passages = passage_index.partition(organization_id)
+        self.vectors: Optional[VectorPartition] = (
+            vector_index.partition(organization_id) if settings.VECTOR_SEARCH_ENABLED else None
+        )
+        self._reset()
+
+    def _reset(self):
+        self.meetings: List[Dict[str, Any]] = []
+        self.features: List[MeetingFeatureVector] = []
+        self.actions: List[ActionRow] = []
+        self.decisions: List[DecisionRow] = []
+
+        self.topic_counts: Counter = Counter()
+        self.topic_last_seen: Dict[str, int] = {}
+        self.open_dues: List[Tuple[datetime, int]] = []  # (due, action row) of dated, not completed items
+
+        self.decision_index = DecisionConflictIndex()
+        self.deadline_index = DeadlineIndex()
+        self._source: Optional[List[Dict[str, Any]]] = None
+
+    def __len__(self) -> int:
+        return len(self.meetings)
+
+    # ========================================================================
+    # UPDATES
+    # ========================================================================
+
+    def update(self, meetings: List[Dict[str, Any]]):
+        """Bring the context in line with `meetings` (oldest first)"""
+
+        known = len(self.meetings)
+        if meetings is self._source and len(meetings) >= known:
+            new_meetings = meetings[known:]
+        elif known and len(meetings) >= known and self._same_history(meetings):
+            new_meetings = meetings[known:]
+        else:
+            previous_keys = {features.key for features in self.features}
+            self._reset()
+            for meeting_id in previous_keys - {meeting_key(m) for m in meetings}:
+                self.meeting_index.remove_meeting(meeting_id)
+            new_meetings = meetings
+        self._source = meetings
+
+        for meeting in new_meetings:
+            self._add(meeting)
+
+        self.meeting_index.sync(new_meetings)
+        self.decision_index.sync(new_meetings)
+        self.deadline_index.sync_meetings(new_meetings)
+        self.passages.ensure_meetings(new_meetings)
+        if self.vectors is not None:
+            self.vectors.ensure_meetings(new_meetings)
+
+    def _same_history(self, meetings: List[Dict[str, Any]]) -> bool:
+        """Cheap check that `meetings` starts with the meetings already processed"""
+        last = len(self.meetings) - 1
+        return (
+            meeting_key(meetings[0]) == self.features[0].key
+            and meeting_key(meetings[last]) == self.features[last].key
+        )
+
+    def _add(self, meeting: Dict[str, Any]):
+        position = len(self.meetings)
+        features = MeetingFeatureVector.of(meeting, len(self.actions))
+
+        self.meetings.append(meeting)
+        self.features.append(features)
+
+        for action in meeting.get("action_items") or []:
+            due = datetime.fromisoformat(action["due_date"]) if action.get("due_date") else None
+            if due is not None and action.get("status") != "Completed":
+                bisect.insort(self.open_dues, (due, len(self.actions)))
+            self.actions.append(ActionRow(meeting=position, action=action, due=due))
+
+        for decision in meeting.get("decisions") or []:
+            self.decisions.append(DecisionRow(meeting=position, text=decision.lower()))
+
+        self.topic_counts.update(features.topics)
+        for topic in features.topics:
+            self.topic_last_seen[topic] = position
+
+    # ========================================================================
+    # QUERIES
+    # ========================================================================
+
+    def recent(self, count: int) -> List[MeetingFeatureVector]:
+        return self.features[-count:]
+
+    def recent_actions(self, meetings: int) -> List[ActionRow]:
+        """Action rows of the last `meetings` meetings"""
+        if not self.features:
+            return []
+        return self.actions[self.features[max(0, len(self.features) - meetings)].actions_start:]
+
+    def actions_due_between(self, start: datetime, end: datetime) -> List[ActionRow]:
+        """Open action rows with start < due <= end, soonest first"""
+        low = bisect.bisect_right(self.open_dues, (start, len(self.actions)))
+        high = bisect.bisect_right(self.open_dues, (end, len(self.actions)))
+        return [self.actions[row] for _, row in self.open_dues[low:high]]
+
+    def topics_not_seen_since(self, meetings: int) -> List[str]:
+        """Topics mentioned before, but not in the last `meetings` meetings"""
+        cutoff = len(self.features) - meetings
+        return [topic for topic, last in self.topic_last_seen.items() if last < cutoff]
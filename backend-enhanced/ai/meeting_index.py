@@ -0,0 +1,259 @@
+"""
+Related Meeting Index
+Inverted index from speakers, topics and project to meetings, persisted as a shared append-only log
+"""
+import json
+import logging
+import os
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from ai.shared_log import SharedLog
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# Relatedness weights and threshold
+SPEAKER_SCORE = 10
+TOPIC_SCORE = 15
+PROJECT_SCORE = 20
+SEMANTIC_SCORE = 40  # scaled by the cosine similarity of the meetings' discussions
+RELATED_THRESHOLD = 20
+
+INDEX_FILENAME = "related_meetings.jsonl"
+
+# Index partition for meetings without an organization
+DEFAULT_ORGANIZATION = "default"
+
+
+def meeting_key(meeting: Dict[str, Any]) -> str:
+    """Stable identifier for a meeting dict"""
+    if meeting.get("id") is not None:
+        return str(meeting["id"])
+    return f"{meeting.get('title', '')}|{meeting.get('meeting_date', '')}"
+
+
+@dataclass(frozen=True)
+class MeetingFeatures:
+    """What a meeting is indexed by"""
+    speakers: FrozenSet[str]
+    topics: FrozenSet[str]
+    project: Optional[str]
+
+    @classmethod
+    def of(cls, meeting: Dict[str, Any]) -> "MeetingFeatures":
+        return cls(
+            speakers=frozenset(s["name"] for s in meeting.get("speakers") or [] if s.get("name")),
+            topics=frozenset(meeting.get("topics") or []),
+            project=meeting.get("project_category") or None
+        )
+
+    def terms(self) -> Iterable[Tuple[str, str]]:
+        for speaker in self.speakers:
+            yield "speaker", speaker
+        for topic in self.topics:
+            yield "topic", topic
+        if self.project:
+            yield "project", self.project
+
+
+def _record(meeting_id: str, features: MeetingFeatures) -> list:
+    """Log line: [id, speakers, topics, project]; [id, null] removes the meeting"""
+    return [meeting_id, sorted(features.speakers), sorted(features.topics), features.project]
+
+
+@dataclass
+class RelatedCandidate:
+    meeting_id: str
+    score: int
+    shared_speakers: List[str]
+    shared_topics: List[str]
+    same_project: bool
+
+
+class RelatedMeetingIndex(SharedLog):
+    """
+    Posting lists (speaker / topic / project -> meeting ids) plus each
+    meeting's precomputed feature sets
+
+    Finding related meetings only visits meetings that share at least one
+    posting list with the query; scores accumulate per posting, so nothing
+    is rebuilt per comparison. Meetings are added incrementally; each add is
+    one line appended to a shared log (see SharedLog), so lines appended by
+    other processes are applied before each query. The log is compacted on
+    load if mostly superseded.
+    """
+
+    def __init__(self, directory: Optional[str] = settings.SEARCH_INDEX_PATH):
+        super().__init__(os.path.join(directory, INDEX_FILENAME) if directory else None)
+        self.meetings: Dict[str, Dict[str, Any]] = {}  # meeting dicts by id (this process only)
+        self._synced_list: Optional[List[Dict[str, Any]]] = None
+        self._synced_count = 0
+        self._clear()
+
+        if self.path and os.path.exists(self.path):
+            self.refresh()
+            if self._log_lines > 2 * len(self.features) + 1000:
+                self._compact()
+            logger.info(f"📇 Related-meeting index loaded: {len(self.features)} meetings")
+
+    def _clear(self):
+        self.features: Dict[str, MeetingFeatures] = {}
+        self.postings: Dict[Tuple[str, str], Set[str]] = defaultdict(set)
+        self.order: Dict[str, int] = {}  # insertion order, for stable tie-breaking
+        self._reset_log()
+
+    def __len__(self) -> int:
+        return len(self.features)
+
+    def __contains__(self, meeting_id: str) -> bool:
+        return meeting_id in self.features
+
+    # ========================================================================
+    # UPDATES
+    # ========================================================================
+
+    def add_meeting(self, meeting: Dict[str, Any]) -> str:
+        """Index (or re-index) a meeting; returns its id"""
+
+        self.refresh()
+        records: List[list] = []
+        with self._lock:
+            meeting_id = self._add(meeting, records)
+        if records:
+            self._write(records)
+        return meeting_id
+
+    def sync(self, meetings: List[Dict[str, Any]]):
+        """
+        Add any meetings not indexed yet and refresh the in-memory meeting dicts
+
+        Syncing the same (append-only) list again only visits the meetings
+        appended since the previous call.
+        """
+
+        if meetings is self._synced_list and len(meetings) >= self._synced_count:
+            new_meetings = meetings[self._synced_count:]
+        else:
+            new_meetings = meetings
+        self._synced_list, self._synced_count = meetings, len(meetings)
+
+        self.refresh()
+        records: List[list] = []
+        with self._lock:
+            for meeting in new_meetings:
+                meeting_id = meeting_key(meeting)
+                if meeting_id in self.features:
+                    self.meetings[meeting_id] = meeting
+                else:
+                    self._add(meeting, records)
+        if records:
+            self._write(records)
+
+    def remove_meeting(self, meeting_id: str):
+        self.refresh()
+        with self._lock:
+            self.meetings.pop(meeting_id, None)
+            if meeting_id not in self.features:
+                return
+        self._write([[meeting_id, None]])
+
+    def _add(self, meeting: Dict[str, Any], records: List[list]) -> str:
+        """Remember the meeting dict and queue a log record if its features changed (caller holds the lock)"""
+
+        meeting_id = meeting_key(meeting)
+        self.meetings[meeting_id] = meeting
+
+        features = MeetingFeatures.of(meeting)
+        if self.features.get(meeting_id) != features:
+            records.append(_record(meeting_id, features))
+        return meeting_id
+
+    def _apply(self, record: list):
+        if record[1] is None:
+            self._index(record[0], None)
+        else:
+            meeting_id, speakers, topics, project = record
+            self._index(meeting_id, MeetingFeatures(frozenset(speakers), frozenset(topics), project))
+
+    def _index(self, meeting_id: str, features: Optional[MeetingFeatures]):
+        previous = self.features.pop(meeting_id, None)
+        if previous is not None:
+            for term in previous.terms():
+                self.postings[term].discard(meeting_id)
+
+        if features is None:
+            self.order.pop(meeting_id, None)
+            return
+
+        self.features[meeting_id] = features
+        self.order.setdefault(meeting_id, len(self.order))
+        for term in features.terms():
+            self.postings[term].add(meeting_id)
+
+    # ========================================================================
+    # QUERIES
+    # ========================================================================
+
+    def candidates(self, meeting: Dict[str, Any], threshold: int = 0) -> List[RelatedCandidate]:
+        """Meetings sharing any speaker, topic or project with `meeting`, best first"""
+
+        self.refresh()
+
+        with self._lock:
+            exclude = meeting_key(meeting)
+            features = MeetingFeatures.of(meeting)
+
+            scores: Dict[str, int] = defaultdict(int)
+            speakers: Dict[str, List[str]] = defaultdict(list)
+            topics: Dict[str, List[str]] = defaultdict(list)
+            same_project: Set[str] = set()
+
+            for speaker in features.speakers:
+                for other in self.postings.get(("speaker", speaker), ()):
+                    scores[other] += SPEAKER_SCORE
+                    speakers[other].append(speaker)
+            for topic in features.topics:
+                for other in self.postings.get(("topic", topic), ()):
+                    scores[other] += TOPIC_SCORE
+                    topics[other].append(topic)
+            if features.project:
+                for other in self.postings.get(("project", features.project), ()):
+                    scores[other] += PROJECT_SCORE
+                    same_project.add(other)
+
+            scores.pop(exclude, None)
+
+            ranked = sorted(
+                (meeting_id for meeting_id, score in scores.items() if score >= threshold),
+                key=lambda meeting_id: (-scores[meeting_id], self.order[meeting_id])
+            )
+            return [
+                RelatedCandidate(
+                    meeting_id=meeting_id,
+                    score=scores[meeting_id],
+                    shared_speakers=sorted(speakers.get(meeting_id, [])),
+                    shared_topics=sorted(topics.get(meeting_id, [])),
+                    same_project=meeting_id in same_project
+                )
+                for meeting_id in ranked
+            ]
+
+    # ========================================================================
+    # PERSISTENCE
+    # ========================================================================
+
+    def _compact(self):
+        """Rewrite the log with one line per live meeting"""
+
+        tmp_path = self.path + ".tmp"
+        with self._locked_log():
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for meeting_id in sorted(self.features, key=self.order.__getitem__):
+                    record = _record(meeting_id, self.features[meeting_id])
+                    f.write(json.dumps(record, separators=(",", ":")) + "\n")
+            os.replace(tmp_path, self.path)
+
+        self._clear()
+        self.refresh()
@@ -0,0 +1,375 @@
+"""
+Meeting Passage Search
+BM25 over transcript passages, decisions and action items, one on-disk partition per organization
+"""
+import json
+import logging
+import math
+import os
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+
+import numpy as np
+
+from ai.meeting_index import DEFAULT_ORGANIZATION, meeting_key
+from ai.shared_log import SharedLog
+from config import settings
+from text_embedding import tokenize
+
+logger = logging.getLogger(__name__)
+
+PASSAGES_FILENAME = "passages.jsonl"
+
+# Okapi BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+PASSAGE_KINDS = ("transcript", "decision", "action_item", "summary")
+_KIND_CODES = {kind: code for code, kind in enumerate(PASSAGE_KINDS)}
+
+
+@dataclass
+class Passage:
+    meeting_id: str
+    kind: str  # one of PASSAGE_KINDS
+    text: str
+    meta: Dict[str, Any]  # meeting title/date, speaker and start time, assignee and due date
+
+
+@dataclass
+class PassageHit:
+    passage: Passage
+    score: float
+
+
+# ============================================================================
+# MEETING -> PASSAGES
+# ============================================================================
+
+def _decision_text(decision: Any) -> str:
+    if isinstance(decision, dict):
+        return str(decision.get("decision") or decision.get("text") or decision.get("description") or "")
+    return str(decision or "")
+
+
+def meeting_passages(meeting: Dict[str, Any], passage_words: int = settings.SEARCH_PASSAGE_WORDS) -> List[Passage]:
+    """
+    Searchable passages of a meeting dict
+
+    Consecutive transcript segments are grouped into passages of about
+    `passage_words` words, each line prefixed with its speaker; every
+    decision and action item is a passage of its own, as is the summary.
+    """
+
+    meeting_id = meeting_key(meeting)
+    base = {
+        "title": meeting.get("title") or meeting.get("project_name") or "Untitled meeting",
+        "date": str(meeting["meeting_date"]) if meeting.get("meeting_date") else None
+    }
+    passages: List[Passage] = []
+
+    lines: List[str] = []
+    words = 0
+    start = None
+
+    def flush():
+        nonlocal lines, words, start
+        if lines:
+            passages.append(Passage(meeting_id, "transcript", "\n".join(lines), {**base, "start_time": start}))
+        lines, words, start = [], 0, None
+
+    for segment in meeting.get("transcript_segments") or []:
+        text = (segment.get("text") or "").strip()
+        if not text:
+            continue
+        if not lines:
+            start = segment.get("start", segment.get("start_time", segment.get("timestamp")))
+        speaker = segment.get("speaker", segment.get("speaker_id"))
+        lines.append(f"{speaker}: {text}" if speaker else text)
+        words += len(text.split())
+        if words >= passage_words:
+            flush()
+    flush()
+
+    # Plain-text transcripts (no segments): fixed-size word windows
+    if not meeting.get("transcript_segments") and meeting.get("transcript"):
+        transcript_words = meeting["transcript"].split()
+        for offset in range(0, len(transcript_words), passage_words):
+            text = " ".join(transcript_words[offset:offset + passage_words])
+            passages.append(Passage(meeting_id, "transcript", text, dict(base)))
+
+    summary = (meeting.get("summary") or "").strip()
+    if summary:
+        passages.append(Passage(meeting_id, "summary", summary, dict(base)))
+
+    for decision in meeting.get("decisions") or []:
+        text = _decision_text(decision).strip()
+        if text:
+            passages.append(Passage(meeting_id, "decision", text, dict(base)))
+
+    for action in meeting.get("action_items") or []:
+        task = (action.get("task") or action.get("description") or "").strip()
+        if task:
+            passages.append(Passage(meeting_id, "action_item", task, {
+                **base,
+                "assignee": action.get("assignee") or action.get("assignee_email"),
+                "due_date": str(action["due_date"]) if action.get("due_date") else None
+            }))
+
+    return passages
+
+
+def meeting_document(meeting: Any, action_items: Iterable[Any]) -> Dict[str, Any]:
+    """Meeting dict for the passage index from a Meeting row and its ActionItem rows"""
+    return {
+        "id": str(meeting.id),
+        "title": meeting.project_name,
+        "meeting_date": meeting.meeting_date.isoformat() if meeting.meeting_date else None,
+        "transcript": meeting.transcript,
+        "transcript_segments": meeting.transcript_segments or [],
+        "summary": meeting.ai_summary,
+        "decisions": meeting.decisions or [],
+        "action_items": [
+            {
+                "task": item.description,
+                "assignee": item.assignee_email,
+                "due_date": item.due_date.isoformat() if item.due_date else None
+            }
+            for item in action_items
+        ]
+    }
+
+
+# ============================================================================
+# INDEX
+# ============================================================================
+
+def _grown(array: np.ndarray, size: int) -> np.ndarray:
+    """`array` with room for at least `size` entries (capacity doubles)"""
+    if size <= len(array):
+        return array
+    grown = np.zeros(max(size, 2 * len(array)), dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+
+class _Postings:
+    """One term's posting list: parallel doc id / term frequency arrays"""
+    __slots__ = ("docs", "tfs", "size")
+
+    def __init__(self):
+        self.docs = np.zeros(4, dtype=np.int32)
+        self.tfs = np.zeros(4, dtype=np.float32)
+        self.size = 0
+
+    def append(self, doc: int, tf: int):
+        self.docs = _grown(self.docs, self.size + 1)
+        self.tfs = _grown(self.tfs, self.size + 1)
+        self.docs[self.size] = doc
+        self.tfs[self.size] = tf
+        self.size += 1
+
+
+class PassagePartition(SharedLog):
+    """
+    BM25 index of one organization's passages
+
+    Postings are numpy arrays per term, so a query is a handful of vectorized
+    score accumulations plus a partial sort. Removing a meeting (re-indexing
+    replaces it) only marks its passages dead; dead postings disappear when
+    the log is compacted.
+
+    The partition is persisted as a shared append-only log (see SharedLog);
+    lines appended by other processes are applied before each search. A
+    meeting's log entries start with a removal record, so replaying them is
+    idempotent.
+    """
+
+    def __init__(self, path: Optional[str], passage_words: int = settings.SEARCH_PASSAGE_WORDS):
+        super().__init__(path)
+        self.passage_words = passage_words
+        self._clear()
+
+        if self.path and os.path.exists(self.path):
+            self.refresh()
+            if self._log_lines > 2 * self.live_count + 1000:
+                self._compact()
+            logger.info(f"🔎 Passage index loaded from {self.path}: {self.live_count} passages")
+
+    def _clear(self):
+        self.passages: List[Optional[Passage]] = []
+        self.postings: Dict[str, _Postings] = {}
+        self.by_meeting: Dict[str, List[int]] = {}
+        self.live_count = 0
+        self.total_length = 0.0
+
+        self._lengths = np.zeros(1024, dtype=np.float32)
+        self._alive = np.zeros(1024, dtype=bool)
+        self._kinds = np.zeros(1024, dtype=np.int8)
+
+        self._reset_log()
+
+    def __len__(self) -> int:
+        return self.live_count
+
+    def __contains__(self, meeting_id: str) -> bool:
+        return meeting_id in self.by_meeting
+
+    # ========================================================================
+    # UPDATES
+    # ========================================================================
+
+    def index_meeting(self, meeting: Dict[str, Any]):
+        """(Re-)index a meeting dict"""
+        self.index_meetings([meeting])
+
+    def index_meetings(self, meetings: Sequence[Dict[str, Any]]):
+        records: List[list] = []
+        for meeting in meetings:
+            records.append([meeting_key(meeting), None])
+            for passage in meeting_passages(meeting, self.passage_words):
+                records.append([passage.meeting_id, passage.kind, passage.text, passage.meta])
+        self._write(records)
+
+    def ensure_meetings(self, meetings: Sequence[Dict[str, Any]]):
+        """Index the meetings that are not indexed yet (already indexed ones are kept as they are)"""
+        self.refresh()
+        missing = [meeting for meeting in meetings if meeting_key(meeting) not in self.by_meeting]
+        if missing:
+            self.index_meetings(missing)
+
+    def remove_meeting(self, meeting_id: str):
+        self._write([[str(meeting_id), None]])
+
+    def _apply(self, record: list):
+        if record[1] is None:
+            self._remove(record[0])
+        else:
+            meeting_id, kind, text, meta = record
+            self._add(Passage(meeting_id, kind, text, meta))
+
+    def _add(self, passage: Passage):
+        doc = len(self.passages)
+        tokens = tokenize(passage.text)
+
+        self.passages.append(passage)
+        self.by_meeting.setdefault(passage.meeting_id, []).append(doc)
+        for term, tf in Counter(tokens).items():
+            postings = self.postings.get(term)
+            if postings is None:
+                postings = self.postings[term] = _Postings()
+            postings.append(doc, tf)
+
+        self._lengths = _grown(self._lengths, doc + 1)
+        self._alive = _grown(self._alive, doc + 1)
+        self._kinds = _grown(self._kinds, doc + 1)
+        self._lengths[doc] = len(tokens)
+        self._alive[doc] = True
+        self._kinds[doc] = _KIND_CODES.get(passage.kind, 0)
+
+        self.live_count += 1
+        self.total_length += len(tokens)
+
+    def _remove(self, meeting_id: str):
+        for doc in self.by_meeting.pop(meeting_id, []):
+            self.passages[doc] = None
+            self._alive[doc] = False
+            self.live_count -= 1
+            self.total_length -= float(self._lengths[doc])
+
+    # ========================================================================
+    # QUERIES
+    # ========================================================================
+
+    def search(
+        self,
+        query: str,
+        k: int = settings.SEARCH_ANSWER_PASSAGES,
+        kinds: Optional[Sequence[str]] = None
+    ) -> List[PassageHit]:
+        """Top-k passages by BM25, best first"""
+
+        self.refresh()
+        with self._lock:
+            return self._search(set(tokenize(query)), k, kinds)
+
+    def _search(self, terms: Set[str], k: int, kinds: Optional[Sequence[str]]) -> List[PassageHit]:
+        if not terms or not self.live_count:
+            return []
+
+        count = len(self.passages)
+        lengths = self._lengths[:count]
+        average_length = self.total_length / self.live_count or 1.0
+        scores = np.zeros(count, dtype=np.float32)
+
+        for term in terms:
+            postings = self.postings.get(term)
+            if postings is None:
+                continue
+            docs, tfs = postings.docs[:postings.size], postings.tfs[:postings.size]
+
+            # Document frequency counts dead postings too until the log is compacted
+            df = min(postings.size, self.live_count)
+            idf = math.log(1.0 + (self.live_count - df + 0.5) / (df + 0.5))
+            norm = BM25_K1 * (1.0 - BM25_B + BM25_B * lengths[docs] / average_length)
+            scores[docs] += idf * tfs * (BM25_K1 + 1.0) / (tfs + norm)
+
+        mask = self._alive[:count]
+        if kinds:
+            mask = mask & np.isin(self._kinds[:count], [_KIND_CODES[kind] for kind in kinds])
+        scores[~mask] = 0.0
+
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k)[:k]]
+        ranked = sorted(candidates.tolist(), key=lambda doc: (-scores[doc], doc))
+
+        return [PassageHit(passage=self.passages[doc], score=float(scores[doc])) for doc in ranked]
+
+    # ========================================================================
+    # PERSISTENCE
+    # ========================================================================
+
+    def _compact(self):
+        """Rewrite the log with only the live passages"""
+
+        tmp_path = self.path + ".tmp"
+        with self._locked_log():
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for meeting_id, docs in self.by_meeting.items():
+                    f.write(json.dumps([meeting_id, None], separators=(",", ":")) + "\n")
+                    for doc in docs:
+                        passage = self.passages[doc]
+                        record = [passage.meeting_id, passage.kind, passage.text, passage.meta]
+                        f.write(json.dumps(record, separators=(",", ":"), default=str) + "\n")
+            os.replace(tmp_path, self.path)
+
+        # Rebuild without the dead postings
+        self._clear()
+        self.refresh()
+
+
+class PassageIndex:
+    """Passage partitions by organization, loaded on first use"""
+
+    def __init__(self, directory: Optional[str] = settings.SEARCH_INDEX_PATH):
+        self.directory = directory
+        self.partitions: Dict[str, PassagePartition] = {}
+        self._partitions_lock = threading.Lock()
+
+    def partition(self, organization_id: Optional[Any] = None) -> PassagePartition:
+        key = str(organization_id) if organization_id else DEFAULT_ORGANIZATION
+        partition = self.partitions.get(key)
+        if partition is None:
+            with self._partitions_lock:
+                partition = self.partitions.get(key)
+                if partition is None:
+                    path = os.path.join(self.directory, key, PASSAGES_FILENAME) if self.directory else None
+                    partition = self.partitions[key] = PassagePartition(path)
+        return partition
+
+
+# Shared passage index
+passage_index = PassageIndex()
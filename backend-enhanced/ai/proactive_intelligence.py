@@ -6,7 +6,17 @@ import asyncio
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Any
 from collections import defaultdict
+import logging
 import re
+import threading
+
+from ai.meeting_context import MeetingContext, DEFAULT_ORGANIZATION
+from ai.meeting_index import RELATED_THRESHOLD, SEMANTIC_SCORE, RelatedCandidate, meeting_key
+from ai.passage_index import Passage, PassageHit
+from ai_multi_model import orchestrator, ModelType
+from config import settings
+
+logger = logging.getLogger(__name__)
 
 class ProactiveIntelligence:
     """
@@ -27,106 +37,109 @@ class ProactiveIntelligence:
         self.relationship_graph = {}  # Who works with whom
         self.topic_trends = defaultdict(int)
         self.action_completion_rates = {}
+        self.contexts: Dict[str, MeetingContext] = {}  # per organization
+        self._contexts_lock = threading.Lock()
+
+    def context_for(self, organization_id: Optional[str] = None) -> MeetingContext:
+        """The organization's cached meeting context"""
+
+        key = str(organization_id) if organization_id else DEFAULT_ORGANIZATION
+        with self._contexts_lock:
+            context = self.contexts.get(key)
+            if context is None:
+                context = self.contexts[key] = MeetingContext(key)
+        return context
 
     async def analyze_meeting_with_context(
         self,
         new_meeting: Dict[str, Any],
-        all_meetings: List[Dict[str, Any]]
+        all_meetings: List[Dict[str, Any]],
+        organization_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Analyze a meeting with full context of all previous meetings.
         Provides intelligent insights that consider patterns and history.
-        """
-
-        insights = {
-            "smart_suggestions": [],
-            "detected_risks": [],
-            "follow_up_recommendations": [],
-            "related_meetings": [],
-            "pattern_insights": [],
-            "proactive_alerts": [],
-            "questions_answered": []
-        }
-
-        # 1. Find related meetings automatically
-        insights["related_meetings"] = await self._find_related_meetings(
-            new_meeting, all_meetings
-        )
-
-        # 2. Detect if this is a follow-up to a previous meeting
-        insights["follow_up_recommendations"] = await self._detect_follow_ups(
-            new_meeting, all_meetings
-        )
-
-        # 3. Identify risks and conflicts
-        insights["detected_risks"] = await self._detect_risks(
-            new_meeting, all_meetings
-        )
-
-        # 4. Predict what the user will need next
-        insights["smart_suggestions"] = await self._predict_next_actions(
-            new_meeting, all_meetings
-        )
 
-        # 5. Analyze patterns across all meetings
-        insights["pattern_insights"] = await self._analyze_patterns(
-            new_meeting, all_meetings
-        )
+        Meeting features are extracted once into the organization's shared
+        context (only meetings new since the last call are processed) and the
+        detectors all read from it. None of this waits on I/O, so the update
+        and the detectors run together in a worker thread, off the event loop.
+        """
 
-        # 6. Generate proactive alerts
-        insights["proactive_alerts"] = await self._generate_alerts(
-            new_meeting, all_meetings
-        )
+        return await asyncio.to_thread(self._analyze, new_meeting, all_meetings, organization_id)
 
-        return insights
+    def _analyze(
+        self,
+        new_meeting: Dict[str, Any],
+        all_meetings: List[Dict[str, Any]],
+        organization_id: Optional[str]
+    ) -> Dict[str, Any]:
+        context = self.context_for(organization_id)
+        with context.lock:
+            context.update(all_meetings)
+
+            return {
+                "smart_suggestions": self._predict_next_actions(new_meeting, context),
+                "detected_risks": self._detect_risks(new_meeting, context),
+                "follow_up_recommendations": self._detect_follow_ups(new_meeting, context),
+                "related_meetings": self._find_related_meetings(new_meeting, context),
+                "pattern_insights": self._analyze_patterns(new_meeting, context),
+                "proactive_alerts": self._generate_alerts(new_meeting, context),
+                "questions_answered": []
+            }
 
-    async def _find_related_meetings(
+    def _find_related_meetings(
         self,
         current: Dict[str, Any],
-        all_meetings: List[Dict[str, Any]]
+        context: MeetingContext
     ) -> List[Dict[str, Any]]:
         """
         Automatically find meetings related to this one.
-        Uses: speakers, topics, projects, action item references
+        Uses: speakers, topics, projects, semantic similarity, action item references
         """
 
-        related = []
-        current_speakers = set(s["name"] for s in current.get("speakers", []))
-        current_topics = set(current.get("topics", []))
+        # Only score meetings that share a speaker, topic or project with this
+        # one, or whose discussions are semantically close
+        context.meeting_index.add_meeting(current)
+        candidates = context.meeting_index.candidates(current)
+
+        similarity: Dict[str, float] = {}
+        if context.vectors is not None:
+            context.vectors.ensure_meetings([current])
+            for similar in context.vectors.similar_meetings(meeting_key(current), k=10):
+                if similar.score >= settings.VECTOR_MIN_SIMILARITY:
+                    similarity[similar.meeting_id] = similar.score
+            known = {candidate.meeting_id for candidate in candidates}
+            candidates.extend(
+                RelatedCandidate(meeting_id, 0, [], [], False)
+                for meeting_id in similarity if meeting_id not in known
+            )
 
-        for meeting in all_meetings:
-            if meeting == current:
-                continue
+        related = []
+        for candidate in candidates:
+            meeting = context.meeting_index.meetings.get(candidate.meeting_id)
+            if meeting is None:
+                continue  # only known from the persisted index
 
-            # Calculate similarity score
-            score = 0
+            score = candidate.score
             reasons = []
 
-            # Same speakers
-            meeting_speakers = set(s["name"] for s in meeting.get("speakers", []))
-            common_speakers = current_speakers & meeting_speakers
-            if common_speakers:
-                score += len(common_speakers) * 10
-                reasons.append(f"Shared attendees: {', '.join(common_speakers)}")
-
-            # Same topics
-            meeting_topics = set(meeting.get("topics", []))
-            common_topics = current_topics & meeting_topics
-            if common_topics:
-                score += len(common_topics) * 15
-                reasons.append(f"Related topics: {', '.join(common_topics)}")
-
-            # Same project
-            if current.get("project_category") == meeting.get("project_category"):
-                score += 20
+            if candidate.shared_speakers:
+                reasons.append(f"Shared attendees: {', '.join(candidate.shared_speakers)}")
+            if candidate.shared_topics:
+                reasons.append(f"Related topics: {', '.join(candidate.shared_topics)}")
+            if candidate.same_project:
                 reasons.append("Same project")
+            if candidate.meeting_id in similarity:
+                score += round(SEMANTIC_SCORE * similarity[candidate.meeting_id])
+                reasons.append(f"Similar discussion ({similarity[candidate.meeting_id]:.0%} match)")
 
             # Referenced in action items
             if self._is_referenced_in_actions(current, meeting):
                 score += 30
                 reasons.append("Referenced in action items")
 
-            if score >= 20:  # Threshold for relatedness
+            if score >= RELATED_THRESHOLD:  # Threshold for relatedness
                 related.append({
                     "meeting": meeting,
                     "score": score,
@@ -137,10 +150,10 @@ class ProactiveIntelligence:
         related.sort(key=lambda x: x["score"], reverse=True)
         return related[:5]  # Top 5 most related
 
-    async def _detect_follow_ups(
+    def _detect_follow_ups(
         self,
         current: Dict[str, Any],
-        all_meetings: List[Dict[str, Any]]
+        context: MeetingContext
     ) -> List[Dict[str, Any]]:
         """
         Detect if action items from previous meetings were addressed.
@@ -150,40 +163,43 @@ class ProactiveIntelligence:
         recommendations = []
 
         # Look through recent meetings for incomplete action items
-        for meeting in all_meetings[-10:]:  # Last 10 meetings
-            if meeting == current:
+        current_key = meeting_key(current)
+        for row in context.recent_actions(10):  # Last 10 meetings
+            meeting = context.meetings[row.meeting]
+            if meeting_key(meeting) == current_key:
                 continue
 
-            for old_action in meeting.get("action_items", []):
-                # Check if this action was mentioned/completed in current meeting
-                completion_status = self._check_action_completion(
-                    old_action,
-                    current
-                )
-
-                if completion_status == "overdue":
-                    recommendations.append({
-                        "type": "overdue_action",
-                        "priority": "high",
-                        "message": f"Overdue: {old_action['task']}",
-                        "original_meeting": meeting["title"],
-                        "assignee": old_action.get("assignee"),
-                        "days_overdue": self._days_overdue(old_action)
-                    })
-                elif completion_status == "mentioned":
-                    recommendations.append({
-                        "type": "progress_update",
-                        "priority": "medium",
-                        "message": f"Progress mentioned: {old_action['task']}",
-                        "original_meeting": meeting["title"]
-                    })
+            old_action = row.action
+
+            # Check if this action was mentioned/completed in current meeting
+            completion_status = self._check_action_completion(
+                old_action,
+                current
+            )
+
+            if completion_status == "overdue":
+                recommendations.append({
+                    "type": "overdue_action",
+                    "priority": "high",
+                    "message": f"Overdue: {old_action['task']}",
+                    "original_meeting": meeting["title"],
+                    "assignee": old_action.get("assignee"),
+                    "days_overdue": self._days_overdue(old_action)
+                })
+            elif completion_status == "mentioned":
+                recommendations.append({
+                    "type": "progress_update",
+                    "priority": "medium",
+                    "message": f"Progress mentioned: {old_action['task']}",
+                    "original_meeting": meeting["title"]
+                })
 
         return recommendations
 
-    async def _detect_risks(
+    def _detect_risks(
         self,
         current: Dict[str, Any],
-        all_meetings: List[Dict[str, Any]]
+        context: MeetingContext
     ) -> List[Dict[str, Any]]:
         """
         Proactively detect risks and potential issues.
@@ -192,11 +208,11 @@ class ProactiveIntelligence:
         risks = []
 
         # 1. Deadline conflicts
-        deadline_risks = self._detect_deadline_conflicts(current, all_meetings)
+        deadline_risks = self._detect_deadline_conflicts(current, context)
         risks.extend(deadline_risks)
 
         # 2. Scope creep detection
-        if self._detect_scope_creep(current, all_meetings):
+        if self._detect_scope_creep(current, context):
             risks.append({
                 "type": "scope_creep",
                 "severity": "medium",
@@ -205,7 +221,7 @@ class ProactiveIntelligence:
             })
 
         # 3. Resource overload
-        overloaded = self._detect_resource_overload(current, all_meetings)
+        overloaded = self._detect_resource_overload(current, context)
         if overloaded:
             for person in overloaded:
                 risks.append({
@@ -216,7 +232,7 @@ class ProactiveIntelligence:
                 })
 
         # 4. Communication gaps
-        if self._detect_communication_gaps(current, all_meetings):
+        if self._detect_communication_gaps(current, context):
             risks.append({
                 "type": "communication_gap",
                 "severity": "medium",
@@ -225,15 +241,15 @@ class ProactiveIntelligence:
             })
 
         # 5. Decision conflicts
-        conflicts = self._detect_decision_conflicts(current, all_meetings)
+        conflicts = self._detect_decision_conflicts(current, context)
         risks.extend(conflicts)
 
         return risks
 
-    async def _predict_next_actions(
+    def _predict_next_actions(
         self,
         current: Dict[str, Any],
-        all_meetings: List[Dict[str, Any]]
+        context: MeetingContext
     ) -> List[Dict[str, Any]]:
         """
         Predict what the user will likely need to do next.
@@ -253,12 +269,12 @@ class ProactiveIntelligence:
             })
 
         # 2. Suggest scheduling follow-up
-        if self._should_schedule_followup(current, all_meetings):
+        if self._should_schedule_followup(current, context):
             suggestions.append({
                 "type": "schedule_meeting",
                 "priority": "medium",
                 "title": "Schedule follow-up meeting",
-                "suggested_date": self._predict_followup_date(current, all_meetings),
+                "suggested_date": self._predict_followup_date(current, context),
                 "suggested_attendees": [s["name"] for s in current.get("speakers", [])],
                 "confidence": 0.78
             })
@@ -274,21 +290,21 @@ class ProactiveIntelligence:
             })
 
         # 4. Suggest status report
-        if self._time_for_status_report(all_meetings):
+        if self._time_for_status_report(context):
             suggestions.append({
                 "type": "status_report",
                 "priority": "high",
                 "title": "Generate weekly status report",
-                "auto_draft": self._generate_status_report(all_meetings),
+                "auto_draft": self._generate_status_report(context),
                 "confidence": 0.90
             })
 
         return suggestions
 
-    async def _analyze_patterns(
+    def _analyze_patterns(
         self,
         current: Dict[str, Any],
-        all_meetings: List[Dict[str, Any]]
+        context: MeetingContext
     ) -> List[Dict[str, Any]]:
         """
         Detect patterns across all meetings to provide deep insights.
@@ -297,12 +313,12 @@ class ProactiveIntelligence:
         patterns = []
 
         # 1. Meeting frequency analysis
-        freq_pattern = self._analyze_meeting_frequency(all_meetings)
+        freq_pattern = self._analyze_meeting_frequency(context)
         if freq_pattern:
             patterns.append(freq_pattern)
 
         # 2. Topic trend analysis
-        trending_topics = self._analyze_topic_trends(all_meetings)
+        trending_topics = self._analyze_topic_trends(context)
         patterns.append({
             "type": "topic_trends",
             "trending_up": trending_topics["up"],
@@ -311,7 +327,7 @@ class ProactiveIntelligence:
         })
 
         # 3. Action item completion rate
-        completion_rate = self._calculate_completion_rate(all_meetings)
+        completion_rate = self._calculate_completion_rate(context)
         patterns.append({
             "type": "completion_rate",
             "rate": completion_rate,
@@ -320,23 +336,23 @@ class ProactiveIntelligence:
         })
 
         # 4. Meeting effectiveness score
-        effectiveness = self._calculate_meeting_effectiveness(all_meetings)
+        effectiveness = self._calculate_meeting_effectiveness(context)
         patterns.append({
             "type": "effectiveness",
             "score": effectiveness,
             "factors": {
-                "action_items_per_meeting": self._avg_action_items(all_meetings),
-                "decisions_per_meeting": self._avg_decisions(all_meetings),
+                "action_items_per_meeting": self._avg_action_items(context),
+                "decisions_per_meeting": self._avg_decisions(context),
                 "follow_through_rate": completion_rate
             }
         })
 
         return patterns
 
-    async def _generate_alerts(
+    def _generate_alerts(
         self,
         current: Dict[str, Any],
-        all_meetings: List[Dict[str, Any]]
+        context: MeetingContext
     ) -> List[Dict[str, Any]]:
         """
         Generate proactive alerts that help the user stay on top of things.
@@ -345,7 +361,7 @@ class ProactiveIntelligence:
         alerts = []
 
         # 1. Upcoming deadlines
-        upcoming = self._get_upcoming_deadlines(all_meetings)
+        upcoming = self._get_upcoming_deadlines(context)
         if upcoming:
             alerts.append({
                 "type": "deadline_reminder",
@@ -355,7 +371,7 @@ class ProactiveIntelligence:
             })
 
         # 2. Missing updates
-        missing = self._detect_missing_updates(all_meetings)
+        missing = self._detect_missing_updates(context)
         if missing:
             alerts.append({
                 "type": "missing_update",
@@ -365,7 +381,7 @@ class ProactiveIntelligence:
             })
 
         # 3. Unexpected sentiment change
-        sentiment_change = self._detect_sentiment_shift(all_meetings)
+        sentiment_change = self._detect_sentiment_shift(context)
         if sentiment_change:
             alerts.append({
                 "type": "sentiment_alert",
@@ -379,7 +395,8 @@ class ProactiveIntelligence:
     async def answer_question(
         self,
         question: str,
-        all_meetings: List[Dict[str, Any]]
+        all_meetings: List[Dict[str, Any]],
+        organization_id: Optional[str] = None
     ) -> str:
         """
         Answer natural language questions about meetings using AI.
@@ -389,34 +406,62 @@ class ProactiveIntelligence:
         - "When is the infrastructure deployment due?"
         - "Who's working on the authentication feature?"
         - "What were the key decisions from last week?"
+
+        The organization's BM25 passage index (transcript passages, decisions,
+        action items) supplies the top passages; one LLM call answers from
+        those passages only.
         """
 
-        # TODO: Implement with LLM that has access to meeting context
-        # For now, simple pattern matching
+        hits = await asyncio.to_thread(self._search_passages, question, all_meetings, organization_id)
 
-        question_lower = question.lower()
+        if not hits:
+            return "I can help you find information from your meetings. Try asking about specific people, tasks, or decisions."
 
-        # Question about a person
-        if "did" in question_lower and "say" in question_lower:
-            person = self._extract_person_name(question)
-            return await self._find_what_person_said(person, all_meetings)
+        passages = "\n\n".join(
+            f"[{number}] {self._describe_passage(hit.passage)}\n{hit.passage.text}"
+            for number, hit in enumerate(hits, 1)
+        )
+        prompt = f"""Answer the question using only the meeting excerpts below.
+Cite the excerpts you used by number, e.g. [2]. If the excerpts don't contain the answer, say so.
 
-        # Question about deadlines
-        if "when" in question_lower and "due" in question_lower:
-            task = self._extract_task(question)
-            return await self._find_task_deadline(task, all_meetings)
+Question: {question}
 
-        # Question about assignments
-        if "who" in question_lower and ("working" in question_lower or "assigned" in question_lower):
-            task = self._extract_task(question)
-            return await self._find_task_assignee(task, all_meetings)
+Excerpts:
+{passages}"""
 
-        # Question about decisions
-        if "decision" in question_lower or "decided" in question_lower:
-            topic = self._extract_topic(question)
-            return await self._find_decisions(topic, all_meetings)
+        try:
+            result = await orchestrator.generate(prompt, model_type=ModelType.ANALYSIS, prefer_speed=True)
+            return result["response"]
+        except Exception as e:
+            logger.warning(f"⚠️ Answer generation failed, returning best passage: {e}")
+            best = hits[0].passage
+            return f"{self._describe_passage(best)}: {best.text}"
 
-        return "I can help you find information from your meetings. Try asking about specific people, tasks, or decisions."
+    def _search_passages(
+        self,
+        question: str,
+        all_meetings: List[Dict[str, Any]],
+        organization_id: Optional[str]
+    ) -> List[PassageHit]:
+        context = self.context_for(organization_id)
+        with context.lock:
+            context.update(all_meetings)
+            return context.passages.search(question, k=settings.SEARCH_ANSWER_PASSAGES)
+
+    @staticmethod
+    def _describe_passage(passage: Passage) -> str:
+        """Where a passage comes from: meeting, date and what it is"""
+
+        parts = [passage.meta.get("title") or "Meeting"]
+        if passage.meta.get("date"):
+            parts.append(str(passage.meta["date"])[:10])
+        if passage.kind in ("decision", "summary"):
+            parts.append(passage.kind)
+        elif passage.kind == "action_item":
+            owner = passage.meta.get("assignee") or "unassigned"
+            due = f", due {passage.meta['due_date'][:10]}" if passage.meta.get("due_date") else ""
+            parts.append(f"action item for {owner}{due}")
+        return ", ".join(parts)
 
     # Helper methods
     def _check_action_completion(self, action: Dict, current_meeting: Dict) -> str:
@@ -445,51 +490,19 @@ class ProactiveIntelligence:
         due = datetime.fromisoformat(action["due_date"])
         return max(0, (datetime.now() - due).days)
 
-    def _detect_deadline_conflicts(self, current, all_meetings) -> List[Dict]:
+    def _detect_deadline_conflicts(self, current, context: MeetingContext) -> List[Dict]:
         """Detect if deadlines conflict with each other"""
-        conflicts = []
-
-        # Collect all action items with due dates
-        all_actions = []
-        for meeting in all_meetings:
-            for action in meeting.get("action_items", []):
-                if action.get("due_date") and action.get("assignee"):
-                    all_actions.append({
-                        "task": action["task"],
-                        "assignee": action["assignee"],
-                        "due_date": datetime.fromisoformat(action["due_date"]),
-                        "meeting": meeting.get("title", "Unknown")
-                    })
-
-        # Group by assignee and check for conflicts
-        from collections import defaultdict
-        by_assignee = defaultdict(list)
-        for action in all_actions:
-            by_assignee[action["assignee"]].append(action)
-
-        # Check for multiple tasks due on same day
-        for assignee, actions in by_assignee.items():
-            actions.sort(key=lambda x: x["due_date"])
-            for i in range(len(actions) - 1):
-                if (actions[i+1]["due_date"] - actions[i]["due_date"]).days <= 1:
-                    conflicts.append({
-                        "type": "deadline_conflict",
-                        "severity": "high",
-                        "message": f"{assignee} has multiple tasks due within 24 hours",
-                        "tasks": [actions[i]["task"], actions[i+1]["task"]],
-                        "dates": [actions[i]["due_date"].isoformat(), actions[i+1]["due_date"].isoformat()]
-                    })
-
-        return conflicts
-
-    def _detect_scope_creep(self, current, all_meetings) -> bool:
+
+        # Consecutive deadlines per assignee come straight from the sorted index
+        return context.deadline_index.conflicts()
+
+    def _detect_scope_creep(self, current, context: MeetingContext) -> bool:
         """Detect if project scope is expanding"""
-        if len(all_meetings) < 3:
+        if len(context) < 3:
             return False
 
         # Compare action items in recent meetings
-        recent_meetings = all_meetings[-5:]  # Last 5 meetings
-        action_counts = [len(m.get("action_items", [])) for m in recent_meetings]
+        action_counts = [features.action_count for features in context.recent(5)]  # Last 5 meetings
 
         if len(action_counts) < 3:
             return False
@@ -501,35 +514,22 @@ class ProactiveIntelligence:
         # Scope creep if increase > 40%
         return last_avg > first_avg * 1.4
 
-    def _detect_resource_overload(self, current, all_meetings) -> Dict[str, int]:
+    def _detect_resource_overload(self, current, context: MeetingContext) -> Dict[str, int]:
         """Detect if any person has too many concurrent tasks"""
-        overloaded = {}
-
-        # Count active tasks per person
-        task_counts = defaultdict(int)
-        for meeting in all_meetings[-10:]:  # Last 10 meetings
-            for action in meeting.get("action_items", []):
-                if action.get("status") != "Completed" and action.get("assignee"):
-                    task_counts[action["assignee"]] += 1
-
-        # Flag if someone has > 5 active tasks
-        for person, count in task_counts.items():
-            if count > 5:
-                overloaded[person] = count
 
-        return overloaded
+        # Open items per assignee are counted as the index is updated
+        return context.deadline_index.overloaded()
 
-    def _detect_communication_gaps(self, current, all_meetings) -> bool:
+    def _detect_communication_gaps(self, current, context: MeetingContext) -> bool:
         """Detect if key people are missing from meetings"""
-        if len(all_meetings) < 3:
+        if len(context) < 3:
             return False
 
         # Find frequent attendees
         attendee_frequency = defaultdict(int)
-        for meeting in all_meetings[-10:]:
-            for attendee in meeting.get("attendees", []):
-                if attendee.get("attended"):
-                    attendee_frequency[attendee["name"]] += 1
+        for features in context.recent(10):
+            for name in features.attendees_present:
+                attendee_frequency[name] += 1
 
         # Check if anyone who usually attends is missing
         key_attendees = [name for name, count in attendee_frequency.items() if count >= 5]
@@ -543,47 +543,12 @@ class ProactiveIntelligence:
 
         return False
 
-    def _detect_decision_conflicts(self, current, all_meetings) -> List[Dict]:
+    def _detect_decision_conflicts(self, current, context: MeetingContext) -> List[Dict]:
         """Detect if decisions contradict each other"""
-        conflicts = []
-
-        # Extract all decisions
-        all_decisions = []
-        for meeting in all_meetings:
-            for decision in meeting.get("decisions", []):
-                all_decisions.append({
-                    "text": decision.lower(),
-                    "meeting": meeting.get("title", "Unknown"),
-                    "date": meeting.get("meeting_date")
-                })
-
-        # Look for contradictory keywords
-        contradiction_pairs = [
-            ("approve", "reject"),
-            ("increase", "decrease"),
-            ("add", "remove"),
-            ("start", "cancel"),
-            ("hire", "layoff")
-        ]
 
-        for i, dec1 in enumerate(all_decisions):
-            for dec2 in all_decisions[i+1:]:
-                for word1, word2 in contradiction_pairs:
-                    if word1 in dec1["text"] and word2 in dec2["text"]:
-                        # Check if about same topic (simple keyword overlap)
-                        words1 = set(dec1["text"].split())
-                        words2 = set(dec2["text"].split())
-                        if len(words1 & words2) > 3:
-                            conflicts.append({
-                                "type": "decision_conflict",
-                                "severity": "medium",
-                                "message": f"Potentially conflicting decisions detected",
-                                "decision1": dec1["text"],
-                                "decision2": dec2["text"],
-                                "meetings": [dec1["meeting"], dec2["meeting"]]
-                            })
-
-        return conflicts
+        # New decisions are checked against the LSH buckets of the opposing
+        # keyword as they are indexed; earlier conflicts are kept
+        return context.decision_index.conflict_reports()
 
     def _generate_action_email(self, meeting: Dict) -> str:
         """Generate draft email with action items"""
@@ -604,118 +569,76 @@ class ProactiveIntelligence:
 
         return email
 
-    def _should_schedule_followup(self, current, all_meetings) -> bool:
+    def _should_schedule_followup(self, current, context: MeetingContext) -> bool:
         """Predict if a follow-up meeting is needed"""
         return len(current.get("action_items", [])) > 3
 
-    def _predict_followup_date(self, current, all_meetings) -> str:
+    def _predict_followup_date(self, current, context: MeetingContext) -> str:
         """Predict when the follow-up should be"""
         return (datetime.now() + timedelta(days=7)).isoformat()
 
-    def _time_for_status_report(self, all_meetings) -> bool:
+    def _time_for_status_report(self, context: MeetingContext) -> bool:
         """Detect if it's time for a status report"""
         return False
 
-    def _generate_status_report(self, all_meetings) -> str:
+    def _generate_status_report(self, context: MeetingContext) -> str:
         """Generate weekly status report"""
         return "Weekly Status Report..."
 
-    def _analyze_meeting_frequency(self, all_meetings) -> Optional[Dict]:
+    def _analyze_meeting_frequency(self, context: MeetingContext) -> Optional[Dict]:
         """Analyze how often meetings occur"""
         return None
 
-    def _analyze_topic_trends(self, all_meetings) -> Dict[str, List]:
+    def _analyze_topic_trends(self, context: MeetingContext) -> Dict[str, List]:
         """Analyze which topics are trending up or down"""
         return {"up": ["API Development"], "down": ["Budget"]}
 
-    def _calculate_completion_rate(self, all_meetings) -> float:
+    def _calculate_completion_rate(self, context: MeetingContext) -> float:
         """Calculate what % of action items get completed"""
         return 72.5
 
-    def _calculate_meeting_effectiveness(self, all_meetings) -> float:
+    def _calculate_meeting_effectiveness(self, context: MeetingContext) -> float:
         """Calculate overall meeting effectiveness score"""
         return 8.2  # out of 10
 
-    def _avg_action_items(self, all_meetings) -> float:
+    def _avg_action_items(self, context: MeetingContext) -> float:
         """Average number of action items per meeting"""
-        return 4.2
+        return round(len(context.actions) / len(context), 1) if len(context) else 0.0
 
-    def _avg_decisions(self, all_meetings) -> float:
+    def _avg_decisions(self, context: MeetingContext) -> float:
         """Average number of decisions per meeting"""
-        return 2.1
+        return round(len(context.decisions) / len(context), 1) if len(context) else 0.0
 
-    def _get_upcoming_deadlines(self, all_meetings) -> List[Dict]:
+    def _get_upcoming_deadlines(self, context: MeetingContext) -> List[Dict]:
         """Get action items due soon"""
-        upcoming = []
         now = datetime.now()
         deadline = now + timedelta(hours=48)
 
-        for meeting in all_meetings:
-            for action in meeting.get("action_items", []):
-                if action.get("due_date") and action.get("status") != "Completed":
-                    due = datetime.fromisoformat(action["due_date"])
-                    if now < due <= deadline:
-                        upcoming.append({
-                            "task": action["task"],
-                            "assignee": action.get("assignee"),
-                            "due_date": action["due_date"],
-                            "hours_remaining": (due - now).total_seconds() / 3600,
-                            "meeting": meeting.get("title")
-                        })
-
-        return sorted(upcoming, key=lambda x: x["hours_remaining"])
-
-    def _detect_missing_updates(self, all_meetings) -> List[str]:
+        # Open due dates are kept sorted, so this is a range lookup
+        return [
+            {
+                "task": row.action["task"],
+                "assignee": row.action.get("assignee"),
+                "due_date": row.action["due_date"],
+                "hours_remaining": (row.due - now).total_seconds() / 3600,
+                "meeting": context.features[row.meeting].title
+            }
+            for row in context.actions_due_between(now, deadline)
+        ]
+
+    def _detect_missing_updates(self, context: MeetingContext) -> List[str]:
         """Detect topics that haven't been discussed recently"""
-        if len(all_meetings) < 5:
+        if len(context) < 5:
             return []
 
-        # Get topics from older meetings
-        old_topics = set()
-        for meeting in all_meetings[:-5]:
-            old_topics.update(meeting.get("topics", []))
-
-        # Get topics from recent meetings
-        recent_topics = set()
-        for meeting in all_meetings[-5:]:
-            recent_topics.update(meeting.get("topics", []))
-
-        # Find topics that disappeared
-        missing = list(old_topics - recent_topics)
+        # Topics from older meetings that disappeared from the last 5
+        missing = context.topics_not_seen_since(5)
         return missing[:3]  # Top 3
 
-    def _detect_sentiment_shift(self, all_meetings) -> Optional[Dict]:
+    def _detect_sentiment_shift(self, context: MeetingContext) -> Optional[Dict]:
         """Detect if sentiment has changed"""
         return None
 
     def _is_referenced_in_actions(self, current, other) -> bool:
         """Check if one meeting references the other"""
         return False
-
-    def _extract_person_name(self, question: str) -> str:
-        """Extract person name from question"""
-        return ""
-
-    def _extract_task(self, question: str) -> str:
-        """Extract task from question"""
-        return ""
-
-    def _extract_topic(self, question: str) -> str:
-        """Extract topic from question"""
-        return ""
-
-    async def _find_what_person_said(self, person: str, meetings: List) -> str:
-        """Find what a specific person said"""
-        return f"Sarah discussed the budget in the last planning meeting..."
-
-    async def _find_task_deadline(self, task: str, meetings: List) -> str:
-        """Find when a task is due"""
-        return "The infrastructure deployment is due by Friday, December 27th."
-
-    async def _find_task_assignee(self, task: str, meetings: List) -> str:
-        """Find who is assigned to a task"""
-        return "Mike Chen is working on the authentication feature."
-
-    async def _find_decisions(self, topic: str, meetings: List) -> str:
-        """Find decisions about a topic"""
-        return "The team decided to move the launch date to February 1st."
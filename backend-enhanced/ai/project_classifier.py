@@ -8,16 +8,41 @@ This module uses AI to:
 4. Track cross-project dependencies
 """
 
+import asyncio
+import json
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+import math
+from collections import Counter
+from typing import Dict, Iterable, List, Mapping, Optional, Any, Sequence, Set, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 import re
 
+import numpy as np
+
 from ai_multi_model import orchestrator, ModelType
+from ai.dependency_graph import DependencyGraph, TaskNode, dependency_graphs
+from ai.project_registry import ProjectRegistry, StoredProject
+from config import settings
+from keyword_matcher import KeywordMatcher
+from text_embedding import HashingEmbedder, embedder
 
 logger = logging.getLogger(__name__)
 
+# Keyword fallback: at most this many projects per meeting
+KEYWORD_FALLBACK_MAX_MATCHES = 5
+
+# Meeting classification: only the projects most similar to the transcript go in the prompt
+SHORTLIST_SIZE = 8
+
+# ...and the model is skipped when the best project is this similar and this many times
+# more similar than the next (a whole transcript keeps cosines to a short profile low)
+DIRECT_MATCH_MIN_SIMILARITY = 0.1
+DIRECT_MATCH_MIN_RATIO = 2.5
+
+# Batched task classification: transcript words shared by all tasks in the call
+TASK_CONTEXT_WORDS = 1500
+
 
 @dataclass
 class ProjectMatch:
@@ -38,7 +63,153 @@ class ClassifiedTask:
     confidence: float
     assignee: Optional[str] = None
     due_date: Optional[datetime] = None
-    dependencies: List[str] = None
+    dependencies: List[str] = None  # IDs of the tasks this one waits on
+    task_id: Optional[str] = None  # e.g. the ActionItem ID, once stored
+
+
+@dataclass
+class KeywordScore:
+    """How well a text matches one project's keywords"""
+    project_id: str
+    score: float  # sum over matched keywords of (1 + log tf) * idf
+    coverage: float  # idf-weighted share of the project's keywords present (0.0 - 1.0)
+    keywords: List[str]  # matched keywords, as registered
+
+
+class ProjectKeywordIndex:
+    """
+    Every project's keywords compiled into one matcher
+
+    A text is scanned once for all projects instead of once per project.
+    Keywords are weighted by how specific they are (IDF over projects: a
+    keyword many projects share says little about any of them), and a
+    project scores the sublinear term frequency of each matched keyword
+    times its weight.
+    """
+
+    def __init__(self, project_keywords: Mapping[str, Iterable[str]]):
+        self.keywords: Dict[str, List[str]] = {
+            project_id: [keyword for keyword in keywords if keyword]
+            for project_id, keywords in project_keywords.items()
+        }
+
+        self.projects_by_keyword: Dict[str, List[str]] = {}
+        for project_id, keywords in self.keywords.items():
+            for keyword in {keyword.lower() for keyword in keywords}:
+                self.projects_by_keyword.setdefault(keyword, []).append(project_id)
+
+        projects = len(self.keywords)
+        self.weights: Dict[str, float] = {
+            keyword: math.log(1.0 + projects / len(project_ids))
+            for keyword, project_ids in self.projects_by_keyword.items()
+        }
+        self.total_weights: Dict[str, float] = {
+            project_id: sum(self.weights[keyword] for keyword in {k.lower() for k in keywords})
+            for project_id, keywords in self.keywords.items()
+        }
+
+        self.matcher = KeywordMatcher(self.projects_by_keyword)
+
+    def score(self, text: str, lowered: bool = False) -> List[KeywordScore]:
+        """Projects with at least one keyword in `text`, best first"""
+
+        counts = Counter(keyword for _, keyword in self.matcher.find_all(text, lowered))
+
+        scores: Dict[str, float] = {}
+        matched_weights: Dict[str, float] = {}
+        for keyword, count in counts.items():
+            weight = self.weights[keyword]
+            for project_id in self.projects_by_keyword[keyword]:
+                scores[project_id] = scores.get(project_id, 0.0) + (1.0 + math.log(count)) * weight
+                matched_weights[project_id] = matched_weights.get(project_id, 0.0) + weight
+
+        results = [
+            KeywordScore(
+                project_id=project_id,
+                score=score,
+                coverage=matched_weights[project_id] / self.total_weights[project_id],
+                keywords=[keyword for keyword in self.keywords[project_id] if keyword.lower() in counts]
+            )
+            for project_id, score in scores.items()
+        ]
+        results.sort(key=lambda result: (-result.score, result.project_id))
+        return results
+
+
+class ProjectCentroids:
+    """
+    One TF-IDF centroid per project, as rows of a dense matrix
+
+    A project's centroid is the mean of the hashed term vectors of its name
+    and description and of its keywords, computed when it is registered.
+    IDF is taken per hash bucket over all projects and applied when the
+    matrix is next ranked against, so registering a project only rewrites
+    its own row. Ranking is one sparse-by-dense product over every project.
+    """
+
+    def __init__(self, text_embedder: HashingEmbedder = embedder):
+        self.embedder = text_embedder
+        self.project_ids: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self._centroids = np.zeros((8, text_embedder.dim), dtype=np.float32)  # unweighted, spare rows at the end
+        self._idf: Optional[np.ndarray] = None
+        self._weighted: Optional[np.ndarray] = None  # IDF-weighted, L2-normalized (built on demand)
+
+    def __len__(self) -> int:
+        return len(self.project_ids)
+
+    def set_project(self, project_id: str, texts: Sequence[str]) -> np.ndarray:
+        """Compute (or replace) a project's centroid from its descriptive texts"""
+
+        vectors = self.embedder.embed_many([text for text in texts if text])
+        centroid = vectors.mean(axis=0) if len(vectors) else np.zeros(self.embedder.dim, dtype=np.float32)
+        self.set_centroid(project_id, centroid)
+        return centroid
+
+    def set_centroid(self, project_id: str, centroid: np.ndarray):
+        """Set a project's centroid as computed by `set_project` (e.g. loaded from the registry)"""
+
+        row = self.rows.get(project_id)
+        if row is None:
+            row = self.rows[project_id] = len(self.project_ids)
+            self.project_ids.append(project_id)
+            if row == len(self._centroids):
+                grown = np.zeros((2 * row, self.embedder.dim), dtype=np.float32)
+                grown[:row] = self._centroids
+                self._centroids = grown
+
+        self._centroids[row] = centroid
+        self._weighted = None
+
+    def _weighted_centroids(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._weighted is None:
+            centroids = self._centroids[:len(self.project_ids)]
+            document_frequency = np.count_nonzero(centroids, axis=0)
+            self._idf = (np.log((1.0 + len(centroids)) / (1.0 + document_frequency)) + 1.0).astype(np.float32)
+            weighted = centroids * self._idf
+            norms = np.linalg.norm(weighted, axis=1, keepdims=True)
+            self._weighted = weighted / np.maximum(norms, 1e-12)
+        return self._weighted, self._idf
+
+    def rank(self, text: str, k: int) -> List[Tuple[str, float]]:
+        """The `k` projects whose centroids are most similar to `text`, as (project_id, cosine) best first"""
+
+        if not self.project_ids:
+            return []
+        weighted, idf = self._weighted_centroids()
+
+        indices, values = self.embedder.embed_sparse(text)
+        if len(indices):
+            values = values * idf[indices]
+            # Only the text's non-zero buckets contribute
+            scores = weighted[:, indices] @ (values / np.linalg.norm(values))
+        else:
+            scores = np.zeros(len(self.project_ids), dtype=np.float32)
+
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self.project_ids[row], float(scores[row])) for row in top]
 
 
 class ProjectClassifier:
@@ -52,12 +223,46 @@ class ProjectClassifier:
     - Tracks cross-project tasks
     """
 
-    def __init__(self):
-        # In-memory project database (would be DB in production)
+    def __init__(self, registry: Optional[ProjectRegistry] = None):
+        # Working copy of the project registry (PostgreSQL), shared by every worker
         self.projects: Dict[str, Dict[str, Any]] = {}
         self.project_keywords: Dict[str, List[str]] = {}
+        self._keyword_index: Optional[ProjectKeywordIndex] = None  # built on demand
+        self.centroids = ProjectCentroids()
+
+        self.registry = registry or ProjectRegistry()
+        self.registry_version = 0  # newest registry version stamp applied
+        self._project_versions: Dict[str, int] = {}
+        self._loaded: Optional[asyncio.Task] = None
+        self._listener: Optional[asyncio.Task] = None
         logger.info("🎯 Project Classifier initialized")
 
+    async def start(self):
+        """Load the registered projects and follow changes made by other workers"""
+
+        await self._ensure_loaded()
+        if self.registry.enabled and self._listener is None:
+            self._listener = asyncio.create_task(self.registry.listen(self.sync))
+
+    async def stop(self):
+        if self._listener:
+            self._listener.cancel()
+            self._listener = None
+
+    async def sync(self, project_id: Optional[str] = None):
+        """Apply projects saved (by any worker) since the last sync, and `project_id` if announced"""
+
+        try:
+            stored = await asyncio.to_thread(self.registry.load, self.registry_version, project_id)
+        except Exception as e:
+            logger.error(f"❌ Project registry load failed: {e}")
+            return
+
+        for project in stored:
+            self._apply_stored(project)
+        if stored:
+            logger.info(f"📁 Loaded {len(stored)} projects from the registry (version {self.registry_version})")
+
     async def register_project(
         self,
         project_id: str,
@@ -72,21 +277,61 @@ class ProjectClassifier:
             project_id: Unique project identifier
             project_name: Human-readable project name
             description: Project description (used for AI matching)
-            keywords: Optional list of keywords (auto-extracted if not provided)
+            keywords: Optional list of keywords (auto-extracted if not provided,
+                unless extracted before for the same name and description)
         """
 
-        # If no keywords provided, extract from name and description
-        if not keywords:
-            keywords = await self._extract_keywords(f"{project_name} {description}")
+        await self._ensure_loaded()
+        existing = self.projects.get(project_id)
+        same_profile = existing is not None and (existing["name"], existing["description"]) == (project_name, description)
 
+        keywords_extracted = not keywords
+        if keywords_extracted:
+            if same_profile and existing["keywords_extracted"]:
+                keywords = self.project_keywords[project_id]
+            else:
+                # If no keywords provided, extract from name and description
+                keywords = await self._extract_keywords(f"{project_name} {description}")
+
+        if (
+            same_profile
+            and existing["keywords_extracted"] == keywords_extracted
+            and self.project_keywords[project_id] == keywords
+            and (project_id in self._project_versions or not self.registry.enabled)
+        ):
+            logger.info(f"📁 Project {project_name} already registered")
+            return
+
+        created_at = existing["created_at"] if existing else datetime.utcnow()
         self.projects[project_id] = {
             "id": project_id,
             "name": project_name,
             "description": description,
-            "created_at": datetime.utcnow()
+            "keywords_extracted": keywords_extracted,
+            "created_at": created_at
         }
 
+        if self.project_keywords.get(project_id) != keywords:
+            self._keyword_index = None
         self.project_keywords[project_id] = keywords
+        centroid = self.centroids.set_project(project_id, self._profile_texts(project_name, description, keywords))
+
+        if self.registry.enabled:
+            try:
+                version = await asyncio.to_thread(self.registry.save, StoredProject(
+                    project_id=project_id,
+                    name=project_name,
+                    description=description,
+                    keywords=keywords,
+                    keywords_extracted=keywords_extracted,
+                    centroid=centroid,
+                    centroid_embedder=self.centroids.embedder.name,
+                    created_at=created_at
+                ))
+                self._project_versions[project_id] = version
+                await self.registry.publish(project_id, version)
+            except Exception as e:
+                logger.error(f"❌ Could not save project {project_id} to the registry: {e}")
 
         logger.info(f"📁 Registered project: {project_name} with {len(keywords)} keywords")
 
@@ -100,6 +345,9 @@ class ProjectClassifier:
         """
         Classify a meeting to one or more projects using AI
 
+        Only the projects most similar to the meeting are offered to the model,
+        and a project that clearly stands out is returned without a model call.
+
         Args:
             transcript: Full meeting transcript
             meeting_title: Optional meeting title
@@ -107,9 +355,11 @@ class ProjectClassifier:
             existing_tags: Optional tags/labels already assigned
 
         Returns:
-            List of ProjectMatch objects, sorted by confidence (highest first)
+            List of ProjectMatch objects, sorted by confidence (highest first;
+            keyword fallback matches by weighted keyword score)
         """
 
+        await self._ensure_loaded()
         if not self.projects:
             logger.warning("No projects registered for classification")
             return []
@@ -131,10 +381,17 @@ class ProjectClassifier:
         # Get first 2000 words of transcript for analysis
         transcript_sample = " ".join(transcript.split()[:2000])
 
+        # Shortlist the projects closest to the meeting; a clear winner needs no model call
+        shortlist = self.centroids.rank(f"{meeting_title or ''} {transcript_sample}", SHORTLIST_SIZE)
+        direct_match = self._direct_match(shortlist, transcript)
+        if direct_match:
+            logger.info(f"🎯 Meeting matched {direct_match.project_name} locally ({direct_match.reasoning})")
+            return [direct_match]
+
         # Build project list for AI
         project_list = "\n".join([
-            f"- {pid}: {proj['name']} - {proj['description']}"
-            for pid, proj in self.projects.items()
+            f"- {pid}: {self.projects[pid]['name']} - {self.projects[pid]['description']}"
+            for pid, _ in shortlist
         ])
 
         prompt = f"""Analyze this meeting and determine which project(s) it relates to.
@@ -171,11 +428,8 @@ Return ONLY the JSON array, no other text."""
             prefer_accuracy=True
         )
 
-        # Parse AI response
-        matches = await self._parse_project_matches(result["response"])
-
-        # Sort by confidence (highest first)
-        matches.sort(key=lambda x: x.confidence_score, reverse=True)
+        # Parse AI response (best first)
+        matches = await self._parse_project_matches(result["response"], transcript)
 
         logger.info(f"🎯 Found {len(matches)} project matches for meeting")
 
@@ -190,6 +444,13 @@ Return ONLY the JSON array, no other text."""
         """
         Classify individual action items to specific projects
 
+        Tasks that name one of the meeting's projects go to it, the others to
+        the primary project. With PROJECT_TASK_MODEL_CLASSIFICATION the
+        others are instead classified together in one structured AI call
+        that shares the meeting context; a task whose answer is missing or
+        fails validation falls back to _detect_task_project on its own, and
+        assignees and due dates are extracted while the call is in flight.
+
         Args:
             action_items: List of action items extracted from meeting
             meeting_projects: Projects the meeting was classified to
@@ -199,28 +460,21 @@ Return ONLY the JSON array, no other text."""
             List of ClassifiedTask objects
         """
 
-        classified_tasks = []
-
-        for task in action_items:
-            # Get primary project (highest confidence from meeting)
-            primary_project = meeting_projects[0] if meeting_projects else None
-
-            if not primary_project:
-                logger.warning(f"No project match for task: {task[:50]}...")
-                continue
+        if not meeting_projects:
+            if action_items:
+                logger.warning(f"No project match for {len(action_items)} tasks")
+            return []
 
-            # Check if task mentions specific project
-            task_project = await self._detect_task_project(
-                task,
-                meeting_projects,
-                full_transcript
+        task_projects, details = await asyncio.gather(
+            self._classify_task_batch(action_items, meeting_projects, full_transcript),
+            asyncio.to_thread(
+                lambda: [(self._extract_assignee(task), self._extract_due_date(task)) for task in action_items]
             )
+        )
 
-            # Extract assignee and due date from task text
-            assignee = self._extract_assignee(task)
-            due_date = self._extract_due_date(task)
-
-            classified_task = ClassifiedTask(
+        classified_tasks = []
+        for task, task_project, (assignee, due_date) in zip(action_items, task_projects, details):
+            classified_tasks.append(ClassifiedTask(
                 task_text=task,
                 project_id=task_project.project_id,
                 project_name=task_project.project_name,
@@ -228,9 +482,7 @@ Return ONLY the JSON array, no other text."""
                 assignee=assignee,
                 due_date=due_date,
                 dependencies=[]
-            )
-
-            classified_tasks.append(classified_task)
+            ))
 
             logger.info(
                 f"📋 Classified task to {task_project.project_name} "
@@ -241,19 +493,28 @@ Return ONLY the JSON array, no other text."""
 
     async def detect_cross_project_dependencies(
         self,
-        tasks: List[ClassifiedTask]
+        tasks: List[ClassifiedTask],
+        organization_id: Optional[str] = None
     ) -> Dict[str, List[str]]:
         """
         Detect dependencies between tasks across different projects
 
+        All tasks go to the model in one call. Each task's `dependencies` is
+        set to the IDs of the tasks it waits on.
+
         Args:
-            tasks: List of classified tasks
+            tasks: List of classified tasks (keyed by task_id, else task text)
+            organization_id: Optional organization whose dependency graph
+                the tasks with a task_id and their dependencies are added to
 
         Returns:
-            Dict mapping task to list of dependent task IDs
+            Dict mapping task ID to the IDs of the tasks it depends on
         """
 
-        dependencies = {}
+        if len(tasks) < 2:
+            return {}
+
+        task_ids = [task.task_id or task.task_text for task in tasks]
 
         # Build task context for AI
         task_list = "\n".join([
@@ -272,7 +533,7 @@ For each task that depends on another task, specify:
 
 Return as JSON:
 {{
-  "task_index": [list of dependent task indices]
+  "task_index": [indices of the tasks it depends on]
 }}
 
 Example:
@@ -283,17 +544,87 @@ Example:
 
 Return ONLY the JSON, no other text."""
 
-        result = await orchestrator.generate(
-            prompt,
-            model_type=ModelType.CLASSIFICATION,
-            prefer_accuracy=True
-        )
+        try:
+            result = await orchestrator.generate(
+                prompt,
+                model_type=ModelType.CLASSIFICATION,
+                prefer_accuracy=True
+            )
+        except Exception as e:
+            logger.error(f"❌ Dependency detection failed: {e}")
+            return {}
+
+        # Map indices back to task IDs
+        dependencies: Dict[str, List[str]] = {}
+        for index, blockers in self._parse_dependencies(result["response"], len(tasks)).items():
+            dependencies[task_ids[index]] = [task_ids[blocker] for blocker in blockers]
+        for task, task_id in zip(tasks, task_ids):
+            task.dependencies = dependencies.get(task_id, [])
 
-        # Parse and map back to task IDs
-        # (Implementation would parse JSON and map indices)
+        if organization_id is not None:
+            graph = dependency_graphs.graph(organization_id)
+            await asyncio.to_thread(self._record_dependencies, graph, tasks)
+
+        logger.info(f"🕸️ Found {sum(map(len, dependencies.values()))} dependencies among {len(tasks)} tasks")
 
         return dependencies
 
+    @staticmethod
+    def _parse_dependencies(response: str, count: int) -> Dict[int, List[int]]:
+        """{"3": [0, 1]} -> {3: [0, 1]}, dropping out-of-range indices and self-dependencies"""
+
+        try:
+            data = json.loads(re.search(r"\{.*\}", response, re.DOTALL).group(0))
+        except (AttributeError, json.JSONDecodeError) as e:
+            logger.error(f"Failed to parse task dependencies: {e}")
+            return {}
+
+        parsed: Dict[int, List[int]] = {}
+        for key, blockers in data.items() if isinstance(data, dict) else ():
+            try:
+                index = int(key)
+                blockers = [int(blocker) for blocker in blockers]
+            except (TypeError, ValueError):
+                continue
+            if not 0 <= index < count:
+                continue
+            valid = [blocker for blocker in dict.fromkeys(blockers) if 0 <= blocker < count and blocker != index]
+            if valid:
+                parsed[index] = valid
+        return parsed
+
+    @staticmethod
+    def _record_dependencies(graph: DependencyGraph, tasks: List[ClassifiedTask]):
+        """Add stored tasks (those with a task_id) and the dependencies between them to a dependency graph"""
+
+        stored = [task for task in tasks if task.task_id]
+        stored_ids = {task.task_id for task in stored}
+        graph.upsert_tasks([
+            TaskNode(
+                task_id=task.task_id,
+                text=task.task_text,
+                project_id=task.project_id,
+                project_name=task.project_name,
+                due_date=task.due_date.isoformat() if task.due_date else None
+            )
+            for task in stored
+        ])
+        graph.add_dependencies(
+            (task.task_id, blocker)
+            for task in stored
+            for blocker in task.dependencies or []
+            if blocker in stored_ids
+        )
+
+    def project_id_for_name(self, project_name: str) -> Optional[str]:
+        """ID of the registered project with this name (case-insensitive), if any"""
+
+        name = project_name.strip().lower()
+        for project_id, project in self.projects.items():
+            if project["name"].strip().lower() == name:
+                return project_id
+        return None
+
     async def get_project_summary(
         self,
         project_id: str,
@@ -312,6 +643,7 @@ Return ONLY the JSON, no other text."""
             Dict with project summary statistics
         """
 
+        await self._ensure_loaded()
         if project_id not in self.projects:
             return {"error": "Project not found"}
 
@@ -354,10 +686,8 @@ Return as comma-separated list: keyword1, keyword2, keyword3"""
         keywords = [k.strip() for k in result["response"].split(",")]
         return keywords[:15]  # Limit to 15
 
-    async def _parse_project_matches(self, ai_response: str) -> List[ProjectMatch]:
-        """Parse AI response into ProjectMatch objects"""
-
-        import json
+    async def _parse_project_matches(self, ai_response: str, transcript: str) -> List[ProjectMatch]:
+        """Parse AI response into ProjectMatch objects (keyword matches on the transcript if it can't be parsed)"""
 
         try:
             # Extract JSON from response (handle markdown code blocks)
@@ -382,36 +712,256 @@ Return as comma-separated list: keyword1, keyword2, keyword3"""
                         reasoning=m.get("reasoning", "")
                     ))
 
+            # Sort by confidence (highest first)
+            matches.sort(key=lambda x: x.confidence_score, reverse=True)
             return matches
 
         except Exception as e:
             logger.error(f"Failed to parse project matches: {e}")
             # Fallback: keyword matching
-            return await self._keyword_fallback_matching(ai_response)
+            return await self._keyword_fallback_matching(transcript)
+
+    def _direct_match(self, shortlist: List[Tuple[str, float]], transcript: str) -> Optional[ProjectMatch]:
+        """The top shortlisted project, if it is similar enough and clearly ahead of the runner-up"""
+
+        if not shortlist:
+            return None
+        project_id, best = shortlist[0]
+        runner_up = shortlist[1][1] if len(shortlist) > 1 else 0.0
+        if best < DIRECT_MATCH_MIN_SIMILARITY or best < DIRECT_MATCH_MIN_RATIO * runner_up:
+            return None
+
+        keywords = next(
+            (result.keywords for result in self._project_keyword_index().score(transcript)
+             if result.project_id == project_id),
+            []
+        )
+        return ProjectMatch(
+            project_id=project_id,
+            project_name=self.projects[project_id]["name"],
+            confidence_score=min(0.95, best / (best + runner_up)),
+            keywords_matched=keywords,
+            reasoning=f"Local similarity {best:.2f} (next project {runner_up:.2f})"
+        )
+
+    async def _ensure_loaded(self):
+        """Wait for the first registry load (started by whichever call comes first)"""
+        if self.registry.enabled:
+            if self._loaded is None:
+                self._loaded = asyncio.create_task(self.sync())
+            await self._loaded
+
+    def _apply_stored(self, stored: StoredProject):
+        """Take over a project as saved in the registry (skipped if this copy is as new)"""
+
+        if stored.version <= self._project_versions.get(stored.project_id, 0):
+            return
+
+        self.projects[stored.project_id] = {
+            "id": stored.project_id,
+            "name": stored.name,
+            "description": stored.description,
+            "keywords_extracted": stored.keywords_extracted,
+            "created_at": stored.created_at or datetime.utcnow()
+        }
+
+        if self.project_keywords.get(stored.project_id) != stored.keywords:
+            self._keyword_index = None
+        self.project_keywords[stored.project_id] = stored.keywords
+
+        # Centroids from another vector space (embedder changed since) are recomputed
+        if (
+            stored.centroid is not None
+            and stored.centroid_embedder == self.centroids.embedder.name
+            and stored.centroid.size == self.centroids.embedder.dim
+        ):
+            self.centroids.set_centroid(stored.project_id, stored.centroid)
+        else:
+            self.centroids.set_project(
+                stored.project_id, self._profile_texts(stored.name, stored.description, stored.keywords)
+            )
+
+        self._project_versions[stored.project_id] = stored.version
+        self.registry_version = max(self.registry_version, stored.version)
+
+    @staticmethod
+    def _profile_texts(project_name: str, description: str, keywords: List[str]) -> List[str]:
+        """What a project's centroid is computed from"""
+        return [f"{project_name} {description}", " ".join(keywords)]
 
-    async def _keyword_fallback_matching(self, transcript: str) -> List[ProjectMatch]:
-        """Fallback keyword-based matching if AI parsing fails"""
+    def _project_keyword_index(self) -> ProjectKeywordIndex:
+        """All projects' keywords in one matcher (rebuilt after register_project changes them)"""
+        if self._keyword_index is None:
+            self._keyword_index = ProjectKeywordIndex(self.project_keywords)
+        return self._keyword_index
+
+    async def _keyword_fallback_matching(
+        self,
+        transcript: str,
+        limit: int = KEYWORD_FALLBACK_MAX_MATCHES
+    ) -> List[ProjectMatch]:
+        """Fallback keyword-based matching if AI parsing fails: one pass over the transcript for all projects"""
 
         matches = []
+        for result in self._project_keyword_index().score(transcript)[:limit]:
+            keywords = self.project_keywords[result.project_id]
+            matches.append(ProjectMatch(
+                project_id=result.project_id,
+                project_name=self.projects[result.project_id]["name"],
+                confidence_score=min(0.8, result.coverage),
+                keywords_matched=result.keywords,
+                reasoning=f"Keyword match: {len(result.keywords)} of {len(keywords)} (weighted score {result.score:.2f})"
+            ))
 
-        for project_id, keywords in self.project_keywords.items():
-            matched_keywords = [
-                kw for kw in keywords
-                if kw.lower() in transcript.lower()
-            ]
+        return matches
+
+    async def _classify_task_batch(
+        self,
+        tasks: List[str],
+        meeting_projects: List[ProjectMatch],
+        transcript: str
+    ) -> List[ProjectMatch]:
+        """The project of each task, in order, with at most one AI call for all of them"""
 
-            if matched_keywords:
-                confidence = min(0.8, len(matched_keywords) / len(keywords))
+        if not settings.PROJECT_TASK_MODEL_CLASSIFICATION:
+            return [await self._detect_task_project(task, meeting_projects, transcript) for task in tasks]
 
-                matches.append(ProjectMatch(
+        resolved: List[Optional[ProjectMatch]] = [None] * len(tasks)
+        pending: List[int] = []
+        for index, task in enumerate(tasks):
+            project = meeting_projects[0] if len(meeting_projects) == 1 else self._named_project(task, meeting_projects)
+            if project is None:
+                pending.append(index)
+            else:
+                resolved[index] = project
+
+        if pending:
+            projects = {project.project_id: project for project in meeting_projects}
+            try:
+                assignments = await self._assign_tasks_batch([tasks[i] for i in pending], meeting_projects, transcript)
+            except Exception as e:
+                logger.error(f"❌ Batched task classification failed ({len(pending)} tasks): {e}")
+                assignments = {}
+
+            for position, index in enumerate(pending):
+                assignment = assignments.get(position)
+                if assignment is None:
+                    resolved[index] = await self._detect_task_project(tasks[index], meeting_projects, transcript)
+                    continue
+
+                project_id, confidence = assignment
+                project = projects[project_id]
+                resolved[index] = ProjectMatch(
                     project_id=project_id,
-                    project_name=self.projects[project_id]["name"],
-                    confidence_score=confidence,
-                    keywords_matched=matched_keywords,
-                    reasoning=f"Keyword match: {len(matched_keywords)} of {len(keywords)}"
-                ))
+                    project_name=project.project_name,
+                    confidence_score=project.confidence_score if confidence is None else confidence,
+                    keywords_matched=project.keywords_matched,
+                    reasoning="Batched task classification"
+                )
 
-        return matches
+        return resolved
+
+    async def _assign_tasks_batch(
+        self,
+        tasks: List[str],
+        meeting_projects: List[ProjectMatch],
+        transcript: str
+    ) -> Dict[int, Tuple[str, Optional[float]]]:
+        """
+        Ask for the project of several tasks in one call
+
+        Returns:
+            {task index: (project id, confidence or None)} for the answers that validate
+        """
+
+        project_lines = []
+        for project in meeting_projects:
+            description = self.projects.get(project.project_id, {}).get("description")
+            project_lines.append(
+                f"- {project.project_id}: {project.project_name}" + (f" - {description}" if description else "")
+            )
+        project_list = "\n".join(project_lines)
+        numbered = "\n".join(f"[{i + 1}] {task}" for i, task in enumerate(tasks))
+        transcript_sample = " ".join(transcript.split()[:TASK_CONTEXT_WORDS])
+
+        prompt = f"""Assign each numbered action item from this meeting to the project it belongs to.
+
+Meeting Projects:
+{project_list}
+
+Meeting Transcript Sample:
+{transcript_sample}
+
+Action Items:
+{numbered}
+
+Return JSON only: an object mapping action item number to its project ID and a
+confidence score (0.0 to 1.0), e.g. {{"1": {{"project_id": "proj-123", "confidence": 0.9}}}}.
+Use only the project IDs listed above."""
+
+        result = await orchestrator.generate(
+            prompt,
+            model_type=ModelType.CLASSIFICATION,
+            prefer_accuracy=True
+        )
+
+        return self._parse_task_assignments(
+            result["response"], len(tasks), {project.project_id for project in meeting_projects}
+        )
+
+    @staticmethod
+    def _parse_task_assignments(
+        response: str,
+        count: int,
+        project_ids: Set[str]
+    ) -> Dict[int, Tuple[str, Optional[float]]]:
+        """Map a batch response back to 0-based task indices, dropping answers that don't validate"""
+
+        match = re.search(r"\{.*\}", response, re.DOTALL)
+        if not match:
+            return {}
+        try:
+            data = json.loads(match.group(0))
+        except json.JSONDecodeError:
+            return {}
+        if not isinstance(data, dict):
+            return {}
+
+        assignments: Dict[int, Tuple[str, Optional[float]]] = {}
+        for key, value in data.items():
+            try:
+                index = int(key) - 1
+            except (TypeError, ValueError):
+                continue
+            if not 0 <= index < count:
+                continue
+
+            if isinstance(value, str):
+                value = {"project_id": value}
+            if not isinstance(value, dict) or str(value.get("project_id")) not in project_ids:
+                continue
+
+            confidence = value.get("confidence")
+            if confidence is not None:
+                try:
+                    confidence = float(confidence)
+                except (TypeError, ValueError):
+                    continue
+                if not 0.0 <= confidence <= 1.0:
+                    continue
+
+            assignments[index] = (str(value["project_id"]), confidence)
+
+        return assignments
+
+    @staticmethod
+    def _named_project(task: str, meeting_projects: List[ProjectMatch]) -> Optional[ProjectMatch]:
+        """The meeting project whose name the task mentions, if any"""
+        task_lower = task.lower()
+        for project in meeting_projects:
+            if project.project_name.lower() in task_lower:
+                return project
+        return None
 
     async def _detect_task_project(
         self,
@@ -422,9 +972,9 @@ Return as comma-separated list: keyword1, keyword2, keyword3"""
         """Determine which specific project a task belongs to"""
 
         # Check if task explicitly mentions project name
-        for project in meeting_projects:
-            if project.project_name.lower() in task.lower():
-                return project
+        project = self._named_project(task, meeting_projects)
+        if project is not None:
+            return project
 
         # Default to primary meeting project (highest confidence)
         return meeting_projects[0]
@@ -0,0 +1,177 @@
+"""
+Project Registry
+Classifier projects and their artifacts persisted in PostgreSQL, with Redis invalidation across workers
+"""
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Awaitable, Callable, List, Optional
+
+import numpy as np
+from sqlalchemy import or_, select
+from sqlalchemy.dialects.postgresql import insert
+
+from config import settings
+from database import SessionLocal
+from models import CLASSIFIER_PROJECT_VERSIONS, ClassifierProject
+from redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "classifier:projects"
+
+# Re-subscribing after Redis drops the subscription: exponential backoff between these
+RESUBSCRIBE_MIN_SECONDS = 1.0
+RESUBSCRIBE_MAX_SECONDS = 60.0
+
+# on_change(project_id): a project was saved by some worker (None: anything may have changed)
+ChangeHandler = Callable[[Optional[str]], Awaitable[None]]
+
+
+@dataclass
+class StoredProject:
+    """A classifier project as persisted"""
+    project_id: str
+    name: str
+    description: str
+    keywords: List[str]
+    keywords_extracted: bool
+    centroid: Optional[np.ndarray]
+    centroid_embedder: Optional[str]
+    version: int = 0
+    created_at: Optional[datetime] = None
+
+
+class ProjectRegistry:
+    """
+    The classifier's projects in PostgreSQL, shared by every worker
+
+    Each save takes the next registry-wide version stamp, so a worker catches
+    up by loading the rows stamped after the newest one it holds. Savers
+    publish the project ID on a Redis channel; since stamps are taken before
+    commit, a later stamp can become visible first, so the announced project
+    is always re-read along with the newer rows.
+
+    Database access is synchronous (run it in a thread from async code).
+    """
+
+    def __init__(self, enabled: bool = settings.PROJECT_REGISTRY_ENABLED):
+        self.enabled = enabled
+
+    def load(self, since: int = 0, project_id: Optional[str] = None) -> List[StoredProject]:
+        """Projects stamped after `since` (plus `project_id`), oldest first"""
+
+        condition = ClassifierProject.version > since
+        if project_id is not None:
+            condition = or_(condition, ClassifierProject.id == project_id)
+
+        db = SessionLocal()
+        try:
+            rows = db.execute(
+                select(ClassifierProject).where(condition).order_by(ClassifierProject.version)
+            ).scalars().all()
+        finally:
+            db.close()
+
+        return [
+            StoredProject(
+                project_id=row.id,
+                name=row.name,
+                description=row.description or "",
+                keywords=list(row.keywords or []),
+                keywords_extracted=bool(row.keywords_extracted),
+                centroid=np.frombuffer(row.centroid, dtype=np.float32) if row.centroid else None,
+                centroid_embedder=row.centroid_embedder,
+                version=row.version,
+                created_at=row.created_at
+            )
+            for row in rows
+        ]
+
+    def save(self, project: StoredProject) -> int:
+        """Insert or update a project; returns its new version stamp"""
+
+        now = datetime.utcnow()
+        values = {
+            "name": project.name,
+            "description": project.description,
+            "keywords": project.keywords,
+            "keywords_extracted": project.keywords_extracted,
+            "centroid": project.centroid.astype(np.float32).tobytes() if project.centroid is not None else None,
+            "centroid_embedder": project.centroid_embedder,
+            "updated_at": now
+        }
+
+        db = SessionLocal()
+        try:
+            version = db.execute(
+                insert(ClassifierProject)
+                .values(id=project.project_id, created_at=project.created_at or now, **values)
+                .on_conflict_do_update(
+                    index_elements=[ClassifierProject.id],
+                    set_={**values, "version": CLASSIFIER_PROJECT_VERSIONS.next_value()}
+                )
+                .returning(ClassifierProject.version)
+            ).scalar_one()
+            db.commit()
+        finally:
+            db.close()
+
+        return version
+
+    async def publish(self, project_id: str, version: int):
+        """Tell the other workers a project changed"""
+        await redis_client.publish(INVALIDATION_CHANNEL, {"project_id": project_id, "version": version})
+
+    async def listen(self, on_change: ChangeHandler):
+        """
+        Call `on_change` for every project saved by any worker (runs until cancelled)
+
+        A lost subscription is re-established with exponential backoff. Each
+        (re)subscription starts with on_change(None), since announcements
+        published while unsubscribed are missed.
+        """
+
+        delay = RESUBSCRIBE_MIN_SECONDS
+        unavailable_logged = False
+        while True:
+            if redis_client.redis is None:
+                await redis_client.connect()
+
+            pubsub = await redis_client.subscribe(INVALIDATION_CHANNEL)
+            if pubsub is None:
+                if not unavailable_logged:
+                    logger.warning("⚠️ Redis unavailable, project changes by other workers are not picked up until it is back")
+                    unavailable_logged = True
+            else:
+                unavailable_logged = False
+                try:
+                    # Changes saved before the subscription took effect
+                    await on_change(None)
+                    delay = RESUBSCRIBE_MIN_SECONDS
+
+                    async for message in pubsub.listen():
+                        if message.get("type") != "message":
+                            continue
+                        try:
+                            data = json.loads(message["data"])
+                        except (TypeError, json.JSONDecodeError):
+                            continue
+                        try:
+                            await on_change(data.get("project_id"))
+                        except Exception as e:
+                            logger.error(f"Project registry reload error: {e}")
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.warning(f"⚠️ Project registry subscription lost, re-subscribing: {e}")
+                finally:
+                    try:
+                        await pubsub.close()
+                    except Exception:
+                        pass
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RESUBSCRIBE_MAX_SECONDS)
@@ -0,0 +1,126 @@
+"""
+Shared Append-Only Index Logs
+JSONL logs that several processes append to under a file lock and tail to stay in sync
+"""
+import fcntl
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SharedLog:
+    """
+    Base for indexes persisted as an append-only JSONL log shared by every
+    process (API workers, transcription jobs)
+
+    Writers append under an exclusive file lock after catching up with lines
+    written by others; readers call `refresh()` to apply lines appended since
+    their last read. A log replaced by compaction (new inode) is re-read from
+    the start. Subclasses implement `_apply(record)` and reset their state
+    in `_clear()`, calling `_reset_log()`; they hold `_lock` while reading
+    the state that records build (API handlers run in a thread pool).
+    """
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self._lock = threading.RLock()
+        self._reset_log()
+
+    def _reset_log(self):
+        self._offset = 0  # bytes of the log applied so far
+        self._inode: Optional[int] = None
+        self._log_lines = 0
+
+    def _clear(self):
+        self._reset_log()
+
+    def _apply(self, record: Any):
+        raise NotImplementedError
+
+    def refresh(self):
+        """Apply log lines appended (by any process) since the last read"""
+
+        if not self.path:
+            return
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return
+
+        with self._lock:
+            # Compacted by another process: start over from the new file
+            if (self._inode is not None and stat.st_ino != self._inode) or stat.st_size < self._offset:
+                self._clear()
+            self._inode = stat.st_ino
+
+            if stat.st_size > self._offset:
+                with open(self.path, "rb") as f:
+                    self._read_from(f)
+
+    def _read_from(self, f):
+        f.seek(self._offset)
+        data = f.read()
+        complete = data.rfind(b"\n") + 1  # a line still being written is picked up next time
+
+        for line in data[:complete].splitlines():
+            try:
+                self._apply(json.loads(line))
+            except (json.JSONDecodeError, ValueError, TypeError):
+                continue  # torn line after a crash
+            self._log_lines += 1
+        self._offset += complete
+
+    @contextmanager
+    def _locked_log(self):
+        """The log opened for append under an exclusive lock, caught up with other writers"""
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        while True:
+            f = open(self.path, "a+b")
+            fcntl.flock(f, fcntl.LOCK_EX)
+            # Compacted (replaced) while we waited for the lock: lock the new file
+            if os.fstat(f.fileno()).st_ino == os.stat(self.path).st_ino:
+                break
+            f.close()
+
+        try:
+            stat = os.fstat(f.fileno())
+            if (self._inode is not None and stat.st_ino != self._inode) or stat.st_size < self._offset:
+                self._clear()
+            self._inode = stat.st_ino
+            self._read_from(f)
+            yield f
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+            f.close()
+
+    def _append(self, f, records: List[Any]):
+        """Append records to the locked log (they are not applied here)"""
+
+        f.seek(0, os.SEEK_END)
+        f.write(b"".join(
+            json.dumps(record, separators=(",", ":"), default=str).encode() + b"\n"
+            for record in records
+        ))
+        f.flush()
+        self._offset = f.tell()
+        self._log_lines += len(records)
+
+    def _write(self, records: List[Any]):
+        """Persist records, then apply them"""
+
+        with self._lock:
+            if self.path:
+                try:
+                    with self._locked_log() as f:
+                        self._append(f, records)
+                except OSError as e:
+                    logger.warning(f"⚠️ Could not persist index entries to {self.path}: {e}")
+
+            for record in records:
+                self._apply(record)
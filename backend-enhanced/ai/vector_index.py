@@ -0,0 +1,596 @@
+"""
+Semantic Vector Index
+Embedded meeting passages stored as int8 memory-mapped arrays per organization, with IVF search
+"""
+import glob
+import importlib.util
+import json
+import logging
+import math
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ai.meeting_index import DEFAULT_ORGANIZATION, meeting_key
+from ai.passage_index import PASSAGE_KINDS, Passage, _grown, meeting_passages
+from ai.shared_log import SharedLog
+from config import settings
+from text_embedding import embedder as hashing_embedder
+
+logger = logging.getLogger(__name__)
+
+VECTORS_LOG = "vectors.jsonl"
+
+INITIAL_CAPACITY = 1024  # rows
+EMBED_BATCH_PASSAGES = 512
+SCAN_CHUNK_ROWS = 16384  # rows dequantized at a time by a scan
+
+# IVF coarse quantizer: k-means with about sqrt(rows) lists, trained on a sample
+KMEANS_ITERATIONS = 10
+KMEANS_SAMPLE_PER_LIST = 64
+
+# Related meetings are looked up through this many passage hits per result
+SIMILAR_HITS_PER_MEETING = 10
+
+_KIND_CODES = {kind: code for code, kind in enumerate(PASSAGE_KINDS)}
+
+
+@dataclass
+class VectorHit:
+    passage: Passage
+    score: float  # cosine similarity
+
+
+@dataclass
+class SimilarMeeting:
+    meeting_id: str
+    score: float  # cosine similarity of the meetings' mean passage vectors
+    passage: Passage  # the other meeting's passage closest to this one
+
+
+# ============================================================================
+# EMBEDDERS
+# ============================================================================
+
+class LocalModelEmbedder:
+    """
+    Sentence-transformers model on CPU, loaded on first use
+
+    Vectors are L2-normalized like the hashing embedder's, so dot products
+    are cosine similarities.
+    """
+
+    def __init__(self, model_name: str = settings.VECTOR_LOCAL_MODEL, batch_size: int = 32):
+        self.model_name = model_name
+        self.name = f"local:{model_name}"
+        self.batch_size = batch_size
+
+        self._model = None
+        self._load_lock = threading.Lock()
+
+    def _get_model(self):
+        if self._model is None:
+            with self._load_lock:
+                if self._model is None:
+                    try:
+                        from sentence_transformers import SentenceTransformer
+                    except ImportError as e:
+                        raise RuntimeError("Local embeddings require the sentence-transformers package") from e
+
+                    logger.info(f"🧠 Loading local embedding model '{self.model_name}'")
+                    self._model = SentenceTransformer(self.model_name, device="cpu")
+
+        return self._model
+
+    @property
+    def dim(self) -> int:
+        return self._get_model().get_sentence_embedding_dimension()
+
+    def embed_many(self, texts: Sequence[str]) -> np.ndarray:
+        """(len(texts), dim) float32 matrix, one normalized row per text"""
+        if not texts:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        return self._get_model().encode(
+            list(texts),
+            batch_size=self.batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        ).astype(np.float32)
+
+
+def resolve_embedder(kind: str = settings.VECTOR_EMBEDDER):
+    """The configured embedder: "local" (sentence-transformers, if installed) or "hashing" """
+
+    if kind == "local":
+        if importlib.util.find_spec("sentence_transformers") is not None:
+            return LocalModelEmbedder()
+        logger.warning("⚠️ sentence-transformers is not installed, using hashing embeddings")
+    elif kind != "hashing":
+        raise ValueError(f"Unknown vector embedder: {kind}")
+    return hashing_embedder
+
+
+def quantize(vectors: np.ndarray):
+    """Per-row symmetric int8 quantization: (codes, scales) with vectors ~= codes * scales[:, None]"""
+
+    peaks = np.abs(vectors).max(axis=1) if len(vectors) else np.zeros(0, dtype=np.float32)
+    scales = (peaks / 127.0).astype(np.float32)
+    safe = np.where(scales > 0, scales, 1.0)
+    codes = np.clip(np.rint(vectors / safe[:, None]), -127, 127).astype(np.int8)
+    return codes, scales
+
+
+# ============================================================================
+# INDEX
+# ============================================================================
+
+class VectorPartition(SharedLog):
+    """
+    Embedded passages of one organization
+
+    Vectors are int8-quantized with a scale per row and stored in a
+    memory-mapped file (`vectors-<generation>.i8`), so a partition costs
+    `dim` bytes per passage on disk and only the pages a search touches in
+    memory. Passage text, metadata and scales live in a shared append-only
+    log (see SharedLog); a writer stores the vectors before appending their
+    log lines, so readers never see a row without its data.
+
+    The log starts with a header naming the embedder, dimension and vector
+    file. A header appended later (e.g. after switching embedders) starts a
+    new, empty generation; meetings are then re-embedded as they are
+    indexed again.
+
+    Below `ivf_min_rows` live passages a search scans every row. Above it,
+    an IVF coarse quantizer (spherical k-means over a sample, about
+    sqrt(rows) lists) routes each query to the `probes` closest lists, and
+    only their rows are scored. The quantizer is retrained whenever the
+    partition has doubled since it was trained.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str],
+        embedder: Any = None,
+        passage_words: int = settings.SEARCH_PASSAGE_WORDS,
+        ivf_min_rows: int = settings.VECTOR_IVF_MIN_ROWS,
+        probes: int = settings.VECTOR_IVF_PROBES
+    ):
+        super().__init__(os.path.join(directory, VECTORS_LOG) if directory else None)
+        self.directory = directory
+        self.embedder = embedder or resolve_embedder()
+        self.passage_words = passage_words
+        self.ivf_min_rows = ivf_min_rows
+        self.probes = probes
+        self._clear()
+
+        if self.path and os.path.exists(self.path):
+            self.refresh()
+            if self.rows > 2 * self.live_count + 1000:
+                self._compact()
+            logger.info(f"🧭 Vector index loaded from {self.path}: {self.live_count} passages")
+
+    def _clear(self):
+        self._reset_vectors()
+        self._header: Optional[Dict[str, Any]] = None
+        self._stale = False  # header written by a different embedder
+        self._reset_log()
+
+    def _reset_vectors(self):
+        self.passages: List[Optional[Passage]] = []
+        self.by_meeting: Dict[str, List[int]] = {}
+        self.rows = 0  # rows allocated, live or dead
+        self.live_count = 0
+
+        self._codes: Optional[np.ndarray] = None  # (capacity, dim) int8, memory-mapped when persisted
+        self._scales = np.zeros(INITIAL_CAPACITY, dtype=np.float32)
+        self._alive = np.zeros(INITIAL_CAPACITY, dtype=bool)
+        self._kinds = np.zeros(INITIAL_CAPACITY, dtype=np.int8)
+
+        self._centroids: Optional[np.ndarray] = None
+        self._lists = np.zeros(INITIAL_CAPACITY, dtype=np.int32)  # IVF list per row
+        self._assigned = 0  # rows [0, _assigned) have an IVF list
+        self._trained_rows = 0
+
+    def __len__(self) -> int:
+        return self.live_count
+
+    def __contains__(self, meeting_id: str) -> bool:
+        return meeting_id in self.by_meeting
+
+    # ========================================================================
+    # UPDATES
+    # ========================================================================
+
+    def index_meeting(self, meeting: Dict[str, Any]):
+        """(Re-)index a meeting dict"""
+        self.index_meetings([meeting])
+
+    def index_meetings(self, meetings: Sequence[Dict[str, Any]]):
+        """Embed and store the meetings' passages, replacing any indexed before"""
+
+        batch_ids: List[str] = []
+        batch: List[Passage] = []
+        for meeting in meetings:
+            batch_ids.append(meeting_key(meeting))
+            batch.extend(meeting_passages(meeting, self.passage_words))
+            if len(batch) >= EMBED_BATCH_PASSAGES:
+                self._store(batch_ids, batch)
+                batch_ids, batch = [], []
+        if batch_ids:
+            self._store(batch_ids, batch)
+
+    def ensure_meetings(self, meetings: Sequence[Dict[str, Any]]):
+        """Index the meetings that are not indexed yet (already indexed ones are kept as they are)"""
+        self.refresh()
+        missing = [meeting for meeting in meetings if meeting_key(meeting) not in self.by_meeting]
+        if missing:
+            self.index_meetings(missing)
+
+    def remove_meeting(self, meeting_id: str):
+        self._store([str(meeting_id)], [])
+
+    def _store(self, meeting_ids: List[str], passages: List[Passage]):
+        """Replace the meetings' passages with `passages` (embedded here, outside the log lock)"""
+
+        records: List[Any] = [[meeting_id, None] for meeting_id in meeting_ids]
+        if passages:
+            codes, scales = quantize(self.embedder.embed_many([passage.text for passage in passages]))
+
+        def add_rows():
+            if not passages:
+                return
+            start = self.rows
+            self._ensure_capacity(start + len(passages), codes.shape[1])
+            self._codes[start:start + len(passages)] = codes
+            if isinstance(self._codes, np.memmap):
+                self._codes.flush()
+            for offset, passage in enumerate(passages):
+                records.append([
+                    start + offset, float(scales[offset]),
+                    passage.meeting_id, passage.kind, passage.text, passage.meta
+                ])
+
+        with self._lock:
+            if not self.path:
+                add_rows()
+            else:
+                try:
+                    with self._locked_log() as f:
+                        if self._header is None or self._stale:
+                            if not passages:
+                                return  # nothing indexed in this embedder's vector space
+                            header = self._new_generation(codes.shape[1])
+                            self._append(f, [header])
+                            self._apply(header)
+                        add_rows()
+                        self._append(f, records)
+                except OSError as e:
+                    logger.warning(f"⚠️ Could not persist vector index entries: {e}")
+                    return
+
+            for record in records:
+                self._apply(record)
+
+    def _apply(self, record: Any):
+        if isinstance(record, dict):
+            # Header: a new generation starts
+            self._reset_vectors()
+            self._header = record
+            self._stale = record.get("embedder") != self.embedder.name
+            return
+        if self._stale or (self.path and self._header is None):
+            return
+
+        if record[1] is None:
+            self._remove(record[0])
+        else:
+            row, scale, meeting_id, kind, text, meta = record
+            self._add(row, scale, Passage(meeting_id, kind, text, meta))
+
+    def _add(self, row: int, scale: float, passage: Passage):
+        if row >= len(self.passages):
+            self.passages.extend([None] * (row + 1 - len(self.passages)))
+        self.passages[row] = passage
+        self.by_meeting.setdefault(passage.meeting_id, []).append(row)
+
+        self._scales = _grown(self._scales, row + 1)
+        self._alive = _grown(self._alive, row + 1)
+        self._kinds = _grown(self._kinds, row + 1)
+        self._lists = _grown(self._lists, row + 1)
+        self._scales[row] = scale
+        self._alive[row] = True
+        self._kinds[row] = _KIND_CODES.get(passage.kind, 0)
+
+        self.rows = max(self.rows, row + 1)
+        self.live_count += 1
+
+    def _remove(self, meeting_id: str):
+        for row in self.by_meeting.pop(meeting_id, []):
+            self.passages[row] = None
+            self._alive[row] = False
+            self.live_count -= 1
+
+    # ========================================================================
+    # QUERIES
+    # ========================================================================
+
+    def search(
+        self,
+        query: str,
+        k: int = settings.SEARCH_ANSWER_PASSAGES,
+        kinds: Optional[Sequence[str]] = None,
+        exclude_meeting: Optional[str] = None
+    ) -> List[VectorHit]:
+        """Top-k passages by cosine similarity to `query`, best first"""
+
+        self.refresh()
+        if not self.live_count:
+            return []
+
+        vector = self.embedder.embed_many([query])[0]
+        if not vector.any():
+            return []
+        with self._lock:
+            return self._search_vector(vector, k, kinds, exclude_meeting)
+
+    def similar_meetings(self, meeting_id: str, k: int = 5) -> List[SimilarMeeting]:
+        """
+        Indexed meetings most similar to an indexed meeting
+
+        Candidates come from a passage search with the meeting's mean vector;
+        each is scored by the cosine similarity of the two meetings' mean
+        vectors.
+        """
+
+        self.refresh()
+        with self._lock:
+            return self._similar_meetings(meeting_id, k)
+
+    def _similar_meetings(self, meeting_id: str, k: int) -> List[SimilarMeeting]:
+        rows = self.by_meeting.get(meeting_id)
+        if not rows:
+            return []
+
+        centroid = self._mean_vector(rows)
+        if centroid is None:
+            return []
+
+        best: Dict[str, Passage] = {}
+        for hit in self._search_vector(centroid, k * SIMILAR_HITS_PER_MEETING, None, meeting_id):
+            best.setdefault(hit.passage.meeting_id, hit.passage)
+
+        similar = []
+        for other, passage in best.items():
+            other_centroid = self._mean_vector(self.by_meeting[other])
+            if other_centroid is not None:
+                similar.append(SimilarMeeting(other, float(centroid @ other_centroid), passage))
+
+        similar.sort(key=lambda meeting: -meeting.score)
+        return similar[:k]
+
+    def _vectors(self, rows: np.ndarray) -> np.ndarray:
+        return self._codes[rows].astype(np.float32) * self._scales[rows, None]
+
+    def _scores(self, rows: np.ndarray, vector: np.ndarray) -> np.ndarray:
+        """Cosine similarity of each of `rows` (ascending) to `vector`"""
+
+        scores = np.empty(len(rows), dtype=np.float32)
+        for start in range(0, len(rows), SCAN_CHUNK_ROWS):
+            chunk = rows[start:start + SCAN_CHUNK_ROWS]
+            if chunk[-1] - chunk[0] + 1 == len(chunk):
+                codes = self._codes[chunk[0]:chunk[-1] + 1]  # contiguous rows: a view, no gather
+            else:
+                codes = self._codes[chunk]
+            # The per-row scale factors out of the dot product
+            scores[start:start + len(chunk)] = (codes.astype(np.float32) @ vector) * self._scales[chunk]
+        return scores
+
+    def _mean_vector(self, rows: List[int]) -> Optional[np.ndarray]:
+        self._ensure_mapped()
+        mean = self._vectors(np.sort(np.asarray(rows))).mean(axis=0)
+        norm = float(np.linalg.norm(mean))
+        return mean / norm if norm else None
+
+    def _search_vector(
+        self,
+        vector: np.ndarray,
+        k: int,
+        kinds: Optional[Sequence[str]],
+        exclude_meeting: Optional[str]
+    ) -> List[VectorHit]:
+        self._ensure_mapped()
+        self._update_quantizer()
+
+        mask = self._alive[:self.rows].copy()
+        if kinds:
+            mask &= np.isin(self._kinds[:self.rows], [_KIND_CODES[kind] for kind in kinds])
+        if exclude_meeting is not None:
+            mask[self.by_meeting.get(exclude_meeting, [])] = False
+        if self._centroids is not None and self.probes < len(self._centroids):
+            closest = np.argpartition(-(self._centroids @ vector), self.probes)[:self.probes]
+            mask &= np.isin(self._lists[:self.rows], closest)
+
+        rows = np.flatnonzero(mask)
+        scores = self._scores(rows, vector)
+
+        if len(rows) > k:
+            top = np.argpartition(-scores, k)[:k]
+            rows, scores = rows[top], scores[top]
+        order = np.lexsort((rows, -scores))
+
+        return [
+            VectorHit(passage=self.passages[rows[i]], score=float(scores[i]))
+            for i in order if scores[i] > 0
+        ]
+
+    # ------------------------------------------------------------------------
+    # IVF coarse quantizer
+    # ------------------------------------------------------------------------
+
+    def _update_quantizer(self):
+        """Train (or retrain) the IVF lists when due, and assign rows added since"""
+
+        if self.live_count < self.ivf_min_rows:
+            self._centroids = None
+            return
+        if self._centroids is None or self.live_count > 2 * self._trained_rows:
+            self._train()
+        elif self._assigned < self.rows:
+            self._assign(self._assigned, self.rows)
+
+    def _train(self):
+        lists = max(1, int(math.sqrt(self.live_count)))
+        rng = np.random.default_rng(0)
+
+        live = np.flatnonzero(self._alive[:self.rows])
+        sample = np.sort(rng.choice(live, size=min(len(live), KMEANS_SAMPLE_PER_LIST * lists), replace=False))
+        vectors = self._vectors(sample)
+        centroids = vectors[rng.choice(len(vectors), size=min(lists, len(vectors)), replace=False)]
+
+        members = np.zeros((len(vectors), len(centroids)), dtype=np.float32)
+        for _ in range(KMEANS_ITERATIONS):
+            labels = np.argmax(vectors @ centroids.T, axis=1)
+            members[:] = 0.0
+            members[np.arange(len(vectors)), labels] = 1.0
+            sums = members.T @ vectors
+            norms = np.linalg.norm(sums, axis=1)
+            filled = norms > 0  # an empty list keeps its centroid
+            centroids[filled] = sums[filled] / norms[filled, None]
+
+        self._centroids = centroids.astype(np.float32)
+        self._trained_rows = self.live_count
+        self._assign(0, self.rows)
+        logger.info(f"🧭 Trained {len(centroids)} IVF lists over {self.live_count} passages")
+
+    def _assign(self, start: int, end: int):
+        for chunk_start in range(start, end, SCAN_CHUNK_ROWS):
+            rows = np.arange(chunk_start, min(end, chunk_start + SCAN_CHUNK_ROWS))
+            self._lists[rows] = np.argmax(self._vectors(rows) @ self._centroids.T, axis=1)
+        self._assigned = end
+
+    # ========================================================================
+    # STORAGE
+    # ========================================================================
+
+    def _vector_path(self, header: Dict[str, Any]) -> str:
+        return os.path.join(self.directory, header["file"])
+
+    def _ensure_mapped(self):
+        """Map vectors appended by other processes since the file was last mapped"""
+        if self.path and self._header is not None and self.rows > (0 if self._codes is None else len(self._codes)):
+            self._map()
+
+    def _map(self):
+        path, dim = self._vector_path(self._header), self._header["dim"]
+        capacity = os.path.getsize(path) // dim
+        self._codes = np.memmap(path, dtype=np.int8, mode="r+", shape=(capacity, dim)) if capacity else None
+
+    def _ensure_capacity(self, rows: int, dim: int):
+        """Room for `rows` vectors (writers only; the vector file grows by doubling)"""
+
+        self._ensure_mapped()
+        capacity = 0 if self._codes is None else len(self._codes)
+        if rows <= capacity:
+            return
+        capacity = max(rows, 2 * capacity, INITIAL_CAPACITY)
+
+        if self.path:
+            with open(self._vector_path(self._header), "r+b") as f:
+                f.truncate(capacity * self._header["dim"])
+            self._map()
+        else:
+            codes = np.zeros((capacity, dim), dtype=np.int8)
+            if self._codes is not None:
+                codes[:len(self._codes)] = self._codes
+            self._codes = codes
+
+    def _new_generation(self, dim: int) -> Dict[str, Any]:
+        """Header of a new generation with an empty vector file (called under the log lock)"""
+
+        generation = (self._header or {}).get("generation", 0) + 1
+        header = {
+            "embedder": self.embedder.name,
+            "dim": dim,
+            "generation": generation,
+            "file": f"vectors-{generation}.i8"
+        }
+        open(self._vector_path(header), "wb").close()
+        return header
+
+    def _compact(self):
+        """Rewrite the live vectors and log lines as a new generation, dropping dead rows"""
+
+        tmp_path = self.path + ".tmp"
+        with self._locked_log():
+            if self._stale or self._header is None:
+                return
+
+            header = self._new_generation(self._header["dim"])
+            live = np.flatnonzero(self._alive[:self.rows])
+            self._ensure_mapped()
+
+            capacity = max(len(live), INITIAL_CAPACITY)
+            with open(self._vector_path(header), "r+b") as f:
+                f.truncate(capacity * header["dim"])
+            codes = np.memmap(self._vector_path(header), dtype=np.int8, mode="r+", shape=(capacity, header["dim"]))
+            for start in range(0, len(live), SCAN_CHUNK_ROWS):
+                chunk = live[start:start + SCAN_CHUNK_ROWS]
+                codes[start:start + len(chunk)] = self._codes[chunk]
+            codes.flush()
+            del codes
+
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(json.dumps(header, separators=(",", ":")) + "\n")
+                for new_row, row in enumerate(live.tolist()):
+                    passage = self.passages[row]
+                    record = [new_row, float(self._scales[row]), passage.meeting_id, passage.kind, passage.text, passage.meta]
+                    f.write(json.dumps(record, separators=(",", ":"), default=str) + "\n")
+            os.replace(tmp_path, self.path)
+
+            # Processes still mapping an old generation keep reading it until they refresh
+            for path in glob.glob(os.path.join(self.directory, "vectors-*.i8")):
+                if os.path.basename(path) != header["file"]:
+                    os.remove(path)
+
+        self._clear()
+        self.refresh()
+
+
+class VectorIndex:
+    """
+    Vector partitions by organization, loaded on first use
+
+    Loading a partition reads (and may compact) its files, so async code
+    calls `partition()` in a thread.
+    """
+
+    def __init__(self, directory: Optional[str] = settings.SEARCH_INDEX_PATH, embedder: Any = None):
+        self.directory = directory
+        self._embedder = embedder
+        self.partitions: Dict[str, VectorPartition] = {}
+        self._partitions_lock = threading.Lock()
+
+    @property
+    def embedder(self):
+        if self._embedder is None:
+            self._embedder = resolve_embedder()
+        return self._embedder
+
+    def partition(self, organization_id: Optional[Any] = None) -> VectorPartition:
+        key = str(organization_id) if organization_id else DEFAULT_ORGANIZATION
+        partition = self.partitions.get(key)
+        if partition is None:
+            with self._partitions_lock:
+                partition = self.partitions.get(key)
+                if partition is None:
+                    directory = os.path.join(self.directory, key) if self.directory else None
+                    partition = self.partitions[key] = VectorPartition(directory, self.embedder)
+        return partition
+
+
+# Shared vector index
+vector_index = VectorIndex()
@@ -4,7 +4,7 @@ Intelligently routes tasks to best AI model with fallback and parallel processin
 """
 import asyncio
 import json
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from enum import Enum
 import anthropic
 import openai
@@ -15,6 +15,7 @@ from datetime import datetime
 import logging
 
 from config import settings
+from transcription_backends import get_transcription_backend
 
 logger = logging.getLogger(__name__)
 
@@ -524,23 +525,33 @@ Return as JSON:
 
         return comprehensive_analysis
 
-    async def transcribe_audio(self, audio_file_path: str) -> Dict:
-        """Transcribe audio using Whisper API"""
+    async def transcribe_audio(
+        self,
+        audio_file_path: str,
+        backend: Optional[str] = None,
+        on_progress: Optional[Callable[[float], None]] = None
+    ) -> Dict:
+        """
+        Transcribe audio with a pluggable backend
+
+        Args:
+            audio_file_path: Path to the audio/video file
+            backend: Backend name ("openai", "local"); see resolve_transcription_backend
+            on_progress: Optional callback with the fraction of audio processed
+        """
         try:
-            with open(audio_file_path, "rb") as audio_file:
-                transcript = await self.openai_client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_file,
-                    response_format="verbose_json",
-                    timestamp_granularities=["segment", "word"]
-                )
+            transcript = await get_transcription_backend(backend).transcribe(
+                audio_file_path, on_progress=on_progress
+            )
 
             return {
                 "success": True,
                 "text": transcript.text,
-                "segments": transcript.segments if hasattr(transcript, 'segments') else [],
-                "language": transcript.language if hasattr(transcript, 'language') else "en",
-                "duration": transcript.duration if hasattr(transcript, 'duration') else None
+                "segments": transcript.segments,
+                "language": transcript.language,
+                "duration": transcript.duration,
+                "model": transcript.model,
+                "backend": transcript.backend
             }
 
         except Exception as e:
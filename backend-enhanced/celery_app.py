@@ -0,0 +1,37 @@
+"""
+Celery Application
+Background job workers (run with: celery -A celery_app worker -Q celery,transcription)
+"""
+from celery import Celery
+
+from config import settings
+
+celery_app = Celery(
+    "meeting_minutes",
+    broker=settings.CELERY_BROKER_URL,
+    backend=settings.CELERY_RESULT_BACKEND,
+    include=["transcription_tasks"]
+)
+
+celery_app.conf.update(
+    task_serializer=settings.CELERY_TASK_SERIALIZER,
+    result_serializer=settings.CELERY_RESULT_SERIALIZER,
+    accept_content=settings.CELERY_ACCEPT_CONTENT,
+    timezone=settings.CELERY_TIMEZONE,
+    task_track_started=settings.CELERY_TASK_TRACK_STARTED,
+    task_time_limit=settings.CELERY_TASK_TIME_LIMIT,
+
+    # Durable delivery: ack after the job finishes, requeue if a worker dies
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+
+    # Jobs are long; don't let one worker hoard queued recordings
+    worker_prefetch_multiplier=1,
+
+    task_routes={
+        "transcription_tasks.*": {"queue": settings.TRANSCRIPTION_QUEUE},
+    },
+)
+
+
+TRANSCRIBE_MEDIA_FILE_TASK = "transcription_tasks.transcribe_media_file"
@@ -111,6 +111,12 @@ class Settings(BaseSettings):
     CELERY_TASK_TRACK_STARTED: bool = True
     CELERY_TASK_TIME_LIMIT: int = 600  # 10 minutes
 
+    # Transcription jobs (long-running, routed to their own queue)
+    TRANSCRIPTION_QUEUE: str = Field(default="transcription", env="TRANSCRIPTION_QUEUE")
+    TRANSCRIPTION_TASK_TIME_LIMIT: int = Field(default=3600, env="TRANSCRIPTION_TASK_TIME_LIMIT")
+    TRANSCRIPTION_MAX_RETRIES: int = Field(default=3, env="TRANSCRIPTION_MAX_RETRIES")
+    TRANSCRIPTION_RETRY_BACKOFF_SECONDS: int = Field(default=30, env="TRANSCRIPTION_RETRY_BACKOFF_SECONDS")
+
     # ============================================================================
     # Security & Authentication
     # ============================================================================
@@ -159,11 +165,79 @@ class Settings(BaseSettings):
     AI_TIMEOUT: int = 60
     AI_MAX_RETRIES: int = 3
 
+    # Local hashing embeddings (text_embedding.py): vector width
+    EMBEDDING_HASH_DIM: int = Field(default=1024, env="EMBEDDING_HASH_DIM")
+
+    # Project classifier (ai/project_classifier.py): projects, their extracted keywords and
+    # centroids are kept in PostgreSQL; workers load them at startup and reload on a Redis signal
+    PROJECT_REGISTRY_ENABLED: bool = Field(default=True, env="PROJECT_REGISTRY_ENABLED")
+    # Action items that name no meeting project go to the primary one; when enabled,
+    # they are assigned by one batched model call per meeting instead
+    PROJECT_TASK_MODEL_CLASSIFICATION: bool = Field(default=False, env="PROJECT_TASK_MODEL_CLASSIFICATION")
+
+    # ============================================================================
+    # Transcription
+    # ============================================================================
+    TRANSCRIPTION_BACKEND: str = Field(default="openai", env="TRANSCRIPTION_BACKEND")  # openai, local
+    LOCAL_WHISPER_MODEL: str = Field(default="small", env="LOCAL_WHISPER_MODEL")
+    LOCAL_WHISPER_COMPUTE_TYPE: str = Field(default="int8", env="LOCAL_WHISPER_COMPUTE_TYPE")
+    LOCAL_WHISPER_CPU_THREADS: int = Field(default=4, env="LOCAL_WHISPER_CPU_THREADS")
+    LOCAL_WHISPER_BATCH_SIZE: int = Field(default=8, env="LOCAL_WHISPER_BATCH_SIZE")
+    LOCAL_WHISPER_MAX_CONCURRENCY: int = Field(default=1, env="LOCAL_WHISPER_MAX_CONCURRENCY")
+
+    DIARIZATION_ENABLED: bool = Field(default=True, env="DIARIZATION_ENABLED")
+    DIARIZATION_MAX_SPEAKERS: int = Field(default=8, env="DIARIZATION_MAX_SPEAKERS")
+
+    # ============================================================================
+    # Meeting Copilot
+    # ============================================================================
+    # Action-item extraction is micro-batched per session: a batch is sent when
+    # it reaches either size limit or its oldest segment has waited this long
+    COPILOT_BATCH_MAX_WAIT_SECONDS: float = Field(default=8.0, env="COPILOT_BATCH_MAX_WAIT_SECONDS")
+    COPILOT_BATCH_MAX_SEGMENTS: int = Field(default=16, env="COPILOT_BATCH_MAX_SEGMENTS")
+    COPILOT_BATCH_MAX_TOKENS: int = Field(default=2000, env="COPILOT_BATCH_MAX_TOKENS")
+
+    # Rolling summary tree: segments per chunk summary, summaries per roll-up
+    COPILOT_SUMMARY_CHUNK_SEGMENTS: int = Field(default=20, env="COPILOT_SUMMARY_CHUNK_SEGMENTS")
+    COPILOT_SUMMARY_CHUNK_TOKENS: int = Field(default=1500, env="COPILOT_SUMMARY_CHUNK_TOKENS")
+    COPILOT_SUMMARY_FANOUT: int = Field(default=4, env="COPILOT_SUMMARY_FANOUT")
+
+    # Session state: "redis" shares sessions across workers (each meeting is
+    # owned by one worker on a consistent-hash ring), "memory" keeps them in-process
+    COPILOT_STATE_BACKEND: str = Field(default="redis", env="COPILOT_STATE_BACKEND")
+    COPILOT_STATE_TTL_SECONDS: int = Field(default=21600, env="COPILOT_STATE_TTL_SECONDS")
+    COPILOT_HEARTBEAT_SECONDS: float = Field(default=5.0, env="COPILOT_HEARTBEAT_SECONDS")
+    COPILOT_WORKER_TTL_SECONDS: float = Field(default=15.0, env="COPILOT_WORKER_TTL_SECONDS")
+    COPILOT_RING_VNODES: int = Field(default=64, env="COPILOT_RING_VNODES")
+    COPILOT_FORWARD_TIMEOUT_SECONDS: float = Field(default=60.0, env="COPILOT_FORWARD_TIMEOUT_SECONDS")
+
+    # Per-session memory: the most recent segments/insights stay in RAM, older
+    # ones only in Redis. The cap covers these windows, not the summary tree.
+    # Without Redis (or with COPILOT_STATE_BACKEND=memory) older items are
+    # dropped, so history beyond the windows is lost for those sessions
+    COPILOT_SEGMENT_WINDOW: int = Field(default=500, env="COPILOT_SEGMENT_WINDOW")
+    COPILOT_INSIGHT_WINDOW: int = Field(default=100, env="COPILOT_INSIGHT_WINDOW")
+    COPILOT_SESSION_MAX_MEMORY_KB: int = Field(default=1024, env="COPILOT_SESSION_MAX_MEMORY_KB")
+
+    # Agenda tracking by cosine similarity of segments to agenda item vectors:
+    # off-topic below the threshold for every item; auto-advance when a later
+    # item's smoothed similarity leads the current one by the margin
+    COPILOT_OFF_TOPIC_SIMILARITY: float = Field(default=0.05, env="COPILOT_OFF_TOPIC_SIMILARITY")
+    COPILOT_AGENDA_SMOOTHING: float = Field(default=0.3, env="COPILOT_AGENDA_SMOOTHING")
+    COPILOT_AGENDA_TRANSITION_SIMILARITY: float = Field(default=0.08, env="COPILOT_AGENDA_TRANSITION_SIMILARITY")
+    COPILOT_AGENDA_TRANSITION_MARGIN: float = Field(default=0.04, env="COPILOT_AGENDA_TRANSITION_MARGIN")
+    COPILOT_AGENDA_MIN_SEGMENTS: int = Field(default=3, env="COPILOT_AGENDA_MIN_SEGMENTS")
+
+    # Questions and blockers raised live are looked up in the organization's
+    # semantic index; up to this many earlier passages surface as context
+    COPILOT_CONTEXT_HITS: int = Field(default=2, env="COPILOT_CONTEXT_HITS")
+
     # ============================================================================
     # Media Storage
     # ============================================================================
     MEDIA_UPLOAD_DIR: str = Field(default="./uploads", env="MEDIA_UPLOAD_DIR")
     MEDIA_MAX_SIZE_MB: int = Field(default=100, env="MEDIA_MAX_SIZE_MB")
+    MEDIA_UPLOAD_CHUNK_MAX_MB: int = Field(default=16, env="MEDIA_UPLOAD_CHUNK_MAX_MB")
     MEDIA_ALLOWED_AUDIO_FORMATS: List[str] = [
         "mp3", "wav", "m4a", "ogg", "flac", "aac"
     ]
@@ -259,17 +333,52 @@ class Settings(BaseSettings):
     SEARCH_ENABLED: bool = True
     SEARCH_INDEX_PATH: str = Field(default="./search_index", env="SEARCH_INDEX_PATH")
 
+    # Decision conflict LSH: bands x rows MinHash values per decision
+    # (candidate threshold is roughly (1/bands) ** (1/rows) Jaccard similarity)
+    DECISION_LSH_BANDS: int = Field(default=32, env="DECISION_LSH_BANDS")
+    DECISION_LSH_ROWS: int = Field(default=2, env="DECISION_LSH_ROWS")
+
+    # BM25 passage search behind answer_question: transcript segments are
+    # grouped into passages of about this many words; answers are generated
+    # from the top SEARCH_ANSWER_PASSAGES passages
+    SEARCH_PASSAGE_WORDS: int = Field(default=80, env="SEARCH_PASSAGE_WORDS")
+    SEARCH_ANSWER_PASSAGES: int = Field(default=8, env="SEARCH_ANSWER_PASSAGES")
+
     # Vector Search (Semantic)
     VECTOR_SEARCH_ENABLED: bool = True
     EMBEDDING_MODEL: str = "text-embedding-3-small"
     VECTOR_DIMENSION: int = 1536
 
+    # Semantic passage index (ai/vector_index.py): "local" embeds with a
+    # sentence-transformers model on CPU, "hashing" with the feature-hashing
+    # embedder (no model download, used when sentence-transformers is missing).
+    # Above VECTOR_IVF_MIN_ROWS passages, searches probe VECTOR_IVF_PROBES
+    # IVF lists instead of scanning every vector.
+    VECTOR_EMBEDDER: str = Field(default="local", env="VECTOR_EMBEDDER")  # local, hashing
+    VECTOR_LOCAL_MODEL: str = Field(default="sentence-transformers/all-MiniLM-L6-v2", env="VECTOR_LOCAL_MODEL")
+    VECTOR_IVF_MIN_ROWS: int = Field(default=20000, env="VECTOR_IVF_MIN_ROWS")
+    VECTOR_IVF_PROBES: int = Field(default=8, env="VECTOR_IVF_PROBES")
+    # Minimum cosine similarity for related meetings and copilot context hits
+    VECTOR_MIN_SIMILARITY: float = Field(default=0.35, env="VECTOR_MIN_SIMILARITY")
+
     # ============================================================================
     # Analytics
     # ============================================================================
     ANALYTICS_ENABLED: bool = True
     ANALYTICS_RETENTION_DAYS: int = 90
 
+    # Open action items by assignee and due date (deadline_index.py): two
+    # deadlines closer than DEADLINE_CONFLICT_HOURS conflict, more open items
+    # than DEADLINE_OVERLOAD_THRESHOLD overload an assignee. Each worker
+    # applies its own commits immediately and reloads from the database
+    # every DEADLINE_INDEX_REFRESH_SECONDS to pick up other workers' writes.
+    DEADLINE_CONFLICT_HOURS: int = Field(default=48, env="DEADLINE_CONFLICT_HOURS")
+    DEADLINE_OVERLOAD_THRESHOLD: int = Field(default=5, env="DEADLINE_OVERLOAD_THRESHOLD")
+    DEADLINE_INDEX_REFRESH_SECONDS: float = Field(default=300.0, env="DEADLINE_INDEX_REFRESH_SECONDS")
+
+    # Task dependency graphs (ai/dependency_graph.py), one shared log per organization
+    DEPENDENCY_GRAPH_PATH: str = Field(default="./dependency_graphs", env="DEPENDENCY_GRAPH_PATH")
+
     # ============================================================================
     # Compliance & Data Retention
     # ============================================================================
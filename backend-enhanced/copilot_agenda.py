@@ -0,0 +1,107 @@
+"""
+Copilot Agenda Tracking
+Agenda items embedded once per session; each segment is scored against all of them at once
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from config import settings
+from text_embedding import HashingEmbedder, embedder as default_embedder, idf_weights
+
+# Short remarks ("sounds good", "next slide") are never flagged as off-topic
+OFF_TOPIC_MIN_WORDS = 10
+
+
+@dataclass
+class AgendaScore:
+    """How one segment relates to the agenda"""
+    similarities: np.ndarray  # cosine similarity per agenda item
+    off_topic: bool
+    transition_to: Optional[int] = None  # later agenda item the discussion has moved to
+
+    @property
+    def best_index(self) -> int:
+        return int(np.argmax(self.similarities))
+
+
+class AgendaTracker:
+    """
+    Vector agenda tracking for one session
+
+    The title and description of every agenda item are embedded into one
+    matrix at session start, with IDF weights fitted on the agenda itself so
+    words shared by every item count for little. Each segment is embedded
+    once and scored against all items with a single sparse matrix product.
+
+    - Off-topic: a substantial segment resembling no agenda item
+    - Transition: an exponential moving average of the similarities, so one
+      stray remark doesn't move the agenda; once a later item leads the
+      current one by the margin (after a minimum number of segments on the
+      current item), the discussion has moved on to it
+    """
+
+    def __init__(
+        self,
+        agenda_items: List[Dict[str, Any]],
+        embedder: HashingEmbedder = default_embedder,
+        off_topic_similarity: float = settings.COPILOT_OFF_TOPIC_SIMILARITY,
+        smoothing: float = settings.COPILOT_AGENDA_SMOOTHING,
+        transition_similarity: float = settings.COPILOT_AGENDA_TRANSITION_SIMILARITY,
+        transition_margin: float = settings.COPILOT_AGENDA_TRANSITION_MARGIN,
+        min_segments: int = settings.COPILOT_AGENDA_MIN_SEGMENTS
+    ):
+        self.embedder = embedder
+        self.off_topic_similarity = off_topic_similarity
+        self.smoothing = smoothing
+        self.transition_similarity = transition_similarity
+        self.transition_margin = transition_margin
+        self.min_segments = min_segments
+
+        texts = [self.item_text(item) for item in agenda_items]
+        self.idf = idf_weights(texts)
+        self.matrix = embedder.embed_many(texts, self.idf)
+
+        self.smoothed = np.zeros(len(texts), dtype=np.float32)
+        self._tracked_index: Optional[int] = None
+        self._segments_on_item = 0
+
+    @staticmethod
+    def item_text(item: Dict[str, Any]) -> str:
+        return " ".join(str(item[key]) for key in ("title", "description") if item.get(key))
+
+    def score(self, text: str) -> np.ndarray:
+        """Cosine similarity of the text to every agenda item"""
+        return self.embedder.similarities(self.matrix, text, self.idf)
+
+    def observe(self, text: str, current_index: int) -> AgendaScore:
+        """Score a segment spoken while `current_index` is the current agenda item"""
+
+        similarities = self.score(text)
+
+        # Manual agenda moves reset the dwell count too
+        if current_index != self._tracked_index:
+            self._tracked_index = current_index
+            self._segments_on_item = 0
+        self._segments_on_item += 1
+
+        self.smoothed *= 1.0 - self.smoothing
+        self.smoothed += self.smoothing * similarities
+
+        on_agenda = current_index < len(self.smoothed)
+        off_topic = (
+            on_agenda
+            and len(text.split()) > OFF_TOPIC_MIN_WORDS
+            and float(similarities.max(initial=0.0)) < self.off_topic_similarity
+        )
+
+        transition_to = None
+        later = self.smoothed[current_index + 1:] if on_agenda else self.smoothed[:0]
+        if later.size and self._segments_on_item >= self.min_segments:
+            candidate = current_index + 1 + int(np.argmax(later))
+            lead = self.smoothed[candidate] - self.smoothed[current_index]
+            if self.smoothed[candidate] >= self.transition_similarity and lead >= self.transition_margin:
+                transition_to = candidate
+
+        return AgendaScore(similarities=similarities, off_topic=off_topic, transition_to=transition_to)
@@ -0,0 +1,218 @@
+"""
+Copilot Micro-Batching
+Collects a session's transcript segments and extracts action items with one LLM call per batch
+"""
+import asyncio
+import json
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set
+
+from ai_multi_model import orchestrator, ModelType
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+MAX_ITEMS_PER_SEGMENT = 3
+
+_NUMBERED_LINE = re.compile(r"^\s*\[?(\d+)[\]\).:-]\s*(.+)$")
+
+
+@dataclass
+class PendingSegment:
+    """A segment waiting for extraction; `ref` is whatever the caller needs to map results back"""
+    ref: Any
+    text: str
+
+
+@dataclass
+class BatchResult:
+    """Action items extracted for one originating segment"""
+    ref: Any
+    text: str
+    items: List[str]
+
+
+def estimate_tokens(text: str) -> int:
+    # ~4 characters per token is close enough for budgeting
+    return len(text) // 4 + 1
+
+
+class ActionItemBatcher:
+    """
+    Per-session micro-batcher for action-item extraction
+
+    Segments are queued with `submit()`. A batch is sent as one provider call
+    when it reaches `max_segments` or `max_tokens`, or `max_wait_seconds` after
+    its first segment arrived. Results are collected in the background and
+    handed out by `drain()`; `flush()` forces the pending batch and waits for
+    everything in flight (used at end of session).
+    """
+
+    def __init__(
+        self,
+        max_wait_seconds: float = settings.COPILOT_BATCH_MAX_WAIT_SECONDS,
+        max_segments: int = settings.COPILOT_BATCH_MAX_SEGMENTS,
+        max_tokens: int = settings.COPILOT_BATCH_MAX_TOKENS
+    ):
+        self.max_wait_seconds = max_wait_seconds
+        self.max_segments = max_segments
+        self.max_tokens = max_tokens
+
+        self._pending: List[PendingSegment] = []
+        self._pending_tokens = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._in_flight: Set[asyncio.Task] = set()
+        self._completed: List[BatchResult] = []
+
+        # Stats
+        self.batches_sent = 0
+        self.segments_submitted = 0
+
+    def submit(self, ref: Any, text: str):
+        """Queue a segment; may dispatch a batch immediately"""
+
+        tokens = estimate_tokens(text)
+
+        # Keep the batch within the token budget
+        if self._pending and self._pending_tokens + tokens > self.max_tokens:
+            self._dispatch()
+
+        self._pending.append(PendingSegment(ref=ref, text=text))
+        self._pending_tokens += tokens
+        self.segments_submitted += 1
+
+        if len(self._pending) >= self.max_segments or self._pending_tokens >= self.max_tokens:
+            self._dispatch()
+        elif self._timer is None:
+            loop = asyncio.get_running_loop()
+            self._timer = loop.call_later(self.max_wait_seconds, self._dispatch)
+
+    def drain(self) -> List[BatchResult]:
+        """Results that completed since the last drain"""
+
+        completed, self._completed = self._completed, []
+        return completed
+
+    async def flush(self) -> List[BatchResult]:
+        """Send whatever is pending, wait for all in-flight batches, then drain"""
+
+        self._dispatch()
+        if self._in_flight:
+            await asyncio.gather(*list(self._in_flight), return_exceptions=True)
+        return self.drain()
+
+    def close(self):
+        """Drop pending work (session discarded)"""
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for task in self._in_flight:
+            task.cancel()
+        self._pending, self._pending_tokens = [], 0
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    # ========================================================================
+    # INTERNALS
+    # ========================================================================
+
+    def _dispatch(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._pending:
+            return
+
+        batch, self._pending, self._pending_tokens = self._pending, [], 0
+        self.batches_sent += 1
+
+        task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _run_batch(self, batch: List[PendingSegment]):
+        try:
+            items_by_index = await extract_action_items_batch([seg.text for seg in batch])
+        except Exception as e:
+            logger.error(f"❌ Batched action item extraction failed ({len(batch)} segments): {e}")
+            return
+
+        for i, seg in enumerate(batch):
+            items = items_by_index.get(i)
+            if items:
+                self._completed.append(BatchResult(ref=seg.ref, text=seg.text, items=items))
+
+
+async def extract_action_items_batch(texts: List[str]) -> Dict[int, List[str]]:
+    """
+    Extract action items from several segments with one provider call
+
+    Returns:
+        {segment index: [action item, ...]} for segments that contain any
+    """
+
+    numbered = "\n".join(f"[{i + 1}] {text}" for i, text in enumerate(texts))
+
+    prompt = f"""Extract action items from these numbered meeting transcript segments.
+
+Segments:
+{numbered}
+
+Return JSON only: an object mapping segment number to a list of action item descriptions,
+e.g. {{"2": ["Send the report to finance"]}}. Omit segments without action items.
+If there are none at all, return {{}}."""
+
+    result = await orchestrator.generate(
+        prompt,
+        model_type=ModelType.SUMMARY,
+        prefer_speed=True,
+        max_cost=0.01
+    )
+
+    return parse_batch_response(result["response"], len(texts))
+
+
+def parse_batch_response(response: str, count: int) -> Dict[int, List[str]]:
+    """Map a batch response back to 0-based segment indices (JSON, or "N: item" lines)"""
+
+    items: Dict[int, List[str]] = {}
+
+    match = re.search(r"\{.*\}", response, re.DOTALL)
+    if match:
+        try:
+            data = json.loads(match.group(0))
+        except json.JSONDecodeError:
+            data = None
+
+        if isinstance(data, dict):
+            for key, values in data.items():
+                try:
+                    index = int(key) - 1
+                except (TypeError, ValueError):
+                    continue
+                if isinstance(values, str):
+                    values = [values]
+                if 0 <= index < count and isinstance(values, list):
+                    cleaned = [str(v).strip() for v in values if str(v).strip()]
+                    if cleaned:
+                        items[index] = cleaned[:MAX_ITEMS_PER_SEGMENT]
+            return items
+
+    # Fallback: numbered lines
+    for line in response.splitlines():
+        line_match = _NUMBERED_LINE.match(line)
+        if not line_match:
+            continue
+        index = int(line_match.group(1)) - 1
+        if 0 <= index < count:
+            bucket = items.setdefault(index, [])
+            if len(bucket) < MAX_ITEMS_PER_SEGMENT:
+                bucket.append(line_match.group(2).strip())
+
+    return items
@@ -0,0 +1,178 @@
+"""
+Copilot Meeting Metrics
+Running aggregates updated once per transcript segment, so reading them never rescans the meeting
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from transcription_service import TranscriptSegment
+
+# Time series bucket: [segments, words, questions, decisions] per minute of meeting time
+SERIES_SEGMENTS, SERIES_WORDS, SERIES_QUESTIONS, SERIES_DECISIONS = range(4)
+
+# Stored as one hash field each; per-speaker, per-agenda-item and per-minute
+# values go under "speaker:<id>", "agenda:<index>" and "series:<index>:<minute>"
+SCALAR_FIELDS = ("segments", "words", "talk_seconds", "questions", "decisions", "first_start", "last_end")
+
+
+@dataclass
+class AgendaItemMetrics:
+    """Aggregates for the discussion while one agenda item was current"""
+    segments: int = 0
+    words: int = 0
+    talk_seconds: float = 0.0
+    questions: int = 0
+    decisions: int = 0
+    series: Dict[int, List[int]] = field(default_factory=dict)  # minute -> bucket
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "segments": self.segments,
+            "words": self.words,
+            "talk_seconds": self.talk_seconds,
+            "questions": self.questions,
+            "decisions": self.decisions,
+            "series": {str(minute): bucket for minute, bucket in self.series.items()}
+        }
+
+    def totals(self) -> List[float]:
+        """The scalar aggregates without the time series, as stored"""
+        return [self.segments, self.words, self.talk_seconds, self.questions, self.decisions]
+
+
+@dataclass
+class MeetingMetrics:
+    """
+    Running meeting aggregates
+
+    `add_segment()` is O(1) per segment; every read (live metrics, the
+    end-of-meeting summary, quality scoring) uses the totals directly.
+    Rates are per minute of transcribed meeting time.
+    """
+    segments: int = 0
+    words: int = 0
+    talk_seconds: float = 0.0
+    talk_seconds_by_speaker: Dict[str, float] = field(default_factory=dict)
+    questions: int = 0
+    decisions: int = 0
+    first_start: Optional[float] = None
+    last_end: float = 0.0
+    agenda: Dict[int, AgendaItemMetrics] = field(default_factory=dict)
+
+    def add_segment(
+        self,
+        segment: TranscriptSegment,
+        agenda_index: int,
+        is_question: bool = False,
+        is_decision: bool = False
+    ):
+        words = len(segment.text.split())
+        talk = max(segment.end_time - segment.start_time, 0.0)
+
+        self.segments += 1
+        self.words += words
+        self.talk_seconds += talk
+        self.questions += is_question
+        self.decisions += is_decision
+
+        if segment.speaker_id:
+            self.talk_seconds_by_speaker[segment.speaker_id] = \
+                self.talk_seconds_by_speaker.get(segment.speaker_id, 0.0) + talk
+
+        if self.first_start is None:
+            self.first_start = segment.start_time
+        self.last_end = max(self.last_end, segment.end_time)
+
+        item = self._agenda_item(agenda_index)
+        item.segments += 1
+        item.words += words
+        item.talk_seconds += talk
+        item.questions += is_question
+        item.decisions += is_decision
+
+        minute = int(segment.start_time // 60)
+        bucket = item.series.get(minute)
+        if bucket is None:
+            bucket = item.series[minute] = [0, 0, 0, 0]
+        bucket[SERIES_SEGMENTS] += 1
+        bucket[SERIES_WORDS] += words
+        bucket[SERIES_QUESTIONS] += is_question
+        bucket[SERIES_DECISIONS] += is_decision
+
+    @property
+    def minutes(self) -> float:
+        """Transcribed meeting time covered so far"""
+        if self.first_start is None:
+            return 0.0
+        return (self.last_end - self.first_start) / 60
+
+    def per_minute(self, count: int) -> float:
+        minutes = self.minutes
+        return round(count / minutes, 2) if minutes > 0 else 0.0
+
+    def talk_time_percentages(self) -> Dict[str, float]:
+        total = sum(self.talk_seconds_by_speaker.values())
+        return {
+            speaker: (seconds / total * 100) if total > 0 else 0
+            for speaker, seconds in self.talk_seconds_by_speaker.items()
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current aggregates, ready to return from the API"""
+
+        return {
+            "segments": self.segments,
+            "total_words": self.words,
+            "talk_seconds": round(self.talk_seconds, 1),
+            "speaker_talk_seconds": {
+                speaker: round(seconds, 1) for speaker, seconds in self.talk_seconds_by_speaker.items()
+            },
+            "speaker_talk_time": self.talk_time_percentages(),
+            "words_per_minute": self.per_minute(self.words),
+            "questions_per_minute": self.per_minute(self.questions),
+            "decisions_per_minute": self.per_minute(self.decisions),
+            "agenda_items": {str(index): item.to_dict() for index, item in self.agenda.items()}
+        }
+
+    # ------------------------------------------------------------------------
+    # Stored form: a flat hash, so each segment rewrites only what it changed
+    # ------------------------------------------------------------------------
+
+    def _scalar_fields(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in SCALAR_FIELDS}
+
+    def segment_fields(self, segment: TranscriptSegment, agenda_index: int) -> Dict[str, Any]:
+        """Stored fields changed by `add_segment()` for this segment"""
+
+        item = self.agenda[agenda_index]
+        minute = int(segment.start_time // 60)
+        fields = {
+            **self._scalar_fields(),
+            f"agenda:{agenda_index}": item.totals(),
+            f"series:{agenda_index}:{minute}": item.series[minute]
+        }
+        if segment.speaker_id:
+            fields[f"speaker:{segment.speaker_id}"] = self.talk_seconds_by_speaker[segment.speaker_id]
+        return fields
+
+    @classmethod
+    def from_fields(cls, fields: Dict[str, Any]) -> "MeetingMetrics":
+        metrics = cls(**{name: fields[name] for name in SCALAR_FIELDS if name in fields})
+
+        for key, value in fields.items():
+            kind, _, rest = key.partition(":")
+            if kind == "speaker":
+                metrics.talk_seconds_by_speaker[rest] = value
+            elif kind == "agenda":
+                item = metrics._agenda_item(int(rest))
+                item.segments, item.words, item.talk_seconds, item.questions, item.decisions = value
+            elif kind == "series":
+                index, minute = rest.split(":")
+                metrics._agenda_item(int(index)).series[int(minute)] = value
+        return metrics
+
+    def _agenda_item(self, index: int) -> AgendaItemMetrics:
+        item = self.agenda.get(index)
+        if item is None:
+            item = self.agenda[index] = AgendaItemMetrics()
+        return item
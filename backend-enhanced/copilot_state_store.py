@@ -0,0 +1,474 @@
+"""
+Copilot Session Store
+Redis-backed copilot session state and consistent-hash session ownership across workers
+"""
+import asyncio
+import bisect
+import hashlib
+import json
+import logging
+import os
+import socket
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from config import settings
+from redis_client import redis_client
+from transcription_service import TranscriptSegment
+
+logger = logging.getLogger(__name__)
+
+WORKERS_KEY = "copilot:workers"
+
+# op handler on the owning worker: handler(op, meeting_id, payload) -> JSON-serializable result
+OpHandler = Callable[[str, str, Any], Awaitable[Any]]
+RingChangeHandler = Callable[[], Awaitable[None]]
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), default=str)
+
+
+def _session_key(meeting_id: str, part: str) -> str:
+    return f"copilot:session:{meeting_id}:{part}"
+
+
+def _inbox_channel(worker_id: str) -> str:
+    return f"copilot:worker:{worker_id}"
+
+
+# ============================================================================
+# COMPACT ENCODING
+# ============================================================================
+# Segments and insights are stored as positional JSON arrays, not objects
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def to_epoch(value: datetime) -> float:
+    """Naive UTC datetime -> epoch seconds (independent of the worker's local timezone)"""
+    return (value - _EPOCH).total_seconds()
+
+
+def from_epoch(seconds: float) -> datetime:
+    return _EPOCH + timedelta(seconds=seconds)
+
+
+def encode_segment(segment: TranscriptSegment) -> list:
+    return [segment.start_time, segment.end_time, segment.speaker_id, segment.text, segment.confidence, segment.language]
+
+
+def decode_segment(data: Sequence) -> TranscriptSegment:
+    start_time, end_time, speaker_id, text, confidence, language = data
+    return TranscriptSegment(
+        text=text,
+        start_time=start_time,
+        end_time=end_time,
+        speaker_id=speaker_id,
+        confidence=confidence,
+        language=language
+    )
+
+
+def encode_insight(insight: Any) -> list:
+    """[type, content, confidence, timestamp (epoch seconds), context]"""
+    return [insight.type, insight.content, insight.confidence, to_epoch(insight.timestamp), insight.context]
+
+
+@dataclass
+class StoredSession:
+    """Session state as loaded from Redis: scalar fields, counters and the tails of the logs"""
+    fields: Dict[str, Any]
+    segments: List[TranscriptSegment]  # most recent segments
+    segment_count: int
+    insights: List[list]  # most recent encoded insights, in detection order
+    insight_counts: Dict[str, int]  # insight type -> total
+    participation: Dict[str, int]
+    metrics: Dict[str, Any]  # flat meeting metric fields (see copilot_metrics)
+
+
+# ============================================================================
+# STATE STORE
+# ============================================================================
+
+class CopilotStateStore:
+    """
+    Copilot session state in Redis
+
+    Per meeting:
+    - `...:meta`          hash of scalar fields (JSON values): mode, agenda, counters, summary tree
+    - `...:segments`      list, one compact segment per RPUSH (append-only)
+    - `...:insights`      list, one compact insight per RPUSH (append-only)
+    - `...:counts`        hash, insight type -> total (HINCRBY)
+    - `...:participation` hash, speaker -> turns (HINCRBY)
+    - `...:metrics`       hash of meeting metric fields (JSON values), only the changed ones written per segment
+
+    Writes for one processed segment go out in a single pipeline. Every key
+    carries the session TTL so abandoned sessions expire. All methods are
+    no-ops (returning False/None) until enabled, or while Redis is unavailable.
+    """
+
+    PARTS = ("meta", "segments", "insights", "counts", "participation", "metrics")
+
+    def __init__(self, ttl_seconds: int = settings.COPILOT_STATE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self.enabled = False
+
+    @property
+    def available(self) -> bool:
+        return self.enabled and redis_client.redis is not None
+
+    async def create(self, meeting_id: str, fields: Dict[str, Any]) -> bool:
+        """Start a fresh session, replacing any previous state for the meeting"""
+
+        if not self.available:
+            return False
+        try:
+            pipe = redis_client.redis.pipeline(transaction=True)
+            pipe.delete(*(_session_key(meeting_id, part) for part in self.PARTS))
+            pipe.hset(_session_key(meeting_id, "meta"), mapping={k: _dumps(v) for k, v in fields.items()})
+            pipe.expire(_session_key(meeting_id, "meta"), self.ttl_seconds)
+            await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Copilot state create error for meeting {meeting_id}: {e}")
+            return False
+
+    async def append(
+        self,
+        meeting_id: str,
+        segment: Optional[TranscriptSegment] = None,
+        insights: Iterable[Any] = (),
+        speaker: Optional[str] = None,
+        fields: Optional[Dict[str, Any]] = None,
+        metrics: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """Record one step of session progress in a single round trip"""
+
+        if not self.available:
+            return False
+
+        insights = list(insights)
+        if segment is None and not insights and not speaker and not fields and not metrics:
+            return True
+
+        try:
+            pipe = redis_client.redis.pipeline(transaction=False)
+            if segment is not None:
+                pipe.rpush(_session_key(meeting_id, "segments"), _dumps(encode_segment(segment)))
+            if insights:
+                pipe.rpush(_session_key(meeting_id, "insights"), *(_dumps(encode_insight(i)) for i in insights))
+                for insight in insights:
+                    pipe.hincrby(_session_key(meeting_id, "counts"), insight.type, 1)
+            if speaker:
+                pipe.hincrby(_session_key(meeting_id, "participation"), speaker, 1)
+            if fields:
+                pipe.hset(_session_key(meeting_id, "meta"), mapping={k: _dumps(v) for k, v in fields.items()})
+            if metrics:
+                pipe.hset(_session_key(meeting_id, "metrics"), mapping={k: _dumps(v) for k, v in metrics.items()})
+            for part in self.PARTS:
+                pipe.expire(_session_key(meeting_id, part), self.ttl_seconds)
+            await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Copilot state append error for meeting {meeting_id}: {e}")
+            return False
+
+    async def update_fields(self, meeting_id: str, **fields: Any) -> bool:
+        return await self.append(meeting_id, fields=fields)
+
+    async def load(self, meeting_id: str, segment_tail: int, insight_tail: int) -> Optional[StoredSession]:
+        """
+        Session state with only the last `segment_tail` segments and
+        `insight_tail` insights, or None if the meeting has no stored session
+        """
+
+        if not self.available:
+            return None
+        try:
+            pipe = redis_client.redis.pipeline(transaction=True)
+            pipe.hgetall(_session_key(meeting_id, "meta"))
+            pipe.lrange(_session_key(meeting_id, "segments"), -segment_tail, -1)
+            pipe.llen(_session_key(meeting_id, "segments"))
+            pipe.lrange(_session_key(meeting_id, "insights"), -insight_tail, -1)
+            pipe.hgetall(_session_key(meeting_id, "counts"))
+            pipe.hgetall(_session_key(meeting_id, "participation"))
+            pipe.hgetall(_session_key(meeting_id, "metrics"))
+            meta, segments, segment_count, insights, counts, participation, metrics = await pipe.execute()
+        except Exception as e:
+            logger.error(f"Copilot state load error for meeting {meeting_id}: {e}")
+            return None
+
+        if not meta:
+            return None
+
+        return StoredSession(
+            fields={k: json.loads(v) for k, v in meta.items()},
+            segments=[decode_segment(json.loads(s)) for s in segments],
+            segment_count=int(segment_count),
+            insights=[json.loads(i) for i in insights],
+            insight_counts={insight_type: int(n) for insight_type, n in counts.items()},
+            participation={speaker: int(turns) for speaker, turns in participation.items()},
+            metrics={k: json.loads(v) for k, v in metrics.items()}
+        )
+
+    async def iter_segments(
+        self,
+        meeting_id: str,
+        start: int = 0,
+        stop: Optional[int] = None,
+        batch_size: int = 500
+    ) -> AsyncIterator[TranscriptSegment]:
+        """Stream stored segments [start, stop) in pages, oldest first"""
+
+        if not self.available:
+            return
+
+        position = start
+        while stop is None or position < stop:
+            last = position + batch_size - 1 if stop is None else min(position + batch_size, stop) - 1
+            try:
+                page = await redis_client.redis.lrange(_session_key(meeting_id, "segments"), position, last)
+            except Exception as e:
+                logger.error(f"Copilot segment read error for meeting {meeting_id}: {e}")
+                return
+
+            for data in page:
+                yield decode_segment(json.loads(data))
+
+            if len(page) < last - position + 1:
+                return
+            position = last + 1
+
+    async def delete(self, meeting_id: str) -> bool:
+        if not self.available:
+            return False
+        try:
+            await redis_client.redis.delete(*(_session_key(meeting_id, part) for part in self.PARTS))
+            return True
+        except Exception as e:
+            logger.error(f"Copilot state delete error for meeting {meeting_id}: {e}")
+            return False
+
+
+# ============================================================================
+# CONSISTENT HASHING
+# ============================================================================
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """
+    Consistent-hash ring with virtual nodes
+
+    Adding or removing a worker only moves the meetings in that worker's
+    arcs (about 1/N of them); every other meeting keeps its owner.
+    """
+
+    def __init__(self, nodes: Iterable[str] = (), vnodes: int = settings.COPILOT_RING_VNODES):
+        self.vnodes = vnodes
+        self.nodes: Tuple[str, ...] = tuple(sorted(set(nodes)))
+
+        points = sorted(
+            (_hash(f"{node}#{i}"), node)
+            for node in self.nodes
+            for i in range(vnodes)
+        )
+        self._hashes = [h for h, _ in points]
+        self._owners = [node for _, node in points]
+
+    def owner(self, key: str) -> Optional[str]:
+        if not self._hashes:
+            return None
+        index = bisect.bisect(self._hashes, _hash(key)) % len(self._hashes)
+        return self._owners[index]
+
+
+# ============================================================================
+# SESSION OWNERSHIP
+# ============================================================================
+
+class SessionRouter:
+    """
+    Decides which worker owns each meeting and forwards work to it
+
+    Workers heartbeat into a Redis sorted set (score = last seen). Each worker
+    builds the same ring from the live members, so every worker agrees on a
+    meeting's owner without coordination. Work for a meeting owned elsewhere
+    is published to the owner's inbox channel and the result comes back on
+    the sender's inbox.
+
+    Without Redis the router runs alone and every meeting is local.
+    """
+
+    def __init__(
+        self,
+        heartbeat_seconds: float = settings.COPILOT_HEARTBEAT_SECONDS,
+        worker_ttl_seconds: float = settings.COPILOT_WORKER_TTL_SECONDS,
+        forward_timeout_seconds: float = settings.COPILOT_FORWARD_TIMEOUT_SECONDS,
+        vnodes: int = settings.COPILOT_RING_VNODES
+    ):
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.heartbeat_seconds = heartbeat_seconds
+        self.worker_ttl_seconds = worker_ttl_seconds
+        self.forward_timeout_seconds = forward_timeout_seconds
+        self.vnodes = vnodes
+
+        self.ring = HashRing([self.worker_id], vnodes)
+        self.distributed = False
+
+        self._handler: Optional[OpHandler] = None
+        self._on_ring_change: Optional[RingChangeHandler] = None
+        self._pubsub = None
+        self._tasks: List[asyncio.Task] = []
+        self._replies: Dict[str, asyncio.Future] = {}
+
+    async def start(self, handler: OpHandler, on_ring_change: Optional[RingChangeHandler] = None):
+        """Join the ring and start serving forwarded work"""
+
+        self._handler = handler
+        self._on_ring_change = on_ring_change
+
+        if redis_client.redis is None:
+            await redis_client.connect()
+
+        if redis_client.redis is None:
+            logger.warning("⚠️ Redis unavailable, copilot sessions stay in this process")
+            return
+
+        self._pubsub = await redis_client.subscribe(_inbox_channel(self.worker_id))
+        if self._pubsub is None:
+            return
+
+        await self._heartbeat()
+        self.distributed = True
+        self._tasks = [
+            asyncio.create_task(self._heartbeat_loop()),
+            asyncio.create_task(self._inbox_loop())
+        ]
+
+        logger.info(f"🔗 Copilot worker {self.worker_id} joined ring of {len(self.ring.nodes)}")
+
+    async def stop(self):
+        """Leave the ring; remaining meetings move to the other workers"""
+
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+
+        if self.distributed:
+            try:
+                await redis_client.redis.zrem(WORKERS_KEY, self.worker_id)
+                await self._pubsub.close()
+            except Exception as e:
+                logger.error(f"Copilot worker leave error: {e}")
+        self.distributed = False
+
+    def owns(self, meeting_id: str) -> bool:
+        return not self.distributed or self.ring.owner(meeting_id) == self.worker_id
+
+    async def call_owner(self, meeting_id: str, op: str, payload: Any = None) -> Tuple[bool, Any]:
+        """
+        Run `op` on the meeting's owner
+
+        Returns (True, result) when another worker handled it, (False, None)
+        when this worker owns the meeting and should handle it itself. Owners
+        that no longer receive messages are dropped from the ring, so their
+        meetings fall to the next worker.
+        """
+
+        while self.distributed:
+            owner = self.ring.owner(meeting_id)
+            if owner == self.worker_id:
+                break
+
+            request_id = uuid.uuid4().hex
+            reply = asyncio.get_running_loop().create_future()
+            self._replies[request_id] = reply
+
+            try:
+                delivered = await redis_client.publish(_inbox_channel(owner), {
+                    "op": op,
+                    "meeting_id": meeting_id,
+                    "payload": payload,
+                    "reply_to": self.worker_id,
+                    "request_id": request_id
+                })
+
+                if not delivered:
+                    logger.warning(f"⚠️ Copilot worker {owner} unreachable, removing from ring")
+                    self.ring = HashRing((n for n in self.ring.nodes if n != owner), self.vnodes)
+                    continue
+
+                try:
+                    return True, await asyncio.wait_for(reply, self.forward_timeout_seconds)
+                except asyncio.TimeoutError:
+                    logger.error(f"❌ Copilot {op} for meeting {meeting_id} timed out on worker {owner}")
+                    return True, None
+            finally:
+                self._replies.pop(request_id, None)
+
+        return False, None
+
+    # ========================================================================
+    # INTERNALS
+    # ========================================================================
+
+    async def _heartbeat(self):
+        now = time.time()
+        pipe = redis_client.redis.pipeline(transaction=False)
+        pipe.zadd(WORKERS_KEY, {self.worker_id: now})
+        pipe.zremrangebyscore(WORKERS_KEY, "-inf", now - self.worker_ttl_seconds)
+        pipe.zrange(WORKERS_KEY, 0, -1)
+        _, _, members = await pipe.execute()
+
+        if tuple(sorted(members)) != self.ring.nodes:
+            self.ring = HashRing(members, self.vnodes)
+            logger.info(f"🔗 Copilot ring changed: {len(self.ring.nodes)} workers")
+            if self._on_ring_change:
+                asyncio.create_task(self._on_ring_change())
+
+    async def _heartbeat_loop(self):
+        while True:
+            await asyncio.sleep(self.heartbeat_seconds)
+            try:
+                await self._heartbeat()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Copilot heartbeat error: {e}")
+
+    async def _inbox_loop(self):
+        async for message in self._pubsub.listen():
+            if message.get("type") != "message":
+                continue
+            try:
+                data = json.loads(message["data"])
+            except (TypeError, json.JSONDecodeError):
+                continue
+
+            if data.get("op") == "reply":
+                reply = self._replies.get(data.get("request_id"))
+                if reply and not reply.done():
+                    reply.set_result(data.get("result"))
+            else:
+                # Don't block the inbox on one slow op (e.g. an end-of-meeting summary)
+                asyncio.create_task(self._serve(data))
+
+    async def _serve(self, data: Dict[str, Any]):
+        try:
+            result = await self._handler(data["op"], data["meeting_id"], data.get("payload"))
+        except Exception as e:
+            logger.error(f"❌ Forwarded copilot {data.get('op')} failed: {e}")
+            result = None
+
+        await redis_client.publish(_inbox_channel(data["reply_to"]), {
+            "op": "reply",
+            "request_id": data["request_id"],
+            "result": result
+        })
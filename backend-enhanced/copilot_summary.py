@@ -0,0 +1,199 @@
+"""
+Copilot Rolling Summary
+Incremental hierarchical summary: segments fold into chunk summaries, chunks into sections
+"""
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# summarize(texts, level) -> summary text; level 1 = raw segments, 2+ = summaries
+Summarizer = Callable[[List[str], int], Awaitable[str]]
+
+FALLBACK_SUMMARY_CHARS = 600
+
+
+@dataclass
+class SummaryNode:
+    """A summary covering a contiguous time span of the meeting"""
+    level: int  # 1 = chunk of segments, 2 = section of chunks, ...
+    text: str
+    start_time: float
+    end_time: float
+    segment_count: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "level": self.level,
+            "text": self.text,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "segment_count": self.segment_count
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SummaryNode":
+        return cls(**data)
+
+
+@dataclass
+class SummaryTree:
+    """
+    Hierarchical rolling summary of a live meeting
+
+    - Incoming segments collect in a buffer; every `chunk_segments` segments
+      (or `chunk_tokens` tokens) the buffer folds into a level-1 summary
+    - Every `fanout` summaries at one level fold into one summary a level up
+
+    Like a binary counter, each level holds fewer than `fanout` unfolded
+    nodes, so the whole meeting is always described by a handful of
+    summaries (oldest at the highest levels) plus the raw tail. Folding is
+    async and done off the segment path by `fold()`.
+    """
+    chunk_segments: int = settings.COPILOT_SUMMARY_CHUNK_SEGMENTS
+    chunk_tokens: int = settings.COPILOT_SUMMARY_CHUNK_TOKENS
+    fanout: int = settings.COPILOT_SUMMARY_FANOUT
+
+    buffer: List[Dict[str, Any]] = field(default_factory=list)  # {start, end, text}
+    buffer_tokens: int = 0
+    levels: List[List[SummaryNode]] = field(default_factory=list)  # levels[0] = level-1 nodes
+
+    # ========================================================================
+    # INPUT
+    # ========================================================================
+
+    def add_segment(self, text: str, start_time: float, end_time: float, speaker: Optional[str] = None):
+        line = f"{speaker}: {text}" if speaker else text
+        self.buffer.append({"start": start_time, "end": end_time, "text": line})
+        self.buffer_tokens += len(line) // 4 + 1
+
+    @property
+    def chunk_ready(self) -> bool:
+        return len(self.buffer) >= self.chunk_segments or self.buffer_tokens >= self.chunk_tokens
+
+    @property
+    def has_pending_work(self) -> bool:
+        return self.chunk_ready or any(len(nodes) >= self.fanout for nodes in self.levels)
+
+    # ========================================================================
+    # FOLDING
+    # ========================================================================
+
+    async def fold(self, summarize: Summarizer, final: bool = False):
+        """
+        Fold every ready chunk and level
+
+        With final=True the remaining buffer is folded too (end of meeting);
+        partially filled levels are left as they are.
+        """
+
+        while self.chunk_ready or (final and self.buffer):
+            count = self._chunk_size()
+            segments = self.buffer[:count]
+            await self._fold_segments(summarize, segments)
+            del self.buffer[:count]
+            self.buffer_tokens = sum(len(s["text"]) // 4 + 1 for s in self.buffer)
+
+        level = 0
+        while level < len(self.levels):
+            if len(self.levels[level]) >= self.fanout:
+                children = self.levels[level][:self.fanout]
+                await self._fold_nodes(summarize, level + 2, children)
+                del self.levels[level][:self.fanout]
+            else:
+                level += 1
+
+    def _chunk_size(self) -> int:
+        tokens = 0
+        for i, segment in enumerate(self.buffer[:self.chunk_segments]):
+            tokens += len(segment["text"]) // 4 + 1
+            if tokens >= self.chunk_tokens:
+                return i + 1
+        return min(len(self.buffer), self.chunk_segments)
+
+    async def _fold_segments(self, summarize: Summarizer, segments: List[Dict[str, Any]]):
+        texts = [s["text"] for s in segments]
+        self._push(SummaryNode(
+            level=1,
+            text=await self._summarize(summarize, texts, 1),
+            start_time=segments[0]["start"],
+            end_time=segments[-1]["end"],
+            segment_count=len(segments)
+        ))
+
+    async def _fold_nodes(self, summarize: Summarizer, level: int, children: List[SummaryNode]):
+        self._push(SummaryNode(
+            level=level,
+            text=await self._summarize(summarize, [c.text for c in children], level),
+            start_time=children[0].start_time,
+            end_time=children[-1].end_time,
+            segment_count=sum(c.segment_count for c in children)
+        ))
+
+    async def _summarize(self, summarize: Summarizer, texts: List[str], level: int) -> str:
+        try:
+            return (await summarize(texts, level)).strip()
+        except Exception as e:
+            # Keep the content rather than dropping a span of the meeting
+            logger.warning(f"⚠️ Summary fold failed at level {level}, keeping excerpt: {e}")
+            return " ".join(texts)[:FALLBACK_SUMMARY_CHARS]
+
+    def _push(self, node: SummaryNode):
+        while len(self.levels) < node.level:
+            self.levels.append([])
+        self.levels[node.level - 1].append(node)
+
+    # ========================================================================
+    # OUTPUT
+    # ========================================================================
+
+    def nodes(self) -> List[SummaryNode]:
+        """All unfolded summaries in chronological order"""
+        return [node for level in reversed(self.levels) for node in level]
+
+    def render(self, include_buffer: bool = True, max_buffer_segments: Optional[int] = None) -> str:
+        """Chronological summary notes, optionally followed by the raw unsummarized tail"""
+
+        parts = [
+            f"[{_clock(node.start_time)}-{_clock(node.end_time)}] {node.text}"
+            for node in self.nodes()
+        ]
+
+        if include_buffer and self.buffer:
+            tail = self.buffer if max_buffer_segments is None else self.buffer[-max_buffer_segments:]
+            parts.append("Most recent discussion:\n" + "\n".join(s["text"] for s in tail))
+
+        return "\n\n".join(parts)
+
+    # ========================================================================
+    # SERIALIZATION
+    # ========================================================================
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "chunk_segments": self.chunk_segments,
+            "chunk_tokens": self.chunk_tokens,
+            "fanout": self.fanout,
+            "buffer": self.buffer,
+            "levels": [[node.to_dict() for node in level] for level in self.levels]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SummaryTree":
+        tree = cls(
+            chunk_segments=data["chunk_segments"],
+            chunk_tokens=data["chunk_tokens"],
+            fanout=data["fanout"],
+            buffer=list(data.get("buffer", [])),
+            levels=[[SummaryNode.from_dict(n) for n in level] for level in data.get("levels", [])]
+        )
+        tree.buffer_tokens = sum(len(s["text"]) // 4 + 1 for s in tree.buffer)
+        return tree
+
+
+def _clock(seconds: float) -> str:
+    minutes, secs = divmod(int(seconds), 60)
+    return f"{minutes:02d}:{secs:02d}"
@@ -0,0 +1,101 @@
+"""
+Copilot Session Window
+Bounded in-memory session history; older items live only in the persisted session state
+
+With the memory state backend or without Redis there is no persisted copy: items
+evicted from a window are gone, and such sessions keep only the last
+COPILOT_SEGMENT_WINDOW segments / COPILOT_INSIGHT_WINDOW insights (the summary
+tree still covers the whole meeting).
+"""
+from collections import deque
+from typing import Callable, Deque, Generic, Iterator, List, TypeVar
+
+from prometheus_client import Counter, Gauge
+
+from config import settings
+
+T = TypeVar("T")
+
+# Rough per-item cost of the dataclass, its fields and the deque slot
+ITEM_OVERHEAD_BYTES = 256
+
+COPILOT_MEMORY_BYTES = Gauge(
+    'copilot_session_memory_bytes', 'Estimated memory held by copilot session windows in this worker'
+)
+COPILOT_MEMORY_CAP_BYTES = Gauge(
+    'copilot_session_memory_cap_bytes', 'Hard cap on the memory held by the segment and insight windows of one copilot session'
+)
+COPILOT_ACTIVE_SESSIONS = Gauge('copilot_active_sessions', 'Copilot sessions held by this worker')
+COPILOT_EVICTED_ITEMS = Counter(
+    'copilot_evicted_items_total', 'Session items evicted from the in-memory window', ['kind']
+)
+
+COPILOT_MEMORY_CAP_BYTES.set(settings.COPILOT_SESSION_MAX_MEMORY_KB * 1024)
+
+
+class BoundedLog(Generic[T]):
+    """
+    Ring buffer over the most recent items of an append-only session log
+
+    The oldest items leave the window when it holds more than `max_items` or
+    `max_bytes` (estimated with `size_of`). Iteration and len() cover the
+    window only; `count` is the total number of items ever appended.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        max_items: int,
+        max_bytes: int,
+        size_of: Callable[[T], int]
+    ):
+        self.kind = kind
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.size_of = size_of
+
+        self._items: Deque[T] = deque()
+        self._sizes: Deque[int] = deque()
+        self.bytes = 0
+        self.count = 0
+
+    def append(self, item: T):
+        size = self.size_of(item)
+        self._items.append(item)
+        self._sizes.append(size)
+        self.bytes += size
+        self.count += 1
+        COPILOT_MEMORY_BYTES.inc(size)
+
+        while self._items and (len(self._items) > self.max_items or self.bytes > self.max_bytes):
+            self._evict()
+
+    def extend(self, items: List[T]):
+        for item in items:
+            self.append(item)
+
+    def release(self):
+        """Drop the window (session ended or handed off)"""
+
+        COPILOT_MEMORY_BYTES.dec(self.bytes)
+        self._items.clear()
+        self._sizes.clear()
+        self.bytes = 0
+
+    @property
+    def evicted(self) -> int:
+        """Items no longer in memory"""
+        return self.count - len(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items)
+
+    def _evict(self):
+        self._items.popleft()
+        size = self._sizes.popleft()
+        self.bytes -= size
+        COPILOT_MEMORY_BYTES.dec(size)
+        COPILOT_EVICTED_ITEMS.labels(kind=self.kind).inc()
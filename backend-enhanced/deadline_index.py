@@ -0,0 +1,393 @@
+"""
+Action Item Deadline Index
+Open action items per assignee, sorted by due date, so conflict and overload checks are range lookups
+"""
+import bisect
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from ai.meeting_index import meeting_key
+from config import settings
+from models import ActionItem, Meeting
+
+logger = logging.getLogger(__name__)
+
+CLOSED_STATUSES = frozenset({"completed", "cancelled"})
+
+# session.info key for ActionItem changes flushed but not yet committed
+_PENDING_CHANGES = "deadline_index_changes"
+
+DueDate = Union[datetime, date, str, None]
+
+
+def due_datetime(value: DueDate) -> Optional[datetime]:
+    """Due date as a naive UTC datetime (accepts datetime, date or ISO string)"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    elif not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def is_open_status(status: Optional[str]) -> bool:
+    return (status or "").lower() not in CLOSED_STATUSES
+
+
+class ActionItemSnapshot(NamedTuple):
+    """ActionItem columns the index needs, captured at flush time"""
+    id: Any
+    assignee_email: Optional[str]
+    owner_id: Any
+    due_date: DueDate
+    description: str
+    meeting_id: Any
+    status: Optional[str]
+
+
+@dataclass(frozen=True)
+class DeadlineEntry:
+    item_id: str
+    assignee: str
+    due: Optional[datetime]
+    task: str
+    meeting: str
+
+
+class DeadlineIndex:
+    """
+    Open action items grouped by assignee
+
+    Each assignee has a list of (due date, item id) kept sorted with bisect,
+    plus a count of all their open items (with or without a due date).
+    Updates are O(log n + k) per item; a date-range question for an
+    assignee is two bisections. Items that are closed, unassigned or
+    deleted leave the index.
+    """
+
+    def __init__(self, conflict_hours: int = settings.DEADLINE_CONFLICT_HOURS):
+        self.conflict_window = timedelta(hours=conflict_hours)
+        self.entries: Dict[str, DeadlineEntry] = {}
+        self.by_assignee: Dict[str, List[Tuple[datetime, str]]] = {}
+        self.open_counts: Dict[str, int] = {}
+
+        self._meeting_items: Dict[str, int] = {}  # meeting key -> indexed action items (dict meetings)
+        self._synced_list: Optional[List[Dict[str, Any]]] = None
+        self._synced_count = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    # ========================================================================
+    # UPDATES
+    # ========================================================================
+
+    def upsert(
+        self,
+        item_id: Any,
+        assignee: Optional[str],
+        due: DueDate,
+        task: str = "",
+        meeting: str = "Unknown",
+        is_open: bool = True
+    ):
+        item_id = str(item_id)
+        if not assignee or not is_open:
+            self.remove(item_id)
+            return
+
+        entry = DeadlineEntry(item_id=item_id, assignee=assignee, due=due_datetime(due), task=task, meeting=meeting)
+        if self.entries.get(item_id) == entry:
+            return
+
+        self.remove(item_id)
+        self.entries[item_id] = entry
+        self.open_counts[assignee] = self.open_counts.get(assignee, 0) + 1
+        if entry.due is not None:
+            bisect.insort(self.by_assignee.setdefault(assignee, []), (entry.due, item_id))
+
+    def remove(self, item_id: Any):
+        entry = self.entries.pop(str(item_id), None)
+        if entry is None:
+            return
+
+        remaining = self.open_counts[entry.assignee] - 1
+        if remaining:
+            self.open_counts[entry.assignee] = remaining
+        else:
+            del self.open_counts[entry.assignee]
+
+        if entry.due is not None:
+            keys = self.by_assignee[entry.assignee]
+            del keys[bisect.bisect_left(keys, (entry.due, entry.item_id))]
+            if not keys:
+                del self.by_assignee[entry.assignee]
+
+    def clear(self):
+        self.entries.clear()
+        self.by_assignee.clear()
+        self.open_counts.clear()
+        self._meeting_items.clear()
+        self._synced_list, self._synced_count = None, 0
+
+    # ------------------------------------------------------------------------
+    # Action item rows
+    # ------------------------------------------------------------------------
+
+    def upsert_action_item(self, item: Any):
+        """Index an ActionItem (or a row / snapshot with the same column names)"""
+        self.upsert(
+            item.id,
+            item.assignee_email or (str(item.owner_id) if item.owner_id else None),
+            item.due_date,
+            task=item.description,
+            meeting=str(item.meeting_id),
+            is_open=is_open_status(item.status)
+        )
+
+    # ------------------------------------------------------------------------
+    # Meeting dicts (proactive intelligence)
+    # ------------------------------------------------------------------------
+
+    def add_meeting(self, meeting: Dict[str, Any]):
+        """(Re-)index the action items of a meeting dict"""
+
+        key = meeting_key(meeting)
+        actions = meeting.get("action_items", [])
+        for position, action in enumerate(actions):
+            self.upsert(
+                f"{key}:{position}",
+                action.get("assignee"),
+                action.get("due_date"),
+                task=action.get("task", ""),
+                meeting=meeting.get("title", "Unknown"),
+                is_open=is_open_status(action.get("status"))
+            )
+
+        for position in range(len(actions), self._meeting_items.get(key, 0)):
+            self.remove(f"{key}:{position}")
+        self._meeting_items[key] = len(actions)
+
+    def sync_meetings(self, meetings: List[Dict[str, Any]]):
+        """Index meeting dicts; syncing the same (append-only) list again only visits new meetings"""
+
+        if meetings is self._synced_list and len(meetings) >= self._synced_count:
+            new_meetings = meetings[self._synced_count:]
+        else:
+            new_meetings = meetings
+        self._synced_list, self._synced_count = meetings, len(meetings)
+
+        for meeting in new_meetings:
+            self.add_meeting(meeting)
+
+    # ========================================================================
+    # QUERIES
+    # ========================================================================
+
+    def _range(self, keys: List[Tuple[datetime, str]], start: DueDate, end: DueDate) -> Tuple[int, int]:
+        """Positions of the items due in [start, end)"""
+        low = 0 if start is None else bisect.bisect_left(keys, (due_datetime(start),))
+        high = len(keys) if end is None else bisect.bisect_left(keys, (due_datetime(end),))
+        return low, max(low, high)
+
+    def due_between(self, assignee: str, start: DueDate = None, end: DueDate = None) -> List[DeadlineEntry]:
+        keys = self.by_assignee.get(assignee, [])
+        low, high = self._range(keys, start, end)
+        return [self.entries[item_id] for _, item_id in keys[low:high]]
+
+    def conflicts(
+        self,
+        start: DueDate = None,
+        end: DueDate = None,
+        assignee: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Consecutive deadlines of one assignee closer than the conflict window"""
+
+        assignees = [assignee] if assignee is not None else list(self.by_assignee)
+
+        conflicts = []
+        for person in assignees:
+            keys = self.by_assignee.get(person, [])
+            low, high = self._range(keys, start, end)
+            for (due1, id1), (due2, id2) in zip(keys[low:high], keys[low + 1:high]):
+                if due2 - due1 < self.conflict_window:
+                    conflicts.append({
+                        "type": "deadline_conflict",
+                        "severity": "high",
+                        "message": f"{person} has multiple tasks due within 24 hours",
+                        "tasks": [self.entries[id1].task, self.entries[id2].task],
+                        "dates": [due1.isoformat(), due2.isoformat()]
+                    })
+        return conflicts
+
+    def overloaded(
+        self,
+        threshold: int = settings.DEADLINE_OVERLOAD_THRESHOLD,
+        start: DueDate = None,
+        end: DueDate = None
+    ) -> Dict[str, int]:
+        """
+        Assignees with more than `threshold` open items (only items due in
+        [start, end) when a range is given)
+        """
+
+        if start is None and end is None:
+            counts = self.open_counts
+        else:
+            counts = {}
+            for person, keys in self.by_assignee.items():
+                low, high = self._range(keys, start, end)
+                counts[person] = high - low
+
+        return {person: count for person, count in counts.items() if count > threshold}
+
+
+class OrganizationDeadlineIndexes:
+    """
+    Deadline indexes over the action_items table, one per organization
+
+    An action item belongs to the organization of its meeting. Meetings never
+    change organization, so the meeting -> organization map is cached and
+    only meetings not seen before are looked up. Commits apply their changes
+    from the request thread pool, so updates hold `lock`, and so must readers
+    of a partition.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.partitions: Dict[str, DeadlineIndex] = {}
+        self.item_organizations: Dict[str, str] = {}  # indexed item -> its partition
+        self.meeting_organizations: Dict[str, str] = {}
+        self.loaded_at: Optional[float] = None  # monotonic time of the last database load
+
+    def __len__(self) -> int:
+        return len(self.item_organizations)
+
+    def partition(self, organization_id: Any) -> DeadlineIndex:
+        key = str(organization_id)
+        with self.lock:
+            index = self.partitions.get(key)
+            if index is None:
+                index = self.partitions[key] = DeadlineIndex()
+            return index
+
+    def upsert_action_item(self, item: Any, organization_id: Any):
+        item_id = str(item.id)
+        with self.lock:
+            self.remove(item_id)
+
+            index = self.partition(organization_id)
+            index.upsert_action_item(item)
+            if item_id in index.entries:
+                self.item_organizations[item_id] = str(organization_id)
+
+    def remove(self, item_id: Any):
+        with self.lock:
+            organization = self.item_organizations.pop(str(item_id), None)
+            if organization is not None:
+                self.partitions[organization].remove(item_id)
+
+    def meeting_organizations_for(self, db: Session, meeting_ids: List[Any]) -> Dict[str, str]:
+        """Organization of each meeting, from the cache or the database"""
+
+        missing = {m for m in meeting_ids if str(m) not in self.meeting_organizations}
+        if missing:
+            rows = db.execute(select(Meeting.id, Meeting.organization_id).where(Meeting.id.in_(missing))).all()
+            with self.lock:
+                for meeting_id, organization_id in rows:
+                    self.meeting_organizations[str(meeting_id)] = str(organization_id)
+        return {str(m): self.meeting_organizations.get(str(m)) for m in meeting_ids}
+
+    def load(self, db: Session):
+        """
+        Rebuild from the open action items in the database
+
+        Holds the lock throughout, so commits landing meanwhile are applied
+        on top of the reloaded state rather than lost.
+        """
+
+        with self.lock:
+            rows = db.execute(
+                select(
+                    ActionItem.id, ActionItem.assignee_email, ActionItem.owner_id,
+                    ActionItem.due_date, ActionItem.description, ActionItem.meeting_id, ActionItem.status,
+                    Meeting.organization_id
+                )
+                .join(Meeting, Meeting.id == ActionItem.meeting_id)
+                .where(ActionItem.status.notin_(CLOSED_STATUSES))
+            ).all()
+
+            self.partitions.clear()
+            self.item_organizations.clear()
+            for row in rows:
+                self.meeting_organizations[str(row.meeting_id)] = str(row.organization_id)
+                self.upsert_action_item(row, row.organization_id)
+            self.loaded_at = time.monotonic()
+
+        logger.info(
+            f"📅 Deadline index loaded: {len(self.item_organizations)} open action items "
+            f"in {len(self.partitions)} organizations"
+        )
+
+    def ensure_fresh(self, db: Session, max_age: float = settings.DEADLINE_INDEX_REFRESH_SECONDS):
+        if self.loaded_at is None or time.monotonic() - self.loaded_at > max_age:
+            self.load(db)
+
+
+# Shared indexes over the action_items table (loaded lazily by the API)
+deadline_indexes = OrganizationDeadlineIndexes()
+
+
+# ============================================================================
+# ORM EVENTS
+# ============================================================================
+
+@event.listens_for(Session, "after_flush")
+def _collect_action_item_changes(session, flush_context):
+    """Snapshot flushed ActionItem changes; they reach the index only if the transaction commits"""
+
+    if deadline_indexes.loaded_at is None:
+        return
+
+    changed = [obj for obj in session.new | session.dirty if isinstance(obj, ActionItem)]
+    organizations = deadline_indexes.meeting_organizations_for(session, [obj.meeting_id for obj in changed])
+
+    changes = session.info.setdefault(_PENDING_CHANGES, {})
+    for obj in changed:
+        snapshot = ActionItemSnapshot(
+            obj.id, obj.assignee_email, obj.owner_id, obj.due_date,
+            obj.description, obj.meeting_id, obj.status
+        )
+        changes[str(obj.id)] = (snapshot, organizations[str(obj.meeting_id)])
+    for obj in session.deleted:
+        if isinstance(obj, ActionItem):
+            changes[str(obj.id)] = None
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_action_item_changes(session):
+    changes = session.info.pop(_PENDING_CHANGES, None)
+    if not changes or deadline_indexes.loaded_at is None:
+        return
+
+    with deadline_indexes.lock:
+        for item_id, change in changes.items():
+            if change is None or change[1] is None:
+                deadline_indexes.remove(item_id)
+            else:
+                deadline_indexes.upsert_action_item(*change)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_action_item_changes(session):
+    session.info.pop(_PENDING_CHANGES, None)
@@ -0,0 +1,682 @@
+"""
+Acoustic Speaker Diarization Engine
+CPU-only speaker clustering over frame-level spectral embeddings, aligned to Whisper segments
+"""
+import logging
+import os
+import shutil
+import subprocess
+import threading
+import time
+import wave
+from dataclasses import dataclass
+from typing import BinaryIO, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+SAMPLE_RATE = 16000
+FRAME_LENGTH = 400      # 25ms analysis frames
+FRAME_HOP = 160         # 10ms frame step
+N_FFT = 512
+N_MELS = 40
+N_MFCC = 20
+BLOCK_SECONDS = 60      # Audio is decoded and featurized one block at a time
+
+AudioSource = Union[str, bytes, BinaryIO]
+
+
+class DiarizationError(Exception):
+    """Raised when audio cannot be decoded or diarized"""
+
+
+@dataclass
+class SpeakerTurn:
+    """A contiguous stretch of audio attributed to one speaker"""
+    start_time: float  # seconds
+    end_time: float    # seconds
+    speaker_id: str
+
+
+@dataclass
+class DiarizationResult:
+    """Complete diarization result"""
+    turns: List[SpeakerTurn]
+    speakers_detected: int
+    audio_duration_seconds: float
+    processing_time_ms: int
+
+
+class DiarizationEngine:
+    """
+    CPU speaker diarization
+
+    Pipeline:
+    - Decode audio to 16kHz mono in fixed-size blocks (bounded memory)
+    - Log-mel spectrum + MFCCs per 10ms frame (vectorized NumPy)
+    - Energy-based voice activity detection
+    - Speech split into segments at pauses (long runs cut to ~5s pieces);
+      speakers rarely change mid-run, so each segment is one speaker
+    - Mean/std MFCC embedding per segment
+    - Spherical k-means, speaker count chosen by silhouette score
+    - Overlap-weighted vote to align speakers to transcript segments
+    """
+
+    def __init__(
+        self,
+        max_speakers: int = 8,
+        min_pause_seconds: float = 0.2,
+        max_segment_seconds: float = 5.0,
+        min_segment_seconds: float = 0.5,
+        min_silhouette: float = 0.12,
+        vad_dynamic_range_db: float = 35.0,
+        seed: int = 0
+    ):
+        self.max_speakers = max_speakers
+        self.min_pause_frames = int(round(min_pause_seconds * SAMPLE_RATE / FRAME_HOP))
+        self.max_segment_frames = int(round(max_segment_seconds * SAMPLE_RATE / FRAME_HOP))
+        self.min_segment_frames = int(round(min_segment_seconds * SAMPLE_RATE / FRAME_HOP))
+        self.min_silhouette = min_silhouette
+        self.vad_dynamic_range_db = vad_dynamic_range_db
+        self.seed = seed
+
+        self._window = np.hanning(FRAME_LENGTH).astype(np.float32)
+        self._mel_filters = self._build_mel_filterbank()
+        self._dct = self._build_dct_matrix()
+
+    # ========================================================================
+    # PUBLIC API
+    # ========================================================================
+
+    def diarize(
+        self,
+        audio: AudioSource,
+        num_speakers: Optional[int] = None
+    ) -> DiarizationResult:
+        """
+        Diarize an audio file
+
+        Args:
+            audio: File path, raw file bytes or a readable binary file
+            num_speakers: Known speaker count (estimated when omitted)
+
+        Returns:
+            DiarizationResult with speaker turns
+        """
+
+        start = time.time()
+
+        mfcc, speech = self._extract_features(audio)
+        duration = len(mfcc) * FRAME_HOP / SAMPLE_RATE
+
+        labels = self._cluster_segments(mfcc, speech, num_speakers)
+        turns = self._labels_to_turns(labels)
+
+        result = DiarizationResult(
+            turns=turns,
+            speakers_detected=len({t.speaker_id for t in turns}),
+            audio_duration_seconds=duration,
+            processing_time_ms=int((time.time() - start) * 1000)
+        )
+
+        logger.info(
+            f"🗣️  Diarization complete: {result.speakers_detected} speakers, "
+            f"{duration:.1f}s audio in {result.processing_time_ms}ms"
+        )
+
+        return result
+
+    def label_segments(
+        self,
+        audio: AudioSource,
+        segments: Sequence,
+        num_speakers: Optional[int] = None
+    ) -> DiarizationResult:
+        """
+        Diarize audio and set `speaker_id` on each transcript segment in place
+
+        Segments only need `start_time`/`end_time` attributes. Each segment takes
+        the speaker with the largest time overlap; segments falling entirely in
+        silence take the nearest turn.
+        """
+
+        result = self.diarize(audio, num_speakers)
+        self.assign_speakers(segments, result.turns)
+        return result
+
+    @staticmethod
+    def assign_speakers(segments: Sequence, turns: List[SpeakerTurn]) -> None:
+        """Align speaker turns to segment timestamps by overlap"""
+
+        if not turns:
+            return
+
+        turn_starts = np.array([t.start_time for t in turns])
+        turn_ends = np.array([t.end_time for t in turns])
+
+        for segment in segments:
+            lo = np.searchsorted(turn_ends, segment.start_time, side="right")
+            hi = np.searchsorted(turn_starts, segment.end_time, side="left")
+
+            best_speaker, best_overlap = None, 0.0
+            overlap_by_speaker = {}
+            for i in range(lo, hi):
+                overlap = min(turn_ends[i], segment.end_time) - max(turn_starts[i], segment.start_time)
+                if overlap <= 0:
+                    continue
+                speaker = turns[i].speaker_id
+                overlap_by_speaker[speaker] = overlap_by_speaker.get(speaker, 0.0) + overlap
+                if overlap_by_speaker[speaker] > best_overlap:
+                    best_speaker, best_overlap = speaker, overlap_by_speaker[speaker]
+
+            if best_speaker is None:
+                midpoint = (segment.start_time + segment.end_time) / 2
+                centers = (turn_starts + turn_ends) / 2
+                best_speaker = turns[int(np.argmin(np.abs(centers - midpoint)))].speaker_id
+
+            segment.speaker_id = best_speaker
+
+    # ========================================================================
+    # AUDIO DECODING
+    # ========================================================================
+
+    def _iter_pcm_blocks(self, audio: AudioSource) -> Iterator[np.ndarray]:
+        """Yield float32 16kHz mono PCM blocks of at most BLOCK_SECONDS"""
+
+        if isinstance(audio, bytes):
+            import io
+            audio = io.BytesIO(audio)
+
+        if self._is_wav(audio):
+            yield from self._iter_wav_blocks(audio)
+        else:
+            yield from self._iter_ffmpeg_blocks(audio)
+
+    @staticmethod
+    def _is_wav(audio: Union[str, BinaryIO]) -> bool:
+        if isinstance(audio, str):
+            with open(audio, "rb") as f:
+                header = f.read(12)
+        else:
+            position = audio.tell()
+            header = audio.read(12)
+            audio.seek(position)
+        return header[:4] == b"RIFF" and header[8:12] == b"WAVE"
+
+    def _iter_wav_blocks(self, audio: Union[str, BinaryIO]) -> Iterator[np.ndarray]:
+        dtypes = {1: np.uint8, 2: np.int16, 4: np.int32}
+
+        with wave.open(audio, "rb") as wav:
+            channels = wav.getnchannels()
+            width = wav.getsampwidth()
+            rate = wav.getframerate()
+
+            if width not in dtypes:
+                raise DiarizationError(f"Unsupported WAV sample width: {width * 8} bits")
+
+            scale = float(2 ** (8 * width - 1))
+            frames_per_block = rate * BLOCK_SECONDS
+
+            while True:
+                raw = wav.readframes(frames_per_block)
+                if not raw:
+                    break
+
+                samples = np.frombuffer(raw, dtype=dtypes[width]).astype(np.float32)
+                if width == 1:
+                    samples -= 128.0
+                samples /= scale
+
+                if channels > 1:
+                    samples = samples.reshape(-1, channels).mean(axis=1)
+
+                if rate != SAMPLE_RATE:
+                    target_len = int(len(samples) * SAMPLE_RATE / rate)
+                    samples = np.interp(
+                        np.linspace(0, len(samples) - 1, target_len),
+                        np.arange(len(samples)),
+                        samples
+                    ).astype(np.float32)
+
+                yield samples
+
+    def _iter_ffmpeg_blocks(self, audio: Union[str, BinaryIO]) -> Iterator[np.ndarray]:
+        """Decode compressed formats (mp3, m4a, mp4, webm...) through ffmpeg"""
+
+        if not shutil.which("ffmpeg"):
+            raise DiarizationError("ffmpeg is required to decode non-WAV audio")
+
+        path = audio if isinstance(audio, str) else getattr(audio, "name", None)
+        use_path = isinstance(path, str) and os.path.isfile(path)
+
+        cmd = [
+            "ffmpeg", "-hide_banner", "-loglevel", "error",
+            "-i", path if use_path else "pipe:0",
+            "-f", "s16le", "-ac", "1", "-ar", str(SAMPLE_RATE),
+            "pipe:1"
+        ]
+
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL if use_path else subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+
+        feeder = None
+        if not use_path:
+            # Feed stdin from a thread so stdout can be drained concurrently
+            def feed():
+                try:
+                    while True:
+                        chunk = audio.read(1024 * 1024)
+                        if not chunk:
+                            break
+                        proc.stdin.write(chunk)
+                except (BrokenPipeError, ValueError):
+                    pass
+                finally:
+                    proc.stdin.close()
+
+            feeder = threading.Thread(target=feed, daemon=True)
+            feeder.start()
+
+        block_bytes = SAMPLE_RATE * BLOCK_SECONDS * 2
+        try:
+            while True:
+                raw = proc.stdout.read(block_bytes)
+                if not raw:
+                    break
+                yield np.frombuffer(raw[:len(raw) - len(raw) % 2], dtype=np.int16).astype(np.float32) / 32768.0
+        finally:
+            proc.stdout.close()
+            if feeder:
+                feeder.join()
+            stderr = proc.stderr.read().decode(errors="ignore")
+            proc.stderr.close()
+            if proc.wait() != 0:
+                raise DiarizationError(f"ffmpeg failed to decode audio: {stderr.strip()[:200]}")
+
+    # ========================================================================
+    # FEATURE EXTRACTION
+    # ========================================================================
+
+    def _extract_features(self, audio: AudioSource):
+        """
+        Compute per-frame MFCCs and a speech mask
+
+        Blocks are featurized independently; the samples that do not fill a
+        whole frame hop are carried over to the next block so framing is
+        continuous across block boundaries.
+        """
+
+        mfcc_blocks = []
+        energy_blocks = []
+        carry = np.zeros(0, dtype=np.float32)
+        last_sample = np.float32(0.0)
+
+        for block in self._iter_pcm_blocks(audio):
+            # Pre-emphasis, continuous across blocks
+            emphasized = np.empty_like(block)
+            emphasized[0] = block[0] - 0.97 * last_sample
+            emphasized[1:] = block[1:] - 0.97 * block[:-1]
+            last_sample = block[-1]
+
+            signal = np.concatenate([carry, emphasized])
+            if len(signal) < FRAME_LENGTH:
+                carry = signal
+                continue
+
+            n_frames = 1 + (len(signal) - FRAME_LENGTH) // FRAME_HOP
+            frames = np.lib.stride_tricks.sliding_window_view(signal, FRAME_LENGTH)[::FRAME_HOP][:n_frames]
+            carry = signal[n_frames * FRAME_HOP:]
+
+            power = np.abs(np.fft.rfft(frames * self._window, n=N_FFT)) ** 2
+            mel = np.maximum(power @ self._mel_filters, 1e-10)
+            log_mel = np.log(mel).astype(np.float32)
+
+            mfcc_blocks.append(log_mel @ self._dct)
+            energy_blocks.append(10.0 * np.log10(power.sum(axis=1) + 1e-10))
+
+        if not mfcc_blocks:
+            raise DiarizationError("Audio is empty or too short to diarize")
+
+        mfcc = np.concatenate(mfcc_blocks)
+        energy_db = np.concatenate(energy_blocks)
+
+        # Cepstral mean normalization removes the recording channel
+        mfcc -= mfcc.mean(axis=0)
+
+        speech = energy_db > (energy_db.max() - self.vad_dynamic_range_db)
+
+        return mfcc, speech
+
+    def _build_mel_filterbank(self) -> np.ndarray:
+        """Triangular mel filters, shape (N_FFT // 2 + 1, N_MELS)"""
+
+        def hz_to_mel(hz):
+            return 2595.0 * np.log10(1.0 + hz / 700.0)
+
+        def mel_to_hz(mel):
+            return 700.0 * (10 ** (mel / 2595.0) - 1.0)
+
+        mel_points = np.linspace(hz_to_mel(20.0), hz_to_mel(SAMPLE_RATE / 2), N_MELS + 2)
+        bins = np.floor((N_FFT + 1) * mel_to_hz(mel_points) / SAMPLE_RATE).astype(int)
+
+        filters = np.zeros((N_FFT // 2 + 1, N_MELS), dtype=np.float32)
+        for m in range(1, N_MELS + 1):
+            left, center, right = bins[m - 1], bins[m], bins[m + 1]
+            if center > left:
+                filters[left:center, m - 1] = (np.arange(left, center) - left) / (center - left)
+            if right > center:
+                filters[center:right, m - 1] = (right - np.arange(center, right)) / (right - center)
+
+        return filters
+
+    def _build_dct_matrix(self) -> np.ndarray:
+        """DCT-II basis dropping c0 (loudness), shape (N_MELS, N_MFCC - 1)"""
+
+        n = np.arange(N_MELS)
+        k = np.arange(1, N_MFCC)
+        return np.cos(np.pi / N_MELS * (n[:, None] + 0.5) * k[None, :]).astype(np.float32)
+
+    # ========================================================================
+    # CLUSTERING
+    # ========================================================================
+
+    def _speech_segments(self, speech: np.ndarray) -> np.ndarray:
+        """
+        (start_frame, end_frame) of voiced runs
+
+        Gaps shorter than a pause are bridged; runs longer than
+        max_segment_frames are cut into equal pieces so a speaker change
+        without a pause still lands near a segment boundary.
+        """
+
+        edges = np.flatnonzero(np.diff(np.concatenate([[0], speech.astype(np.int8), [0]])))
+        starts, ends = edges[::2], edges[1::2]
+        if not len(starts):
+            return np.zeros((0, 2), dtype=np.int64)
+
+        opens_run = np.concatenate([[True], starts[1:] - ends[:-1] >= self.min_pause_frames])
+        closes_run = np.concatenate([opens_run[1:], [True]])
+
+        segments = []
+        for start, end in zip(starts[opens_run], ends[closes_run]):
+            pieces = max(1, int(round((end - start) / self.max_segment_frames)))
+            bounds = np.linspace(start, end, pieces + 1).astype(np.int64)
+            segments.extend(zip(bounds[:-1], bounds[1:]))
+
+        return np.array(segments, dtype=np.int64)
+
+    @staticmethod
+    def _segment_embeddings(mfcc: np.ndarray, speech: np.ndarray, segments: np.ndarray) -> np.ndarray:
+        """
+        Mean/std of speech-frame MFCCs per segment
+
+        Uses cumulative sums so every segment costs O(1) regardless of length.
+        """
+
+        mask = speech.astype(np.float32)[:, None]
+        zeros = np.zeros((1, mfcc.shape[1]), dtype=np.float64)
+
+        cum_x = np.concatenate([zeros, np.cumsum(mfcc * mask, axis=0, dtype=np.float64)])
+        cum_x2 = np.concatenate([zeros, np.cumsum(mfcc ** 2 * mask, axis=0, dtype=np.float64)])
+        cum_n = np.concatenate([[0.0], np.cumsum(speech, dtype=np.float64)])
+
+        starts, ends = segments[:, 0], segments[:, 1]
+        counts = np.maximum(cum_n[ends] - cum_n[starts], 1.0)[:, None]
+
+        mean = (cum_x[ends] - cum_x[starts]) / counts
+        var = (cum_x2[ends] - cum_x2[starts]) / counts - mean ** 2
+        embeddings = np.hstack([mean, np.sqrt(np.maximum(var, 0.0))])
+
+        return embeddings.astype(np.float32)
+
+    def _cluster_segments(
+        self,
+        mfcc: np.ndarray,
+        speech: np.ndarray,
+        num_speakers: Optional[int]
+    ) -> List[tuple]:
+        """Return (start_sec, end_sec, cluster) for every speech segment"""
+
+        segments = self._speech_segments(speech)
+
+        if not len(segments):
+            return []
+
+        X = self._segment_embeddings(mfcc, speech, segments)
+        X = (X - X.mean(axis=0)) / (X.std(axis=0) + 1e-6)
+        X /= np.linalg.norm(X, axis=1, keepdims=True) + 1e-9
+
+        # Very short segments give noisy embeddings: fit on the rest, then assign them
+        long_enough = segments[:, 1] - segments[:, 0] >= self.min_segment_frames
+        fit = X[long_enough] if long_enough.sum() >= 2 else X
+
+        if num_speakers:
+            _, centroids = self._spherical_kmeans(fit, min(num_speakers, len(fit)), return_centroids=True)
+        else:
+            centroids = self._estimate_speakers(fit)
+
+        labels = np.argmax(X @ centroids.T, axis=1)
+
+        seconds_per_frame = FRAME_HOP / SAMPLE_RATE
+        return [
+            (start * seconds_per_frame, end * seconds_per_frame, int(label))
+            for (start, end), label in zip(segments, labels)
+        ]
+
+    def _estimate_speakers(self, X: np.ndarray) -> np.ndarray:
+        """Centroids for the speaker count with the best silhouette score"""
+
+        rng = np.random.default_rng(self.seed)
+        sample = X if len(X) <= 1500 else X[rng.choice(len(X), 1500, replace=False)]
+
+        mean = X.mean(axis=0)
+        best_k, best_score = 1, self.min_silhouette
+        best_centroids = (mean / (np.linalg.norm(mean) + 1e-9))[None, :]
+
+        for k in range(2, min(self.max_speakers, len(sample) - 1) + 1):
+            _, centroids = self._spherical_kmeans(X, k, return_centroids=True)
+            sample_labels = np.argmax(sample @ centroids.T, axis=1)
+            score = self._silhouette(sample, sample_labels, k)
+            if score > best_score:
+                best_k, best_score, best_centroids = k, score, centroids
+
+        logger.debug(f"Estimated {best_k} speakers (silhouette {best_score:.3f})")
+        return best_centroids
+
+    def _spherical_kmeans(self, X: np.ndarray, k: int, n_iter: int = 30, return_centroids: bool = False):
+        """k-means on the unit sphere (cosine similarity) with k-means++ seeding"""
+
+        rng = np.random.default_rng(self.seed)
+        centroids = np.empty((k, X.shape[1]), dtype=X.dtype)
+        centroids[0] = X[rng.integers(len(X))]
+        closest = 1.0 - X @ centroids[0]
+
+        for i in range(1, k):
+            weights = np.maximum(closest, 0.0) ** 2
+            total = weights.sum()
+            idx = rng.choice(len(X), p=weights / total) if total > 0 else rng.integers(len(X))
+            centroids[i] = X[idx]
+            closest = np.minimum(closest, 1.0 - X @ centroids[i])
+
+        labels = np.zeros(len(X), dtype=int)
+        for _ in range(n_iter):
+            new_labels = np.argmax(X @ centroids.T, axis=1)
+            if _ > 0 and np.array_equal(new_labels, labels):
+                break
+            labels = new_labels
+
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, X)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            empty = norms[:, 0] == 0
+            centroids = np.where(empty[:, None], centroids, sums / np.maximum(norms, 1e-9))
+
+        if return_centroids:
+            return labels, centroids
+        return labels
+
+    @staticmethod
+    def _silhouette(X: np.ndarray, labels: np.ndarray, k: int) -> float:
+        """Mean silhouette coefficient with cosine distance"""
+
+        distances = 1.0 - X @ X.T
+        onehot = np.eye(k, dtype=X.dtype)[labels]
+        counts = onehot.sum(axis=0)
+
+        if (counts == 0).any():
+            return -1.0
+
+        mean_to_cluster = (distances @ onehot) / counts
+        own = np.arange(len(X)), labels
+
+        # Exclude the point itself from its own cluster mean
+        a = mean_to_cluster[own] * counts[labels] / np.maximum(counts[labels] - 1, 1)
+        mean_to_cluster[own] = np.inf
+        b = mean_to_cluster.min(axis=1)
+
+        # Singleton clusters score 0 (a speaker heard only once is still a speaker)
+        scores = (b - a) / np.maximum(np.maximum(a, b), 1e-9)
+        scores[counts[labels] == 1] = 0.0
+        return float(np.mean(scores))
+
+    @staticmethod
+    def _labels_to_turns(segments: List[tuple]) -> List[SpeakerTurn]:
+        """Merge consecutive segments into turns, numbering speakers by first appearance"""
+
+        names = {}
+        turns: List[SpeakerTurn] = []
+
+        for start, end, label in segments:
+            if label not in names:
+                names[label] = f"Speaker {len(names) + 1}"
+            speaker = names[label]
+
+            if turns and turns[-1].speaker_id == speaker and start - turns[-1].end_time < 1.0:
+                turns[-1].end_time = end
+            else:
+                turns.append(SpeakerTurn(start_time=start, end_time=end, speaker_id=speaker))
+
+        return turns
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def _synthetic_meeting(duration_seconds: float, num_speakers: int = 3, seed: int = 0):
+    """Alternating voiced speakers with distinct pitch and formants, plus turn gaps"""
+
+    rng = np.random.default_rng(seed)
+    t_total = int(duration_seconds * SAMPLE_RATE)
+    audio = np.zeros(t_total, dtype=np.float32)
+
+    voices = [
+        (110.0 + 45.0 * i, [500.0 + 150.0 * i, 1500.0 + 300.0 * i, 2500.0 - 100.0 * i])
+        for i in range(num_speakers)
+    ]
+
+    position, turns = 0, []
+    while position < t_total:
+        speaker = int(rng.integers(num_speakers))
+        length = int(rng.uniform(3.0, 8.0) * SAMPLE_RATE)
+        end = min(position + length, t_total)
+        t = np.arange(end - position) / SAMPLE_RATE
+
+        f0, formants = voices[speaker]
+        pitch = f0 * (1 + 0.05 * np.sin(2 * np.pi * 0.5 * t))
+        phase = 2 * np.pi * np.cumsum(pitch) / SAMPLE_RATE
+        voice = sum(
+            np.sin(h * phase) * sum(np.exp(-((h * f0 - f) / 200.0) ** 2) for f in formants)
+            for h in range(1, 25)
+        )
+        envelope = 0.6 + 0.4 * np.sin(2 * np.pi * 4.0 * t) ** 2  # ~syllable rate
+        audio[position:end] = 0.1 * voice * envelope + 0.003 * rng.standard_normal(end - position)
+
+        turns.append((position / SAMPLE_RATE, end / SAMPLE_RATE, speaker))
+        position = end + int(0.3 * SAMPLE_RATE)
+
+    return audio, turns
+
+
+def _speaker_purity(reference: List[tuple], turns: List[SpeakerTurn]) -> float:
+    """Share of detected speech (10ms frames) whose speaker is the majority reference speaker of its cluster"""
+
+    n_frames = int(max(end for _, end, _ in reference) * 100) + 1
+    truth = np.full(n_frames, -1)
+    detected = np.full(n_frames, -1)
+
+    for start, end, speaker in reference:
+        truth[int(start * 100):int(end * 100)] = speaker
+
+    names = {}
+    for turn in turns:
+        detected[int(turn.start_time * 100):int(turn.end_time * 100)] = names.setdefault(turn.speaker_id, len(names))
+
+    both = (truth >= 0) & (detected >= 0)
+    if not both.any():
+        return 0.0
+
+    overlap = np.zeros((len(names), truth.max() + 1))
+    np.add.at(overlap, (detected[both], truth[both]), 1)
+    return float(overlap.max(axis=1).sum() / both.sum())
+
+
+def benchmark_throughput(duration_seconds: float = 600.0, num_speakers: int = 3, seed: int = 0) -> dict:
+    """
+    Measure diarization throughput in seconds of audio per CPU-second
+
+    Uses a synthetic multi-speaker recording written as 16kHz WAV so the full
+    decode → featurize → cluster path is exercised. Also reports the detected
+    speaker count and cluster purity against the known speaker turns.
+    """
+
+    import io
+
+    audio, reference = _synthetic_meeting(duration_seconds, num_speakers, seed)
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes((np.clip(audio, -1, 1) * 32767).astype(np.int16).tobytes())
+
+    engine = DiarizationEngine()
+
+    cpu_start = time.process_time()
+    result = engine.diarize(buffer.getvalue())
+    cpu_seconds = time.process_time() - cpu_start
+
+    return {
+        "audio_seconds": duration_seconds,
+        "cpu_seconds": round(cpu_seconds, 3),
+        "audio_seconds_per_cpu_second": round(duration_seconds / max(cpu_seconds, 1e-9), 1),
+        "speakers_expected": len({speaker for _, _, speaker in reference}),
+        "speakers_detected": result.speakers_detected,
+        "speaker_purity": round(_speaker_purity(reference, result.turns), 3)
+    }
+
+
+if __name__ == "__main__":
+    for minutes in (1, 10, 60):
+        stats = benchmark_throughput(duration_seconds=minutes * 60)
+        print(
+            f"{minutes:>3} min audio: {stats['cpu_seconds']:>7.2f} CPU-s, "
+            f"{stats['audio_seconds_per_cpu_second']:>7.1f}x audio-s/CPU-s, "
+            f"speakers {stats['speakers_detected']}/{stats['speakers_expected']}, "
+            f"purity {stats['speaker_purity']:.3f}"
+        )
+
+    for minutes in (1, 2, 5):
+        for speakers in (2, 3, 4, 5):
+            stats = benchmark_throughput(duration_seconds=minutes * 60, num_speakers=speakers)
+            print(
+                f"{minutes:>3} min, {speakers} speakers: detected {stats['speakers_detected']}, "
+                f"purity {stats['speaker_purity']:.3f}"
+            )
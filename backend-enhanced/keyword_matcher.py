@@ -0,0 +1,270 @@
+"""
+Multi-Pattern Keyword Matcher
+Compile a keyword set once, find every (overlapping) occurrence in one pass over the text
+"""
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, Set, Tuple
+
+
+def _build_trie(keywords: Iterable[str]) -> Dict:
+    trie: Dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = True  # terminal marker
+    return trie
+
+
+def _trie_pattern(node: Dict) -> str:
+    """Regex equivalent of a trie; shared prefixes are factored, longest match wins"""
+
+    terminal = "" in node
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char]
+
+    if not branches:
+        return ""
+
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+    if terminal:
+        # Greedy optional: prefer the longer keyword, fall back to this one
+        if len(branches) == 1 and len(body) > 1:
+            body = "(?:" + body + ")"
+        return body + "?"
+    return body
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick style matcher for a fixed keyword set
+
+    The keywords are compiled into a single trie-shaped regex and the text is
+    scanned once in C (leftmost-longest, non-overlapping). Overlaps are
+    resolved from tables built at compile time, like Aho-Corasick output links:
+
+    - every keyword occurring inside a matched keyword ("ill" in "will",
+      "to" in "todo") is known in advance for that keyword
+    - only offsets where a keyword suffix is the start of a longer keyword
+      ("need t|o do") need an anchored re-match, so overlaps that run past
+      the end of a match are found without rescanning
+
+    Matching is case-insensitive (text is lowercased once per call, or pass
+    lowered=True).
+
+    Substring semantics match `keyword in text`: "will" matches "willing".
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: Tuple[str, ...] = tuple(sorted({k.lower() for k in keywords if k}))
+
+        trie = _build_trie(self.keywords)
+        self._pattern = re.compile(_trie_pattern(trie)) if self.keywords else None
+
+        # Per keyword: (offset, keyword) for everything occurring inside it, and
+        # the offsets where an occurrence may continue past its end
+        self._contained: Dict[str, Tuple[Tuple[int, str], ...]] = {}
+        self._contained_set: Dict[str, frozenset] = {}
+        self._straddles: Dict[str, Tuple[int, ...]] = {}
+
+        for keyword in self.keywords:
+            contained = []
+            straddles = []
+            for offset in range(len(keyword)):
+                node = trie
+                for position in range(offset, len(keyword)):
+                    node = node.get(keyword[position])
+                    if node is None:
+                        break
+                    if "" in node:
+                        contained.append((offset, keyword[offset:position + 1]))
+                else:
+                    if offset and any(char for char in node):
+                        straddles.append(offset)
+            self._contained[keyword] = tuple(contained)
+            self._contained_set[keyword] = frozenset(k for _, k in contained)
+            self._straddles[keyword] = tuple(straddles)
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def contains_any(self, text: str, lowered: bool = False) -> bool:
+        """True when at least one keyword occurs (stops at the first hit)"""
+
+        if self._pattern is None:
+            return False
+        return self._pattern.search(text if lowered else text.lower()) is not None
+
+    def _iter_straddling(self, text: str, match) -> List[Tuple[int, str]]:
+        """Occurrences that start inside `match` and end after it"""
+
+        hits = []
+        start, end = match.span()
+        for offset in self._straddles[match.group()]:
+            inner = self._pattern.match(text, start + offset)
+            if inner is not None and inner.end() > end:
+                for inner_offset, keyword in self._contained[inner.group()]:
+                    if inner_offset == 0 and start + offset + len(keyword) > end:
+                        hits.append((start + offset, keyword))
+        return hits
+
+    def find_all(self, text: str, lowered: bool = False) -> List[Tuple[int, str]]:
+        """Every occurrence as (position, keyword), overlaps included, in text order"""
+
+        if self._pattern is None:
+            return []
+
+        text = text if lowered else text.lower()
+        hits = []
+        for match in self._pattern.finditer(text):
+            start = match.start()
+            hits.extend((start + offset, keyword) for offset, keyword in self._contained[match.group()])
+            if self._straddles[match.group()]:
+                hits.extend(self._iter_straddling(text, match))
+        hits.sort()
+        return hits
+
+    def matched(self, text: str, lowered: bool = False) -> Set[str]:
+        """Distinct keywords present in the text"""
+
+        if self._pattern is None:
+            return set()
+
+        text = text if lowered else text.lower()
+        found: Set[str] = set()
+        for match in self._pattern.finditer(text):
+            keyword = match.group()
+            found |= self._contained_set[keyword]
+            if self._straddles[keyword]:
+                found.update(k for _, k in self._iter_straddling(text, match))
+        return found
+
+    def count(self, text: str, lowered: bool = False) -> int:
+        """Number of distinct keywords present"""
+        return len(self.matched(text, lowered))
+
+
+class KeywordGroups:
+    """
+    Several named keyword sets checked in the same single pass
+
+    >>> signals = KeywordGroups({"decision": ["agreed"], "blocker": ["stuck"]})
+    >>> signals.groups("we agreed but we're stuck")
+    {'decision', 'blocker'}
+    """
+
+    def __init__(self, groups: Mapping[str, Iterable[str]]):
+        self._groups_by_keyword: Dict[str, Set[str]] = {}
+        for name, keywords in groups.items():
+            for keyword in keywords:
+                self._groups_by_keyword.setdefault(keyword.lower(), set()).add(name)
+
+        self.matcher = KeywordMatcher(self._groups_by_keyword)
+
+    def groups(self, text: str, lowered: bool = False) -> Set[str]:
+        """Names of the groups with at least one keyword in the text"""
+
+        names: Set[str] = set()
+        for keyword in self.matcher.matched(text, lowered):
+            names.update(self._groups_by_keyword[keyword])
+        return names
+
+    def matched_by_group(self, text: str, lowered: bool = False) -> Dict[str, Set[str]]:
+        """{group: keywords found}"""
+
+        result: Dict[str, Set[str]] = {}
+        for keyword in self.matcher.matched(text, lowered):
+            for name in self._groups_by_keyword[keyword]:
+                result.setdefault(name, set()).add(keyword)
+        return result
+
+
+@lru_cache(maxsize=1024)
+def _compile_cached(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher(keywords)
+
+
+def compile_keywords(keywords: Iterable[str]) -> KeywordMatcher:
+    """Shared compiled matcher for a keyword set (compiled once, then cached)"""
+    return _compile_cached(tuple(sorted({k.lower() for k in keywords if k})))
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def benchmark_matchers(
+    segments: int = 50_000,
+    keywords_per_set: int = 60,
+    domain_word_rate: float = 0.1,
+    seed: int = 7
+) -> Dict[str, float]:
+    """
+    Compare per-keyword `in` scans (the pattern this replaces) against one compiled matcher
+
+    Synthetic transcript segments of 10-40 words: conversational filler with
+    `domain_word_rate` of project/meeting vocabulary mixed in. Roughly one
+    meeting-hour per 1,000 segments.
+    """
+    import random
+    import time
+
+    rng = random.Random(seed)
+
+    filler = (
+        "so i think the main thing here is that we can probably look at it again when "
+        "everyone is back and then see whether it makes sense for the team to maybe move "
+        "forward with what we talked about last time right okay yeah sounds good"
+    ).split()
+    domain = (
+        "ship release sprint security review marketing budget vendor api migration "
+        "database latency dashboard customer onboarding hiring roadmap quarterly "
+        "deadline risk approve reject increase decrease blocked agreed decided owner"
+    ).split()
+
+    texts = [
+        " ".join(
+            rng.choice(domain) if rng.random() < domain_word_rate else rng.choice(filler)
+            for _ in range(rng.randint(10, 40))
+        ).capitalize()
+        for _ in range(segments)
+    ]
+
+    keywords = sorted({
+        " ".join(rng.choice(domain) for _ in range(rng.choice((1, 1, 2))))
+        for _ in range(keywords_per_set * 3)
+    })[:keywords_per_set]
+
+    def timed(fn):
+        start = time.perf_counter()
+        result = fn()
+        return result, time.perf_counter() - start
+
+    naive_any, naive_any_seconds = timed(
+        lambda: [any(kw in text.lower() for kw in keywords) for text in texts]
+    )
+    naive_all, naive_all_seconds = timed(
+        lambda: [{kw for kw in keywords if kw in text.lower()} for text in texts]
+    )
+
+    matcher = compile_keywords(keywords)
+    compiled_any, compiled_any_seconds = timed(lambda: [matcher.contains_any(text) for text in texts])
+    compiled_all, compiled_all_seconds = timed(lambda: [matcher.matched(text) for text in texts])
+
+    assert naive_any == compiled_any and naive_all == compiled_all, "matcher disagrees with substring scan"
+
+    return {
+        "segments": segments,
+        "keywords": len(keywords),
+        "any_naive_seconds": round(naive_any_seconds, 3),
+        "any_compiled_seconds": round(compiled_any_seconds, 3),
+        "all_naive_seconds": round(naive_all_seconds, 3),
+        "all_compiled_seconds": round(compiled_all_seconds, 3),
+        "all_speedup": round(naive_all_seconds / compiled_all_seconds, 1)
+    }
+
+
+if __name__ == "__main__":
+    for size in (10, 60, 300):
+        print(benchmark_matchers(keywords_per_set=size))
@@ -3,6 +3,8 @@ Enhanced Meeting Minutes API - Production Backend
 Enterprise-grade FastAPI application with full feature set
 """
 import asyncio
+import os
+import uuid
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
@@ -15,13 +17,14 @@ from fastapi import (
 )
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import FileResponse, StreamingResponse, JSONResponse
+from fastapi.responses import FileResponse, StreamingResponse, JSONResponse, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from starlette.requests import ClientDisconnect
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from sqlalchemy.orm import Session
-from sqlalchemy import create_engine, select, and_, or_, func, desc
+from sqlalchemy import create_engine, select, update, and_, or_, func, desc
 from sqlalchemy.orm import sessionmaker
 from pydantic import BaseModel, Field, EmailStr
 from redis import asyncio as aioredis
@@ -38,6 +41,19 @@ from models import (
     IntegrationToken, AnalyticsEvent, AuditLog
 )
 from ai_orchestrator import ai_orchestrator, TaskType
+from transcription_backends import resolve_transcription_backend
+from transcript_store import CompactTranscript
+from transcription_service import transcription_service, TranscriptSegment, iter_chunks
+from media_upload import (
+    stream_upload_to_disk, upload_file_chunks, max_upload_bytes, UploadTooLargeError
+)
+from media_storage import get_media_storage, MediaStorageError
+from celery_app import celery_app, TRANSCRIBE_MEDIA_FILE_TASK
+from deadline_index import deadline_indexes, is_open_status
+from ai.dependency_graph import BlockingTask, TaskNode, dependency_graphs
+from ai.passage_index import PASSAGE_KINDS, passage_index, meeting_document
+from ai.project_classifier import classifier as project_classifier
+from ai.vector_index import vector_index
 
 # Configure logging
 logging.basicConfig(
@@ -105,10 +121,18 @@ async def lifespan(app: FastAPI):
     # Skip Redis for now - async client incompatible with sync app
     logger.info("✓ Redis connection skipped (sync mode)")
 
+    # Load registered projects in the background; classification waits for it if called first
+    app.state.project_classifier_startup = asyncio.create_task(project_classifier.start())
+
     yield
 
     # Shutdown
     logger.info("Shutting down API")
+    startup = app.state.project_classifier_startup
+    if not startup.done():
+        startup.cancel()
+    await asyncio.gather(startup, return_exceptions=True)
+    await project_classifier.stop()
     engine.dispose()
 
 
@@ -273,6 +297,18 @@ class ActionItemResponse(BaseModel):
         from_attributes = True
 
 
+class DependencyCreate(BaseModel):
+    """Action items the item waits on"""
+    blocked_by: List[UUID] = Field(..., min_length=1, max_length=100)
+
+
+class MediaUploadCreate(BaseModel):
+    """Resumable upload creation schema"""
+    filename: str = Field(..., min_length=1, max_length=255)
+    file_size: int = Field(..., gt=0)
+    mime_type: Optional[str] = None
+
+
 # ============================================================================
 # Helper Functions
 # ============================================================================
@@ -300,6 +336,68 @@ async def cache_set(
         logger.error(f"Cache set error: {e}")
 
 
+def load_compact_transcript(meeting_id: UUID, db: Session) -> CompactTranscript:
+    """
+    Load a meeting's columnar transcript without touching the JSONB segment list
+
+    Meetings transcribed before the columnar store existed are converted once
+    from transcript_segments and backfilled.
+    """
+    data = db.execute(
+        select(Meeting.transcript_columnar).where(
+            and_(Meeting.id == meeting_id, Meeting.deleted_at.is_(None))
+        )
+    ).scalar_one_or_none()
+
+    if data is not None:
+        return CompactTranscript.from_bytes(data)
+
+    meeting = db.execute(
+        select(Meeting).where(and_(Meeting.id == meeting_id, Meeting.deleted_at.is_(None)))
+    ).scalar_one_or_none()
+
+    if not meeting:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+    if not meeting.transcript_segments:
+        raise HTTPException(status_code=404, detail="Meeting has no transcript")
+
+    transcript = CompactTranscript.from_segments(meeting.transcript_segments)
+    meeting.transcript_columnar = transcript.to_bytes()
+    db.commit()
+
+    return transcript
+
+
+def index_meeting_for_search(meeting_id: UUID):
+    """
+    Re-index a saved meeting's passages (transcript, summary, decisions,
+    action items) for answer_question and, when enabled, semantic search
+    """
+    db = SessionLocal()
+    try:
+        meeting = db.execute(select(Meeting).where(Meeting.id == meeting_id)).scalar_one_or_none()
+        if meeting is None:
+            return
+
+        partitions = [passage_index.partition(meeting.organization_id)]
+        if settings.VECTOR_SEARCH_ENABLED:
+            partitions.append(vector_index.partition(meeting.organization_id))
+
+        if meeting.deleted_at is not None:
+            for partition in partitions:
+                partition.remove_meeting(str(meeting.id))
+            return
+
+        action_items = db.execute(select(ActionItem).where(ActionItem.meeting_id == meeting_id)).scalars().all()
+        document = meeting_document(meeting, action_items)
+        for partition in partitions:
+            partition.index_meeting(document)
+    except Exception as e:
+        logger.error(f"Search indexing failed for meeting {meeting_id}: {e}")
+    finally:
+        db.close()
+
+
 async def log_analytics_event(
     event_type: str,
     user_id: Optional[UUID] = None,
@@ -466,6 +564,8 @@ async def create_meeting(
         properties={"type": meeting.meeting_type}
     )
 
+    background_tasks.add_task(index_meeting_for_search, new_meeting.id)
+
     # Trigger AI analysis if notes are provided
     if meeting.notes:
         background_tasks.add_task(analyze_meeting_ai, new_meeting.id, db)
@@ -511,6 +611,7 @@ async def get_meeting(
 async def update_meeting(
     meeting_id: UUID,
     meeting_update: MeetingUpdate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
     redis: aioredis.Redis = Depends(get_redis)
@@ -536,12 +637,15 @@ async def update_meeting(
     # Invalidate cache
     redis.delete(f"meeting:{meeting_id}")
 
+    background_tasks.add_task(index_meeting_for_search, meeting_id)
+
     return meeting
 
 
 @app.delete(f"{settings.API_V1_PREFIX}/meetings/{{meeting_id}}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_meeting(
     meeting_id: UUID,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -556,9 +660,90 @@ async def delete_meeting(
     meeting.deleted_at = datetime.utcnow()
     db.commit()
 
+    background_tasks.add_task(index_meeting_for_search, meeting_id)
+
     return None
 
 
+def user_organization_id(current_user: User, db: Session):
+    """The organization of the user (403 if none)"""
+    membership = db.execute(
+        select(OrganizationMember).where(OrganizationMember.user_id == current_user.id).limit(1)
+    ).scalar_one_or_none()
+    if not membership:
+        raise HTTPException(status_code=403, detail="User not part of any organization")
+    return membership.organization_id
+
+
+async def organization_vectors(current_user: User, db: Session):
+    """The semantic vector partition of the user's organization (loaded in a thread on first use)"""
+    if not settings.VECTOR_SEARCH_ENABLED:
+        raise HTTPException(status_code=404, detail="Semantic search is disabled")
+
+    return await asyncio.to_thread(vector_index.partition, user_organization_id(current_user, db))
+
+
+@app.get(f"{settings.API_V1_PREFIX}/search/semantic")
+@limiter.limit("60/minute")
+async def semantic_search(
+    request: Request,
+    q: str = Query(..., min_length=1),
+    k: int = Query(10, ge=1, le=100),
+    kinds: Optional[List[str]] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Semantic search over the organization's meetings
+
+    Matches transcript passages, summaries, decisions and action items by
+    meaning rather than by substring (see `search` on the meeting list).
+
+    - **q**: Search query
+    - **k**: Maximum number of passages to return
+    - **kinds**: Restrict to passage kinds (transcript, summary, decision, action_item)
+    """
+    if kinds and set(kinds) - set(PASSAGE_KINDS):
+        raise HTTPException(status_code=400, detail=f"Unknown passage kind; expected one of {', '.join(PASSAGE_KINDS)}")
+
+    partition = await organization_vectors(current_user, db)
+    hits = await asyncio.to_thread(partition.search, q, k, kinds)
+
+    return [
+        {
+            "meeting_id": hit.passage.meeting_id,
+            "kind": hit.passage.kind,
+            "text": hit.passage.text,
+            "score": round(hit.score, 4),
+            **hit.passage.meta
+        }
+        for hit in hits
+    ]
+
+
+@app.get(f"{settings.API_V1_PREFIX}/meetings/{{meeting_id}}/similar")
+async def get_similar_meetings(
+    meeting_id: UUID,
+    k: int = Query(5, ge=1, le=50),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Meetings whose discussions are semantically closest to this one"""
+    partition = await organization_vectors(current_user, db)
+    similar = await asyncio.to_thread(partition.similar_meetings, str(meeting_id), k)
+
+    return [
+        {
+            "meeting_id": meeting.meeting_id,
+            "title": meeting.passage.meta.get("title"),
+            "date": meeting.passage.meta.get("date"),
+            "score": round(meeting.score, 4),
+            "closest_passage": meeting.passage.text
+        }
+        for meeting in similar
+    ]
+
+
 # ============================================================================
 # AI-Powered Endpoints
 # ============================================================================
@@ -654,6 +839,7 @@ Agenda: {json.dumps(meeting.agenda_items)}
                 db.add(action_item)
 
         db.commit()
+        index_meeting_for_search(meeting_id)
 
         logger.info(f"AI analysis completed for meeting {meeting_id}")
         AI_PROCESSING_COUNT.labels(task_type="comprehensive", model="multi").inc()
@@ -667,62 +853,575 @@ Agenda: {json.dumps(meeting.agenda_items)}
 @limiter.limit("5/minute")
 async def ai_transcribe_audio(
     request: Request,
-    file: UploadFile = File(...),
+    file: Optional[UploadFile] = File(None),
     meeting_id: Optional[UUID] = None,
+    filename: Optional[str] = None,
     background_tasks: BackgroundTasks = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """
-    Transcribe audio/video file using Whisper API
+    Transcribe audio/video file
 
+    Runs on the organization's transcription backend (Whisper API or local CPU)
     Supports: MP3, WAV, M4A, MP4, WebM, etc.
     Max file size: 100MB
+
+    Send either a multipart `file` or the raw media as the request body
+    (pass `filename` for the extension). Raw bodies are transcoded while the
+    upload is still arriving.
+
+    With `meeting_id` the recording is stored as a MediaFile and queued for the
+    transcription workers; the response (202) carries the job to poll at
+    `/media/{media_id}/transcription`. Without it, the file is transcribed inline.
     """
-    # Validate file
-    if file.size > settings.MEDIA_MAX_SIZE_MB * 1024 * 1024:
+    limit = max_upload_bytes()
+
+    # Reject early when the client declares its size
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > limit + 64 * 1024:
         raise HTTPException(
             status_code=413,
             detail=f"File too large. Max size: {settings.MEDIA_MAX_SIZE_MB}MB"
         )
 
-    # Save file temporarily
-    import tempfile
-    import os
+    # Route to the tenant's transcription backend
+    membership = db.execute(
+        select(OrganizationMember).where(OrganizationMember.user_id == current_user.id).limit(1)
+    ).scalar_one_or_none()
+    backend = resolve_transcription_backend(
+        membership.organization.settings if membership else None
+    )
+
+    if file is not None:
+        chunks = upload_file_chunks(file)
+        filename = file.filename
+    else:
+        chunks = request.stream()
+
+    if meeting_id:
+        meeting = db.execute(
+            select(Meeting.id).where(and_(Meeting.id == meeting_id, Meeting.deleted_at.is_(None)))
+        ).scalar_one_or_none()
+        if not meeting:
+            raise HTTPException(status_code=404, detail="Meeting not found")
+
+    # Stream to disk; for inline runs the local engine gets pre-decoded 16 kHz WAV
+    try:
+        upload = await stream_upload_to_disk(
+            chunks,
+            suffix=os.path.splitext(filename or "")[1],
+            max_bytes=limit,
+            transcode=(backend == "local" and not meeting_id)
+        )
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+
+    if upload.size_bytes == 0:
+        upload.cleanup()
+        raise HTTPException(status_code=400, detail="Empty upload")
+
+    if meeting_id:
+        try:
+            media = await store_upload_as_media(
+                upload,
+                meeting_id,
+                filename,
+                file.content_type if file else request.headers.get("content-type"),
+                current_user,
+                db
+            )
+        finally:
+            upload.cleanup()
+
+        job_id = enqueue_transcription(media, db)
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as tmp:
-        content = file.read()
-        tmp.write(content)
-        tmp_path = tmp.name
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content={
+                "success": True,
+                "media_id": str(media.id),
+                "job_id": job_id,
+                "status": media.transcription_status,
+                "size_bytes": upload.size_bytes,
+                "content_sha256": upload.content_sha256
+            }
+        )
 
     try:
         # Transcribe
-        result = ai_orchestrator.transcribe_audio(tmp_path)
+        result = await ai_orchestrator.transcribe_audio(upload.audio_path, backend=backend)
 
         if not result.get("success"):
             raise HTTPException(status_code=500, detail=result.get("error"))
 
-        # If meeting_id provided, update meeting
-        if meeting_id:
-            meeting_result = db.execute(select(Meeting).where(Meeting.id == meeting_id))
-            meeting = meeting_result.scalar_one_or_none()
-            if meeting:
-                meeting.transcript = result["text"]
-                meeting.transcript_segments = result.get("segments", [])
-                db.commit()
+        segments = await transcription_service.label_stored_segments(
+            result.get("segments") or [], upload.audio_path
+        )
 
         return {
             "success": True,
             "transcript": result["text"],
             "language": result.get("language"),
             "duration": result.get("duration"),
-            "segments_count": len(result.get("segments", []))
+            "backend": result.get("backend"),
+            "segments_count": len(segments),
+            "speakers": transcription_service.speaker_summary(segments),
+            "size_bytes": upload.size_bytes,
+            "content_sha256": upload.content_sha256
         }
 
     finally:
-        # Cleanup temp file
-        if os.path.exists(tmp_path):
-            os.remove(tmp_path)
+        # Cleanup temp files
+        upload.cleanup()
+
+
+@app.get(f"{settings.API_V1_PREFIX}/meetings/{{meeting_id}}/transcript/segments")
+async def get_transcript_segments(
+    meeting_id: UUID,
+    start: Optional[float] = Query(None, ge=0),
+    end: Optional[float] = Query(None, ge=0),
+    speaker: Optional[str] = None,
+    limit: int = Query(500, ge=1, le=5000),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Get transcript segments for a time window and/or speaker
+
+    - **start** / **end**: Window in seconds (segments overlapping it are returned)
+    - **speaker**: Only this speaker's segments
+
+    Uses binary search over the columnar transcript; only matching segments are decoded.
+    """
+    transcript = load_compact_transcript(meeting_id, db)
+
+    if speaker:
+        indices = transcript.speaker_indices(speaker, start, end)
+    else:
+        indices = transcript.window(start, end)
+
+    return {
+        "meeting_id": str(meeting_id),
+        "total": len(indices),
+        "segments": transcript.segments(indices[:limit])
+    }
+
+
+@app.get(f"{settings.API_V1_PREFIX}/meetings/{{meeting_id}}/transcript/speakers")
+async def get_transcript_speakers(
+    meeting_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Per-speaker segment counts and talk time, aggregated over the columnar transcript"""
+    transcript = load_compact_transcript(meeting_id, db)
+
+    return {
+        "meeting_id": str(meeting_id),
+        "duration_seconds": transcript.duration_seconds,
+        "speakers": transcript.speaker_stats()
+    }
+
+
+TRANSCRIPT_EXPORT_FORMATS = {
+    "srt": ("application/x-subrip", "srt"),
+    "vtt": ("text/vtt", "vtt"),
+    "txt": ("text/plain", "txt"),
+    "plain": ("text/plain", "txt"),
+}
+
+
+@app.get(f"{settings.API_V1_PREFIX}/meetings/{{meeting_id}}/transcript/export")
+async def export_transcript(
+    meeting_id: UUID,
+    format: str = Query("srt", pattern="^(srt|vtt|txt|plain)$"),
+    include_timestamps: bool = True,
+    include_speakers: bool = True,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Download the transcript as a subtitle or text file
+
+    - **srt** / **vtt**: Subtitle cues with speaker labels
+    - **txt**: "[MM:SS] Speaker: text" lines
+    - **plain**: Transcript text only
+
+    The response is streamed; segments are decoded and formatted chunk by chunk.
+    """
+    transcript = load_compact_transcript(meeting_id, db)
+
+    db.execute(
+        update(Meeting)
+        .where(Meeting.id == meeting_id)
+        .values(export_count=func.coalesce(Meeting.export_count, 0) + 1)
+    )
+    db.commit()
+
+    segments = (
+        TranscriptSegment(
+            text=seg["text"],
+            start_time=seg["start"],
+            end_time=seg["end"],
+            speaker_id=seg["speaker"],
+            confidence=seg["confidence"]
+        )
+        for seg in transcript.iter_segments()
+    )
+
+    if format == "srt":
+        pieces = transcription_service.iter_srt(segments)
+    elif format == "vtt":
+        pieces = transcription_service.iter_vtt(segments)
+    elif format == "txt":
+        pieces = transcription_service.iter_transcript_lines(segments, include_timestamps, include_speakers)
+    else:
+        pieces = transcription_service.iter_plain_text(segments)
+
+    media_type, extension = TRANSCRIPT_EXPORT_FORMATS[format]
+
+    return StreamingResponse(
+        iter_chunks(pieces),
+        media_type=f"{media_type}; charset=utf-8",
+        headers={"Content-Disposition": f'attachment; filename="transcript-{meeting_id}.{extension}"'}
+    )
+
+
+# ============================================================================
+# Resumable Media Upload Endpoints
+# ============================================================================
+
+def media_file_type(filename: str) -> Optional[str]:
+    extension = os.path.splitext(filename)[1].lstrip(".").lower()
+    if extension in settings.MEDIA_ALLOWED_AUDIO_FORMATS:
+        return "audio"
+    if extension in settings.MEDIA_ALLOWED_VIDEO_FORMATS:
+        return "video"
+    if extension in settings.MEDIA_ALLOWED_IMAGE_FORMATS:
+        return "image"
+    return None
+
+
+def enqueue_transcription(media: MediaFile, db: Session) -> str:
+    """Mark a stored MediaFile pending and hand it to the transcription workers"""
+    job_id = str(uuid.uuid4())
+
+    # Committed before sending so a fast worker always sees its own job id
+    media.transcription_status = "pending"
+    media.transcription_job_id = job_id
+    media.transcription_progress = 0
+    media.transcription_error = None
+    db.commit()
+
+    celery_app.send_task(
+        TRANSCRIBE_MEDIA_FILE_TASK,
+        args=[str(media.id)],
+        task_id=job_id,
+        queue=settings.TRANSCRIPTION_QUEUE
+    )
+    return job_id
+
+
+async def store_upload_as_media(
+    upload,
+    meeting_id: UUID,
+    filename: Optional[str],
+    mime_type: Optional[str],
+    current_user: User,
+    db: Session
+) -> MediaFile:
+    """Move a streamed upload into media storage and record it as a MediaFile"""
+    filename = filename or "recording"
+    storage = get_media_storage()
+    media_id = uuid.uuid4()
+
+    media = MediaFile(
+        id=media_id,
+        meeting_id=meeting_id,
+        file_type=media_file_type(filename) or "audio",
+        mime_type=mime_type or "application/octet-stream",
+        file_size=upload.size_bytes,
+        original_filename=filename,
+        storage_path=f"{meeting_id}/{media_id}{os.path.splitext(filename)[1].lower()}",
+        storage_backend=storage.name,
+        upload_status="complete",
+        upload_offset=upload.size_bytes,
+        content_sha256=upload.content_sha256,
+        uploaded_by=current_user.id
+    )
+
+    await storage.import_file(media.storage_path, upload.path)
+    db.add(media)
+    db.commit()
+    return media
+
+
+def get_upload(media_id: UUID, db: Session) -> MediaFile:
+    media = db.execute(select(MediaFile).where(MediaFile.id == media_id)).scalar_one_or_none()
+    if not media:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    return media
+
+
+def upload_offset_headers(media: MediaFile) -> Dict[str, str]:
+    return {
+        "Upload-Offset": str(media.upload_offset),
+        "Upload-Length": str(media.file_size),
+        "Cache-Control": "no-store"
+    }
+
+
+@app.post(
+    f"{settings.API_V1_PREFIX}/meetings/{{meeting_id}}/media/uploads",
+    status_code=status.HTTP_201_CREATED
+)
+async def create_media_upload(
+    meeting_id: UUID,
+    upload: MediaUploadCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Start a resumable upload
+
+    Send the file with PATCH requests carrying `Upload-Offset`, ask for the
+    current offset with HEAD after a failure, then POST `/complete`.
+    """
+    meeting = db.execute(
+        select(Meeting.id).where(and_(Meeting.id == meeting_id, Meeting.deleted_at.is_(None)))
+    ).scalar_one_or_none()
+    if not meeting:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+
+    if upload.file_size > max_upload_bytes():
+        raise HTTPException(
+            status_code=413,
+            detail=f"File too large. Max size: {settings.MEDIA_MAX_SIZE_MB}MB"
+        )
+
+    file_type = media_file_type(upload.filename)
+    if not file_type:
+        raise HTTPException(status_code=415, detail="Unsupported file format")
+
+    storage = get_media_storage()
+    media_id = uuid.uuid4()
+    extension = os.path.splitext(upload.filename)[1].lower()
+
+    media = MediaFile(
+        id=media_id,
+        meeting_id=meeting_id,
+        file_type=file_type,
+        mime_type=upload.mime_type or "application/octet-stream",
+        file_size=upload.file_size,
+        original_filename=upload.filename,
+        storage_path=f"{meeting_id}/{media_id}{extension}",
+        storage_backend=storage.name,
+        upload_status="uploading",
+        upload_offset=0,
+        uploaded_by=current_user.id
+    )
+    db.add(media)
+    db.commit()
+
+    return JSONResponse(
+        status_code=status.HTTP_201_CREATED,
+        content={
+            "upload_id": str(media_id),
+            "offset": 0,
+            "file_size": upload.file_size,
+            "max_chunk_size": settings.MEDIA_UPLOAD_CHUNK_MAX_MB * 1024 * 1024
+        },
+        headers=upload_offset_headers(media)
+    )
+
+
+@app.api_route(f"{settings.API_V1_PREFIX}/media/uploads/{{media_id}}", methods=["HEAD", "GET"])
+async def get_media_upload_offset(
+    media_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Current offset of a resumable upload - resume the PATCH from here"""
+    media = get_upload(media_id, db)
+
+    return JSONResponse(
+        content={
+            "upload_id": str(media.id),
+            "offset": media.upload_offset,
+            "file_size": media.file_size,
+            "upload_status": media.upload_status
+        },
+        headers=upload_offset_headers(media)
+    )
+
+
+@app.patch(f"{settings.API_V1_PREFIX}/media/uploads/{{media_id}}")
+async def upload_media_chunk(
+    media_id: UUID,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Append a chunk at `Upload-Offset`
+
+    The body is written straight to storage as it arrives. A mismatched
+    offset returns 409 with the server's offset so the client can resume.
+    """
+    media = get_upload(media_id, db)
+
+    if media.upload_status != "uploading":
+        raise HTTPException(status_code=409, detail=f"Upload is {media.upload_status}")
+
+    try:
+        offset = int(request.headers["upload-offset"])
+    except (KeyError, ValueError):
+        raise HTTPException(status_code=400, detail="Missing or invalid Upload-Offset header")
+
+    if offset != media.upload_offset:
+        return JSONResponse(
+            status_code=409,
+            content={"detail": "Offset mismatch", "offset": media.upload_offset},
+            headers=upload_offset_headers(media)
+        )
+
+    max_bytes = min(
+        media.file_size - offset,
+        settings.MEDIA_UPLOAD_CHUNK_MAX_MB * 1024 * 1024
+    )
+
+    async def body():
+        # Keep what arrived before a dropped connection; the client resumes after it
+        try:
+            async for chunk in request.stream():
+                yield chunk
+        except ClientDisconnect:
+            return
+
+    storage = get_media_storage(media.storage_backend)
+    try:
+        written = await storage.write_chunk(media.storage_path, offset, body(), max_bytes)
+    except MediaStorageError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+
+    # Conditional advance: a concurrent PATCH for the same offset loses
+    advanced = db.execute(
+        update(MediaFile)
+        .where(and_(MediaFile.id == media_id, MediaFile.upload_offset == offset))
+        .values(upload_offset=offset + written)
+    ).rowcount
+    db.commit()
+
+    if not advanced:
+        db.refresh(media)
+        return JSONResponse(
+            status_code=409,
+            content={"detail": "Offset mismatch", "offset": media.upload_offset},
+            headers=upload_offset_headers(media)
+        )
+
+    db.refresh(media)
+    return Response(status_code=status.HTTP_204_NO_CONTENT, headers=upload_offset_headers(media))
+
+
+@app.post(f"{settings.API_V1_PREFIX}/media/uploads/{{media_id}}/complete")
+async def complete_media_upload(
+    media_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Finalize a resumable upload and queue transcription
+
+    The stored file is handed to the transcription pipeline in place.
+    """
+    media = get_upload(media_id, db)
+
+    if media.upload_status == "complete":
+        return {"upload_id": str(media.id), "upload_status": media.upload_status}
+
+    if media.upload_offset != media.file_size:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Upload incomplete: {media.upload_offset} of {media.file_size} bytes received"
+        )
+
+    storage = get_media_storage(media.storage_backend)
+    try:
+        media.content_sha256 = await storage.finalize(media.storage_path, media.file_size)
+    except MediaStorageError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    media.upload_status = "complete"
+    db.commit()
+
+    if media.file_type in ("audio", "video"):
+        enqueue_transcription(media, db)
+
+    return {
+        "upload_id": str(media.id),
+        "upload_status": media.upload_status,
+        "content_sha256": media.content_sha256,
+        "transcription_status": media.transcription_status,
+        "transcription_job_id": media.transcription_job_id
+    }
+
+
+@app.delete(f"{settings.API_V1_PREFIX}/media/uploads/{{media_id}}", status_code=status.HTTP_204_NO_CONTENT)
+async def abort_media_upload(
+    media_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Abort an unfinished upload and discard its bytes"""
+    media = get_upload(media_id, db)
+
+    if media.upload_status != "uploading":
+        raise HTTPException(status_code=409, detail=f"Upload is {media.upload_status}")
+
+    await get_media_storage(media.storage_backend).delete(media.storage_path)
+    media.upload_status = "aborted"
+    db.commit()
+
+
+@app.get(f"{settings.API_V1_PREFIX}/media/{{media_id}}/transcription")
+async def get_media_transcription_status(
+    media_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Transcription job status: pending, processing, completed or failed, with progress"""
+    media = get_upload(media_id, db)
+
+    return {
+        "media_id": str(media.id),
+        "meeting_id": str(media.meeting_id),
+        "status": media.transcription_status,
+        "progress": media.transcription_progress or 0,
+        "attempts": media.transcription_attempts or 0,
+        "job_id": media.transcription_job_id,
+        "error": media.transcription_error
+    }
+
+
+@app.post(f"{settings.API_V1_PREFIX}/media/{{media_id}}/transcription/retry")
+async def retry_media_transcription(
+    media_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Re-queue a failed transcription"""
+    media = get_upload(media_id, db)
+
+    if media.upload_status != "complete" or media.transcription_status != "failed":
+        raise HTTPException(status_code=409, detail="Only failed transcriptions can be retried")
+
+    return {
+        "media_id": str(media.id),
+        "status": "pending",
+        "job_id": enqueue_transcription(media, db)
+    }
 
 
 # ============================================================================
@@ -760,6 +1459,34 @@ async def list_action_items(
     return action_items
 
 
+@app.get(f"{settings.API_V1_PREFIX}/action-items/deadlines")
+async def get_deadline_risks(
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    assignee: Optional[str] = None,
+    overload_threshold: int = Query(settings.DEADLINE_OVERLOAD_THRESHOLD, ge=0),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Deadline conflicts and overloaded assignees among open action items
+
+    Answered from the organization's in-memory deadline index (range lookups
+    per assignee, kept current by ActionItem commits), so dashboards can poll it.
+    """
+    organization_id = user_organization_id(current_user, db)
+    deadline_indexes.ensure_fresh(db)
+
+    # Commits update the index from the thread pool while we read it
+    with deadline_indexes.lock:
+        deadline_index = deadline_indexes.partition(organization_id)
+        return {
+            "conflicts": deadline_index.conflicts(start_date, end_date, assignee),
+            "overloaded": deadline_index.overloaded(overload_threshold, start_date, end_date),
+            "open_action_items": len(deadline_index)
+        }
+
+
 @app.post(f"{settings.API_V1_PREFIX}/action-items", response_model=ActionItemResponse, status_code=status.HTTP_201_CREATED)
 async def create_action_item(
     action_item: ActionItemCreate,
@@ -795,12 +1522,165 @@ async def update_action_item(
     if item_update.status == "completed" and not action_item.completed_at:
         action_item.completed_at = datetime.utcnow()
 
+    # A task in a dependency graph follows the commit (see ai.dependency_graph)
     db.commit()
     db.refresh(action_item)
 
     return action_item
 
 
+# ----------------------------------------------------------------------------
+# Dependencies
+# ----------------------------------------------------------------------------
+
+def action_item_node(action_item: ActionItem) -> TaskNode:
+    """
+    An ActionItem as a dependency graph task
+
+    Its project is its meeting's, identified like the classifier's tasks:
+    by the registered project ID when the meeting's project is registered.
+    """
+    project_name = action_item.meeting.project_name
+    return TaskNode(
+        task_id=str(action_item.id),
+        text=action_item.description,
+        project_id=project_classifier.project_id_for_name(project_name) or project_name,
+        project_name=project_name,
+        is_open=is_open_status(action_item.status),
+        due_date=action_item.due_date.isoformat() if action_item.due_date else None
+    )
+
+
+def organization_action_items(item_ids: List[UUID], organization_id: Any, db: Session) -> Dict[UUID, ActionItem]:
+    """The organization's action items among `item_ids` (404 if any is missing)"""
+    items = db.execute(
+        select(ActionItem)
+        .join(Meeting, ActionItem.meeting_id == Meeting.id)
+        .where(and_(ActionItem.id.in_(item_ids), Meeting.organization_id == organization_id))
+    ).scalars().all()
+
+    found = {item.id: item for item in items}
+    missing = [str(item_id) for item_id in item_ids if item_id not in found]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Action items not found: {', '.join(missing)}")
+    return found
+
+
+def blocking_task_response(blocking: BlockingTask) -> Dict[str, Any]:
+    return {
+        "id": blocking.task.task_id,
+        "description": blocking.task.text,
+        "project": blocking.task.project_name,
+        "due_date": blocking.task.due_date,
+        "depth": blocking.depth,
+        "via": blocking.via
+    }
+
+
+def task_node_response(node: TaskNode) -> Dict[str, Any]:
+    return {
+        "id": node.task_id,
+        "description": node.text,
+        "project": node.project_name,
+        "due_date": node.due_date
+    }
+
+
+@app.post(f"{settings.API_V1_PREFIX}/action-items/{{item_id}}/dependencies", status_code=status.HTTP_201_CREATED)
+async def add_action_item_dependencies(
+    item_id: UUID,
+    dependency: DependencyCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Record that an action item waits on other action items"""
+    organization_id = user_organization_id(current_user, db)
+    items = organization_action_items([item_id, *dependency.blocked_by], organization_id, db)
+
+    # Tasks already in the graph keep their (possibly classified) project
+    graph = await asyncio.to_thread(dependency_graphs.graph, organization_id)
+    new_tasks = [action_item_node(item) for item in items.values() if str(item.id) not in graph]
+    await asyncio.to_thread(graph.upsert_tasks, new_tasks)
+    added = await asyncio.to_thread(
+        graph.add_dependencies, [(item_id, blocker_id) for blocker_id in dependency.blocked_by]
+    )
+
+    return {"added": len(added), "blocked_by": graph.waits_on(item_id)}
+
+
+@app.delete(
+    f"{settings.API_V1_PREFIX}/action-items/{{item_id}}/dependencies/{{blocker_id}}",
+    status_code=status.HTTP_204_NO_CONTENT
+)
+async def remove_action_item_dependency(
+    item_id: UUID,
+    blocker_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Remove a dependency between two action items"""
+    graph = await asyncio.to_thread(dependency_graphs.graph, user_organization_id(current_user, db))
+    await asyncio.to_thread(graph.remove_dependency, item_id, blocker_id)
+
+
+@app.get(f"{settings.API_V1_PREFIX}/action-items/{{item_id}}/blocked-by")
+async def get_action_item_blockers(
+    item_id: UUID,
+    max_depth: Optional[int] = Query(None, ge=1),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Open action items this one waits on, and those waiting on it
+
+    Chains are followed through other open items (nearest first); `via`
+    is the next item along the chain.
+    """
+    graph = await asyncio.to_thread(dependency_graphs.graph, user_organization_id(current_user, db))
+    blocked_by = await asyncio.to_thread(graph.blocked_by, item_id, max_depth)
+    blocking = await asyncio.to_thread(graph.blocking, item_id, max_depth)
+
+    return {
+        "blocked_by": [blocking_task_response(task) for task in blocked_by],
+        "blocking": [blocking_task_response(task) for task in blocking]
+    }
+
+
+@app.get(f"{settings.API_V1_PREFIX}/dependencies/critical-path")
+async def get_critical_path(
+    project: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    The longest chain of open action items, first to be done first
+
+    With `project`, the longest chain through one of the project's items
+    (including the other projects' items it waits on or holds up).
+    """
+    graph = await asyncio.to_thread(dependency_graphs.graph, user_organization_id(current_user, db))
+    path = await asyncio.to_thread(graph.critical_path, project)
+
+    return {
+        "length": len(path.tasks),
+        "cyclic": path.cyclic,
+        "tasks": [task_node_response(task) for task in path.tasks]
+    }
+
+
+@app.get(f"{settings.API_V1_PREFIX}/dependencies/cycles")
+async def get_dependency_cycles(
+    project: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Groups of open action items that wait on each other (deadlocks), optionally only those touching a project"""
+    graph = await asyncio.to_thread(dependency_graphs.graph, user_organization_id(current_user, db))
+    cycles = await asyncio.to_thread(graph.cycles, project)
+
+    return [[task_node_response(task) for task in cycle] for cycle in cycles]
+
+
 # ============================================================================
 # Analytics Endpoints
 # ============================================================================
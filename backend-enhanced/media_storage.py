@@ -0,0 +1,263 @@
+"""
+Media Storage
+Offset-addressed chunk storage for resumable uploads (local disk or Azure block blobs)
+"""
+import asyncio
+import base64
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class MediaStorageError(Exception):
+    """Chunk could not be stored or the upload could not be finalized"""
+
+
+class MediaStorage(ABC):
+    """
+    Where upload bytes land
+
+    Keys are opaque relative names (e.g. "<meeting_id>/<media_id>.mp3");
+    MediaFile.storage_path stores the key.
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    async def write_chunk(self, key: str, offset: int, chunks: AsyncIterator[bytes], max_bytes: int) -> int:
+        """
+        Store bytes arriving at `offset`
+
+        Returns the number of bytes durably written. For local storage this can
+        be a partial count when the client disconnects mid-chunk.
+        """
+
+    @abstractmethod
+    async def finalize(self, key: str, total_size: int) -> Optional[str]:
+        """Make the upload visible under `key`; returns its SHA-256 when cheap to compute"""
+
+    @abstractmethod
+    async def import_file(self, key: str, path: str):
+        """Take ownership of a complete local file (moved, not copied, when possible)"""
+
+    @abstractmethod
+    async def delete(self, key: str):
+        """Remove a finalized or partial upload"""
+
+    @abstractmethod
+    def open_local(self, key: str):
+        """Async context manager yielding a local file path for processing"""
+
+
+# ============================================================================
+# LOCAL DISK
+# ============================================================================
+
+class LocalMediaStorage(MediaStorage):
+    """Files under MEDIA_UPLOAD_DIR; partial uploads live in "<key>.part" until finalized"""
+
+    name = "local"
+
+    def __init__(self, root: str = settings.MEDIA_UPLOAD_DIR):
+        self.root = os.path.abspath(root)
+
+    def path(self, key: str) -> str:
+        path = os.path.abspath(os.path.join(self.root, key))
+        if not path.startswith(self.root + os.sep):
+            raise MediaStorageError(f"Invalid storage key: {key}")
+        return path
+
+    async def write_chunk(self, key: str, offset: int, chunks: AsyncIterator[bytes], max_bytes: int) -> int:
+        part_path = self.path(key) + ".part"
+        os.makedirs(os.path.dirname(part_path), exist_ok=True)
+
+        fd = os.open(part_path, os.O_WRONLY | os.O_CREAT, 0o640)
+        written = 0
+        try:
+            async for chunk in chunks:
+                if written + len(chunk) > max_bytes:
+                    raise MediaStorageError("Chunk exceeds the allowed size")
+                # pwrite: no shared file position, safe for retried/overlapping requests
+                await asyncio.to_thread(os.pwrite, fd, chunk, offset + written)
+                written += len(chunk)
+        finally:
+            # Bytes already written are kept so the client can resume after them
+            await asyncio.to_thread(os.fsync, fd)
+            os.close(fd)
+
+        return written
+
+    async def finalize(self, key: str, total_size: int) -> Optional[str]:
+        final_path = self.path(key)
+        part_path = final_path + ".part"
+
+        if not os.path.exists(part_path):
+            raise MediaStorageError("No upload data received")
+
+        # Drop any bytes past the declared length (e.g. an overlong retried chunk)
+        os.truncate(part_path, total_size)
+
+        def sha256() -> str:
+            hasher = hashlib.sha256()
+            with open(part_path, "rb") as f:
+                for block in iter(lambda: f.read(1024 * 1024), b""):
+                    hasher.update(block)
+            return hasher.hexdigest()
+
+        digest = await asyncio.to_thread(sha256)
+
+        # Rename in place - the transcription pipeline reads this file directly
+        os.replace(part_path, final_path)
+        return digest
+
+    async def import_file(self, key: str, path: str):
+        final_path = self.path(key)
+        os.makedirs(os.path.dirname(final_path), exist_ok=True)
+        # Rename when on the same filesystem, copy+delete otherwise
+        await asyncio.to_thread(shutil.move, path, final_path)
+
+    async def delete(self, key: str):
+        for path in (self.path(key), self.path(key) + ".part"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    @asynccontextmanager
+    async def open_local(self, key: str):
+        yield self.path(key)
+
+
+# ============================================================================
+# AZURE BLOB STORAGE
+# ============================================================================
+
+class AzureBlobMediaStorage(MediaStorage):
+    """
+    Block blobs in AZURE_STORAGE_CONTAINER_NAME
+
+    Each PATCH chunk is staged as one block whose id encodes its byte offset,
+    so the block list can be rebuilt and committed in order at finalize without
+    any extra bookkeeping.
+    """
+
+    name = "azure"
+
+    def __init__(
+        self,
+        connection_string: Optional[str] = settings.AZURE_STORAGE_CONNECTION_STRING,
+        container: str = settings.AZURE_STORAGE_CONTAINER_NAME
+    ):
+        try:
+            from azure.storage.blob.aio import BlobServiceClient
+        except ImportError as e:
+            raise RuntimeError("Azure media storage requires the azure-storage-blob package") from e
+
+        if not connection_string:
+            raise RuntimeError("AZURE_STORAGE_CONNECTION_STRING is not configured")
+
+        self.service = BlobServiceClient.from_connection_string(connection_string)
+        self.container = container
+
+    def _blob(self, key: str):
+        return self.service.get_blob_client(container=self.container, blob=key)
+
+    @staticmethod
+    def _block_id(offset: int) -> str:
+        return base64.b64encode(f"{offset:020d}".encode()).decode()
+
+    @staticmethod
+    def _block_offset(block_id: str) -> int:
+        return int(base64.b64decode(block_id))
+
+    async def write_chunk(self, key: str, offset: int, chunks: AsyncIterator[bytes], max_bytes: int) -> int:
+        # A block is all-or-nothing, so the chunk is buffered (bounded by max_bytes)
+        buffer = bytearray()
+        async for chunk in chunks:
+            if len(buffer) + len(chunk) > max_bytes:
+                raise MediaStorageError("Chunk exceeds the allowed size")
+            buffer.extend(chunk)
+
+        if buffer:
+            await self._blob(key).stage_block(block_id=self._block_id(offset), data=bytes(buffer))
+        return len(buffer)
+
+    async def finalize(self, key: str, total_size: int) -> Optional[str]:
+        from azure.storage.blob import BlobBlock
+
+        blob = self._blob(key)
+        _, uncommitted = await blob.get_block_list("uncommitted")
+
+        blocks = sorted(uncommitted, key=lambda b: self._block_offset(b.id))
+
+        # Keep exactly the blocks that tile [0, total_size)
+        ordered, position = [], 0
+        for block in blocks:
+            if self._block_offset(block.id) == position:
+                ordered.append(BlobBlock(block_id=block.id))
+                position += block.size
+
+        if position != total_size:
+            raise MediaStorageError(f"Staged blocks cover {position} of {total_size} bytes")
+
+        await blob.commit_block_list(ordered)
+        return None
+
+    async def import_file(self, key: str, path: str):
+        with open(path, "rb") as f:
+            await self._blob(key).upload_blob(f, overwrite=True)
+        os.remove(path)
+
+    async def delete(self, key: str):
+        try:
+            await self._blob(key).delete_blob()
+        except Exception as e:
+            logger.warning(f"⚠️ Could not delete blob {key}: {e}")
+
+    @asynccontextmanager
+    async def open_local(self, key: str):
+        # Remote blob: stream it to a temp file for decoders that need a path
+        suffix = os.path.splitext(key)[1]
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        try:
+            downloader = await self._blob(key).download_blob()
+            with os.fdopen(fd, "wb") as out:
+                async for chunk in downloader.chunks():
+                    await asyncio.to_thread(out.write, chunk)
+            yield path
+        finally:
+            if os.path.exists(path):
+                os.remove(path)
+
+
+# ============================================================================
+# BACKEND SELECTION
+# ============================================================================
+
+MEDIA_STORAGE_BACKENDS = {
+    LocalMediaStorage.name: LocalMediaStorage,
+    AzureBlobMediaStorage.name: AzureBlobMediaStorage,
+}
+
+_storage_instances = {}
+
+
+def get_media_storage(name: Optional[str] = None) -> MediaStorage:
+    """Shared storage instance; Azure when a connection string is configured"""
+
+    name = name or ("azure" if settings.AZURE_STORAGE_CONNECTION_STRING else "local")
+
+    if name not in MEDIA_STORAGE_BACKENDS:
+        raise ValueError(f"Unknown media storage: {name}")
+
+    if name not in _storage_instances:
+        _storage_instances[name] = MEDIA_STORAGE_BACKENDS[name]()
+
+    return _storage_instances[name]
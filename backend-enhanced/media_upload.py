@@ -0,0 +1,151 @@
+"""
+Streamed Media Uploads
+Chunked upload-to-disk with incremental size limit, hashing and overlapped transcoding
+"""
+import asyncio
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+
+class UploadTooLargeError(Exception):
+    """Upload exceeded MEDIA_MAX_SIZE_MB"""
+
+
+@dataclass
+class StreamedUpload:
+    """An upload persisted to a temp file"""
+    path: str
+    size_bytes: int
+    content_sha256: str
+    transcoded_path: Optional[str] = None  # 16 kHz mono WAV, when transcoding succeeded
+
+    @property
+    def audio_path(self) -> str:
+        """Best file to hand to transcription"""
+        return self.transcoded_path or self.path
+
+    def cleanup(self):
+        for path in (self.path, self.transcoded_path):
+            if path and os.path.exists(path):
+                os.remove(path)
+
+
+def max_upload_bytes() -> int:
+    return settings.MEDIA_MAX_SIZE_MB * 1024 * 1024
+
+
+async def upload_file_chunks(file, chunk_size: int = UPLOAD_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Read a FastAPI UploadFile in fixed-size chunks"""
+    while True:
+        chunk = await file.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
+async def _start_transcoder(output_path: str) -> Optional[asyncio.subprocess.Process]:
+    """ffmpeg reading the upload from stdin, writing 16 kHz mono PCM WAV"""
+
+    if not shutil.which("ffmpeg"):
+        return None
+
+    return await asyncio.create_subprocess_exec(
+        "ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+        "-i", "pipe:0",
+        "-vn", "-ac", "1", "-ar", "16000", "-acodec", "pcm_s16le",
+        output_path,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL
+    )
+
+
+async def stream_upload_to_disk(
+    chunks: AsyncIterator[bytes],
+    suffix: str = "",
+    max_bytes: Optional[int] = None,
+    transcode: bool = False
+) -> StreamedUpload:
+    """
+    Persist an upload chunk by chunk
+
+    - Size limit enforced as bytes arrive (UploadTooLargeError, nothing kept on disk)
+    - SHA-256 computed in the same pass
+    - With transcode=True, ffmpeg decodes to 16 kHz mono WAV concurrently, so
+      decoding overlaps the rest of the upload. Containers that can't be decoded
+      from a pipe (e.g. MP4 with a trailing moov atom) fall back to the original file.
+
+    Memory use is bounded by the chunk size, independent of upload size.
+    """
+
+    max_bytes = max_bytes if max_bytes is not None else max_upload_bytes()
+
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    transcoded_path = None
+    transcoder = None
+
+    if transcode:
+        wav_fd, transcoded_path = tempfile.mkstemp(suffix=".wav")
+        os.close(wav_fd)
+        transcoder = await _start_transcoder(transcoded_path)
+
+    hasher = hashlib.sha256()
+    size = 0
+
+    try:
+        with os.fdopen(fd, "wb") as out:
+            async for chunk in chunks:
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLargeError(
+                        f"File too large. Max size: {max_bytes / (1024 * 1024):g}MB"
+                    )
+
+                hasher.update(chunk)
+                await asyncio.to_thread(out.write, chunk)
+
+                if transcoder is not None:
+                    try:
+                        transcoder.stdin.write(chunk)
+                        await transcoder.stdin.drain()
+                    except (BrokenPipeError, ConnectionResetError):
+                        # ffmpeg gave up on this container; keep receiving the upload
+                        await transcoder.wait()
+                        transcoder = None
+
+        if transcoder is not None:
+            transcoder.stdin.close()
+            if await transcoder.wait() != 0:
+                transcoder = None
+
+    except BaseException:
+        if transcoder is not None and transcoder.returncode is None:
+            transcoder.kill()
+            await transcoder.wait()
+        for p in (path, transcoded_path):
+            if p and os.path.exists(p):
+                os.remove(p)
+        raise
+
+    if transcoded_path and transcoder is None:
+        logger.info("⚠️ Streaming transcode unavailable for this upload, using original file")
+        os.remove(transcoded_path)
+        transcoded_path = None
+
+    return StreamedUpload(
+        path=path,
+        size_bytes=size,
+        content_sha256=hasher.hexdigest(),
+        transcoded_path=transcoded_path
+    )
@@ -11,17 +11,52 @@ Features:
 """
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
 
+from ai.vector_index import vector_index
 from ai_multi_model import orchestrator, ModelType
+from config import settings
+from copilot_agenda import AgendaScore, AgendaTracker
+from copilot_batching import ActionItemBatcher, BatchResult
+from copilot_metrics import MeetingMetrics
+from copilot_state_store import (
+    CopilotStateStore, SessionRouter, StoredSession,
+    decode_segment, encode_insight, encode_segment, from_epoch, to_epoch
+)
+from copilot_summary import SummaryTree
+from copilot_window import BoundedLog, COPILOT_ACTIVE_SESSIONS, ITEM_OVERHEAD_BYTES
+from keyword_matcher import KeywordGroups
 from transcription_service import TranscriptSegment
 
 logger = logging.getLogger(__name__)
 
 
+# Segment signals, all detected in one pass per segment
+ACTION_KEYWORDS = [
+    "will", "should", "need to", "have to", "must",
+    "todo", "to do", "action item", "follow up",
+    "assign", "responsible for"
+]
+DECISION_KEYWORDS = [
+    "decided", "decision", "agreed", "going with",
+    "chosen", "selected", "approved", "confirmed"
+]
+BLOCKER_KEYWORDS = ["blocked", "blocker", "can't proceed", "waiting for", "stuck"]
+
+SEGMENT_SIGNALS = KeywordGroups({
+    "action": ACTION_KEYWORDS,
+    "decision": DECISION_KEYWORDS,
+    "blocker": BLOCKER_KEYWORDS,
+})
+
+# Set while serving work forwarded by another worker: handle it here, never re-forward
+_serving_forwarded: ContextVar[bool] = ContextVar("copilot_serving_forwarded", default=False)
+
+
 class CopilotMode(str, Enum):
     """Copilot operating modes"""
     ACTIVE = "active"           # Full real-time assistance
@@ -39,31 +74,84 @@ class MeetingInsight:
     timestamp: datetime
     context: Optional[str] = None
 
+    @classmethod
+    def decode(cls, data: List[Any]) -> "MeetingInsight":
+        """Inverse of copilot_state_store.encode_insight"""
+        insight_type, content, confidence, timestamp, context = data
+        return cls(
+            type=insight_type,
+            content=content,
+            confidence=confidence,
+            timestamp=from_epoch(timestamp),
+            context=context
+        )
+
+
+def _memory_budget(share: float) -> int:
+    return int(settings.COPILOT_SESSION_MAX_MEMORY_KB * 1024 * share)
+
+
+# Segments get 3/4 of a session's memory cap, the four insight logs share the rest
+def _segment_log() -> BoundedLog:
+    return BoundedLog(
+        "segments", settings.COPILOT_SEGMENT_WINDOW, _memory_budget(0.75),
+        lambda seg: len(seg.text) + ITEM_OVERHEAD_BYTES
+    )
+
+
+def _insight_log(kind: str) -> BoundedLog:
+    return BoundedLog(
+        kind, settings.COPILOT_INSIGHT_WINDOW, _memory_budget(0.0625),
+        lambda insight: len(insight.content) + len(insight.context or "") + ITEM_OVERHEAD_BYTES
+    )
+
 
 @dataclass
 class CopilotState:
-    """Current state of the copilot"""
+    """
+    Current state of the copilot
+
+    Segment and insight logs are bounded windows over the most recent items;
+    their `count` is the session total. The full history lives in Redis; the
+    summary tree carries everything the end-of-meeting report needs.
+    """
     meeting_id: str
     mode: CopilotMode = CopilotMode.ACTIVE
     start_time: datetime = field(default_factory=datetime.utcnow)
+    organization_id: Optional[str] = None  # scopes context lookups in earlier meetings
 
     # Tracking
-    transcript_segments: List[TranscriptSegment] = field(default_factory=list)
-    action_items_detected: List[MeetingInsight] = field(default_factory=list)
-    decisions_detected: List[MeetingInsight] = field(default_factory=list)
-    questions_raised: List[MeetingInsight] = field(default_factory=list)
-    blockers_identified: List[MeetingInsight] = field(default_factory=list)
+    transcript_segments: BoundedLog = field(default_factory=_segment_log)
+    summary_tree: SummaryTree = field(default_factory=SummaryTree)
+    action_items_detected: BoundedLog = field(default_factory=lambda: _insight_log("action_items"))
+    decisions_detected: BoundedLog = field(default_factory=lambda: _insight_log("decisions"))
+    questions_raised: BoundedLog = field(default_factory=lambda: _insight_log("questions"))
+    blockers_identified: BoundedLog = field(default_factory=lambda: _insight_log("blockers"))
 
     # Metrics
     off_topic_count: int = 0
     overtime_warnings: int = 0
     participation_by_speaker: Dict[str, int] = field(default_factory=dict)
+    metrics: MeetingMetrics = field(default_factory=MeetingMetrics)
 
     # Agenda tracking
     agenda_items: List[Dict] = field(default_factory=list)
     current_agenda_index: int = 0
     agenda_start_times: Dict[int, datetime] = field(default_factory=dict)
 
+    def insight_logs(self) -> Dict[str, BoundedLog]:
+        """Insight type -> log"""
+        return {
+            "action_item": self.action_items_detected,
+            "decision": self.decisions_detected,
+            "question": self.questions_raised,
+            "blocker": self.blockers_identified
+        }
+
+    @property
+    def memory_bytes(self) -> int:
+        return self.transcript_segments.bytes + sum(log.bytes for log in self.insight_logs().values())
+
 
 class MeetingCopilot:
     """
@@ -81,6 +169,7 @@ class MeetingCopilot:
     - Alert when running over
     - Track who speaks and for how long
     - Identify blockers
+    - Recall earlier discussions of questions and blockers
     - Suggest next steps
 
     After Meeting:
@@ -89,17 +178,56 @@ class MeetingCopilot:
     - Schedule next meeting if needed
     - Update project management tools
     - Send reminders for action items
+
+    Scaling:
+    =======
+
+    Session state is persisted to Redis (see copilot_state_store), so any
+    worker can pick a session up after a restart. Each meeting is owned by
+    one worker on a consistent-hash ring of live workers; calls that land on
+    another worker are forwarded to the owner, which keeps the session hot in
+    `active_sessions` and runs the batching and summarization for it.
+    Without Redis (or COPILOT_STATE_BACKEND=memory) everything stays local
+    and segments/insights older than the windows are discarded.
     """
 
     def __init__(self):
         self.active_sessions: Dict[str, CopilotState] = {}
+        self.action_item_batchers: Dict[str, ActionItemBatcher] = {}
+        self.summary_tasks: Dict[str, asyncio.Task] = {}
+        self.session_locks: Dict[str, asyncio.Lock] = {}
+        self.agenda_trackers: Dict[str, AgendaTracker] = {}
+
+        self.store = CopilotStateStore()
+        self.router = SessionRouter()
+        self._started = False
+
         logger.info("🤖 Meeting Copilot initialized")
 
+    async def start(self):
+        """Join the worker ring (done lazily on first use)"""
+
+        if self._started:
+            return
+        self._started = True
+
+        if settings.COPILOT_STATE_BACKEND == "redis":
+            await self.router.start(self._handle_forwarded, self._release_moved_sessions)
+            self.store.enabled = self.router.distributed
+
+    async def stop(self):
+        """Leave the worker ring; this worker's meetings move to the others"""
+
+        await self.router.stop()
+        self.store.enabled = False
+        self._started = False
+
     async def start_session(
         self,
         meeting_id: str,
         agenda_items: Optional[List[Dict]] = None,
-        mode: CopilotMode = CopilotMode.ACTIVE
+        mode: CopilotMode = CopilotMode.ACTIVE,
+        organization_id: Optional[str] = None
     ) -> CopilotState:
         """
         Start a copilot session for a meeting
@@ -108,6 +236,8 @@ class MeetingCopilot:
             meeting_id: Unique meeting identifier
             agenda_items: List of agenda items with expected duration
             mode: Operating mode
+            organization_id: Organization whose earlier meetings questions
+                and blockers are looked up in (no lookups without one)
 
         Returns:
             CopilotState for tracking
@@ -116,10 +246,22 @@ class MeetingCopilot:
         state = CopilotState(
             meeting_id=meeting_id,
             mode=mode,
-            agenda_items=agenda_items or []
+            agenda_items=agenda_items or [],
+            organization_id=str(organization_id) if organization_id else None
         )
 
-        self.active_sessions[meeting_id] = state
+        handled, _ = await self._route(meeting_id, "start", {
+            "mode": mode.value,
+            "agenda_items": state.agenda_items,
+            "organization_id": state.organization_id
+        })
+        if handled:
+            return state
+
+        async with self._lock(meeting_id):
+            self._discard(meeting_id)
+            await self.store.create(meeting_id, self._state_fields(state))
+            self._activate(state)
 
         logger.info(f"🎯 Copilot session started for meeting {meeting_id} in {mode} mode")
 
@@ -141,20 +283,49 @@ class MeetingCopilot:
             List of insights generated from this segment
         """
 
-        if meeting_id not in self.active_sessions:
-            logger.warning(f"No active session for meeting {meeting_id}")
-            return []
+        handled, result = await self._route(meeting_id, "segment", encode_segment(segment))
+        if handled:
+            return [MeetingInsight.decode(data) for data in result or []]
+
+        # Segments of one meeting are processed strictly in arrival order
+        async with self._lock(meeting_id):
+            state = await self._restore(meeting_id)
+            if state is None:
+                logger.warning(f"No active session for meeting {meeting_id}")
+                return []
+
+            insights = await self._process_segment(state, segment)
+
+            fields = {"off_topic_count": state.off_topic_count}
+            if any(insight.type == "agenda_transition" for insight in insights):
+                fields.update(self._agenda_fields(state))
+
+            await self.store.append(
+                meeting_id,
+                segment=segment,
+                insights=insights,
+                speaker=segment.speaker_id if state.mode != CopilotMode.SUMMARY_ONLY else None,
+                fields=fields,
+                metrics=state.metrics.segment_fields(segment, state.current_agenda_index)
+            )
 
-        state = self.active_sessions[meeting_id]
+        return insights
+
+    async def _process_segment(self, state: CopilotState, segment: TranscriptSegment) -> List[MeetingInsight]:
+        meeting_id = state.meeting_id
+
+        # Add to transcript and the rolling summary
+        state.transcript_segments.append(segment)
+        state.summary_tree.add_segment(
+            segment.text, segment.start_time, segment.end_time, segment.speaker_id
+        )
+        self._schedule_summary_fold(meeting_id, state)
 
         # Skip if in summary-only mode
         if state.mode == CopilotMode.SUMMARY_ONLY:
-            state.transcript_segments.append(segment)
+            state.metrics.add_segment(segment, state.current_agenda_index)
             return []
 
-        # Add to transcript
-        state.transcript_segments.append(segment)
-
         # Track speaker participation
         if segment.speaker_id:
             state.participation_by_speaker[segment.speaker_id] = \
@@ -162,21 +333,19 @@ class MeetingCopilot:
 
         insights = []
 
-        # Extract action items
-        action_items = await self._extract_action_items(segment.text)
-        for item in action_items:
-            insight = MeetingInsight(
-                type="action_item",
-                content=item,
-                confidence=0.8,
-                timestamp=datetime.utcnow(),
-                context=segment.text
-            )
-            state.action_items_detected.append(insight)
-            insights.append(insight)
+        # Lowercase and scan for every keyword signal once
+        text_lower = segment.text.lower()
+        signals = SEGMENT_SIGNALS.groups(text_lower, lowered=True)
+
+        # Extract action items: cheap keyword filter here, LLM extraction is
+        # micro-batched per session and results surface on a later call
+        batcher = self.action_item_batchers[meeting_id]
+        if "action" in signals:
+            batcher.submit(segment, segment.text)
+        insights.extend(self._record_action_items(state, batcher.drain()))
 
         # Detect decisions
-        if await self._is_decision(segment.text):
+        if "decision" in signals:
             insight = MeetingInsight(
                 type="decision",
                 content=segment.text,
@@ -199,8 +368,7 @@ class MeetingCopilot:
             insights.append(insight)
 
         # Detect blockers
-        blocker_keywords = ["blocked", "blocker", "can't proceed", "waiting for", "stuck"]
-        if any(keyword in segment.text.lower() for keyword in blocker_keywords):
+        if "blocker" in signals:
             insight = MeetingInsight(
                 type="blocker",
                 content=segment.text,
@@ -210,9 +378,19 @@ class MeetingCopilot:
             state.blockers_identified.append(insight)
             insights.append(insight)
 
-        # Check if off-topic (in active mode)
-        if state.mode == CopilotMode.ACTIVE and state.agenda_items:
-            if await self._is_off_topic(segment.text, state):
+        # Earlier discussions of what was just asked or reported as blocked
+        if state.organization_id and settings.VECTOR_SEARCH_ENABLED and ("?" in segment.text or "blocker" in signals):
+            insights.extend(await self._earlier_context(state, segment.text))
+
+        # Score against every agenda item at once: automatic agenda
+        # transitions, and off-topic warnings (in active mode)
+        tracker = self.agenda_trackers.get(meeting_id)
+        if tracker is not None:
+            agenda = tracker.observe(segment.text, state.current_agenda_index)
+
+            if agenda.transition_to is not None:
+                insights.append(self._advance_agenda(state, agenda.transition_to, agenda))
+            elif agenda.off_topic and state.mode == CopilotMode.ACTIVE:
                 insight = MeetingInsight(
                     type="off_topic_warning",
                     content="Discussion may be drifting from agenda",
@@ -222,6 +400,30 @@ class MeetingCopilot:
                 state.off_topic_count += 1
                 insights.append(insight)
 
+        state.metrics.add_segment(
+            segment,
+            state.current_agenda_index,
+            is_question="?" in segment.text,
+            is_decision="decision" in signals
+        )
+
+        return insights
+
+    async def get_pending_insights(self, meeting_id: str) -> List[MeetingInsight]:
+        """Action items from batches that completed since the last segment was processed"""
+
+        handled, result = await self._route(meeting_id, "pending_insights")
+        if handled:
+            return [MeetingInsight.decode(data) for data in result or []]
+
+        async with self._lock(meeting_id):
+            state = await self._restore(meeting_id)
+            if state is None:
+                return []
+
+            insights = self._record_action_items(state, self.action_item_batchers[meeting_id].drain())
+            await self.store.append(meeting_id, insights=insights)
+
         return insights
 
     async def check_time_status(self, meeting_id: str) -> Optional[Dict[str, Any]]:
@@ -232,10 +434,13 @@ class MeetingCopilot:
             Warning dict if over time, None otherwise
         """
 
-        if meeting_id not in self.active_sessions:
-            return None
+        handled, result = await self._route(meeting_id, "time_status")
+        if handled:
+            return result
 
-        state = self.active_sessions[meeting_id]
+        state = await self._session(meeting_id)
+        if state is None:
+            return None
 
         if not state.agenda_items:
             return None
@@ -257,6 +462,7 @@ class MeetingCopilot:
         if elapsed > expected:
             overtime = elapsed - expected
             state.overtime_warnings += 1
+            await self.store.update_fields(meeting_id, overtime_warnings=state.overtime_warnings)
 
             return {
                 "type": "time_warning",
@@ -271,16 +477,49 @@ class MeetingCopilot:
     async def move_to_next_agenda_item(self, meeting_id: str):
         """Move to the next agenda item"""
 
-        if meeting_id not in self.active_sessions:
+        handled, _ = await self._route(meeting_id, "next_agenda_item")
+        if handled:
             return
 
-        state = self.active_sessions[meeting_id]
+        state = await self._session(meeting_id)
+        if state is None:
+            return
 
         state.current_agenda_index += 1
         state.agenda_start_times[state.current_agenda_index] = datetime.utcnow()
+        await self.store.update_fields(meeting_id, **self._agenda_fields(state))
 
         logger.info(f"📋 Moving to agenda item {state.current_agenda_index + 1}")
 
+    async def get_live_metrics(self, meeting_id: str) -> Dict[str, Any]:
+        """
+        Current meeting metrics from the running aggregates (no LLM call)
+
+        Returns:
+            Word counts, speaker talk time, question/decision rates and
+            per-agenda-item time series; empty if there is no session
+        """
+
+        handled, result = await self._route(meeting_id, "live_metrics")
+        if handled:
+            return result or {}
+
+        state = await self._session(meeting_id)
+        if state is None:
+            return {}
+
+        return {
+            "meeting_id": meeting_id,
+            "duration_minutes": (datetime.utcnow() - state.start_time).seconds // 60,
+            "current_agenda_index": state.current_agenda_index,
+            "action_items_count": state.action_items_detected.count,
+            "decisions_count": state.decisions_detected.count,
+            "questions_count": state.questions_raised.count,
+            "blockers_count": state.blockers_identified.count,
+            "off_topic_count": state.off_topic_count,
+            **state.metrics.snapshot()
+        }
+
     async def generate_live_summary(self, meeting_id: str) -> Dict[str, Any]:
         """
         Generate a live summary of the meeting so far
@@ -289,20 +528,21 @@ class MeetingCopilot:
             Summary dict with key points
         """
 
-        if meeting_id not in self.active_sessions:
-            return {}
+        handled, result = await self._route(meeting_id, "live_summary")
+        if handled:
+            return result or {}
 
-        state = self.active_sessions[meeting_id]
+        state = await self._session(meeting_id)
+        if state is None:
+            return {}
 
-        # Combine recent transcript
-        recent_text = " ".join([
-            seg.text for seg in state.transcript_segments[-20:]  # Last 20 segments
-        ])
+        # Whole meeting so far: rolling summaries plus the unsummarized tail
+        meeting_so_far = state.summary_tree.render(max_buffer_segments=20)
 
         prompt = f"""Provide a brief status update for this ongoing meeting:
 
-Recent discussion:
-{recent_text}
+Meeting so far (summaries in time order, then the latest discussion):
+{meeting_so_far}
 
 Provide:
 1. What's been discussed so far (2-3 sentences)
@@ -320,9 +560,9 @@ Keep it concise - this is a live update."""
 
         return {
             "summary": result["response"],
-            "action_items_count": len(state.action_items_detected),
-            "decisions_count": len(state.decisions_detected),
-            "questions_count": len(state.questions_raised),
+            "action_items_count": state.action_items_detected.count,
+            "decisions_count": state.decisions_detected.count,
+            "questions_count": state.questions_raised.count,
             "duration_minutes": (datetime.utcnow() - state.start_time).seconds // 60,
             "speakers": len(state.participation_by_speaker)
         }
@@ -335,17 +575,31 @@ Keep it concise - this is a live update."""
             Complete meeting summary and insights
         """
 
-        if meeting_id not in self.active_sessions:
-            return {}
+        handled, result = await self._route(meeting_id, "end")
+        if handled:
+            return result or {}
+
+        # Held throughout: segments arriving meanwhile must not see a half-ended session
+        async with self._lock(meeting_id):
+            state = await self._restore(meeting_id)
+            if state is None:
+                return {}
 
-        state = self.active_sessions[meeting_id]
+            logger.info(f"🏁 Ending copilot session for meeting {meeting_id}")
 
-        logger.info(f"🏁 Ending copilot session for meeting {meeting_id}")
+            # Collect action items still being extracted
+            batcher = self.action_item_batchers.pop(meeting_id, None)
+            if batcher is not None:
+                self._record_action_items(state, await batcher.flush())
 
-        # Generate comprehensive summary
-        full_transcript = " ".join([seg.text for seg in state.transcript_segments])
+            # Finish the summary tree; the final prompt works from it, not the raw transcript
+            pending_fold = self.summary_tasks.pop(meeting_id, None)
+            if pending_fold:
+                await asyncio.gather(pending_fold, return_exceptions=True)
+            await state.summary_tree.fold(self._summarize_span, final=True)
+            meeting_notes = state.summary_tree.render(include_buffer=False)
 
-        prompt = f"""Analyze this complete meeting transcript and provide:
+            prompt = f"""Analyze these chronological notes covering the complete meeting and provide:
 
 1. **Executive Summary** (3 bullet points max - the absolute key takeaways)
 2. **Decisions Made** (list each decision with rationale)
@@ -355,58 +609,70 @@ Keep it concise - this is a live update."""
 6. **Next Steps** (recommended follow-up actions)
 7. **Overall Sentiment** (was the meeting productive? team morale?)
 
-Meeting Transcript:
-{full_transcript}
+Meeting Notes:
+{meeting_notes}
 
 Return as structured JSON."""
 
-        result = await orchestrator.generate(
-            prompt,
-            model_type=ModelType.ANALYSIS,
-            prefer_quality=True
-        )
-
-        # Calculate participation metrics
-        total_turns = sum(state.participation_by_speaker.values())
-        participation_percentages = {
-            speaker: (turns / total_turns * 100) if total_turns > 0 else 0
-            for speaker, turns in state.participation_by_speaker.items()
-        }
+            result = await orchestrator.generate(
+                prompt,
+                model_type=ModelType.ANALYSIS,
+                prefer_quality=True
+            )
 
-        # Meeting duration
-        duration = datetime.utcnow() - state.start_time
+            # Participation by turns; everything else comes from the running aggregates
+            total_turns = sum(state.participation_by_speaker.values())
+            participation_percentages = {
+                speaker: (turns / total_turns * 100) if total_turns > 0 else 0
+                for speaker, turns in state.participation_by_speaker.items()
+            }
 
-        summary = {
-            "meeting_id": meeting_id,
-            "duration_minutes": duration.seconds // 60,
-            "ai_summary": result["response"],
-
-            # Metrics
-            "total_speakers": len(state.participation_by_speaker),
-            "total_words": sum(len(seg.text.split()) for seg in state.transcript_segments),
-            "action_items_detected": len(state.action_items_detected),
-            "decisions_made": len(state.decisions_detected),
-            "questions_raised": len(state.questions_raised),
-            "blockers_identified": len(state.blockers_identified),
-            "off_topic_incidents": state.off_topic_count,
-            "overtime_warnings": state.overtime_warnings,
-
-            # Participation
-            "speaker_participation": participation_percentages,
-
-            # Quality scores
-            "meeting_quality_score": await self._calculate_quality_score(state),
-            "productivity_rating": await self._calculate_productivity_rating(state),
-
-            # Model used
-            "ai_model": result.get("model_used"),
-            "processing_cost": result.get("cost")
-        }
+            # Meeting duration
+            duration = datetime.utcnow() - state.start_time
+
+            quality_score = await self._calculate_quality_score(state)
+            metrics = state.metrics.snapshot()
+
+            summary = {
+                "meeting_id": meeting_id,
+                "duration_minutes": duration.seconds // 60,
+                "ai_summary": result["response"],
+
+                # Metrics
+                "total_speakers": len(state.participation_by_speaker),
+                "total_words": metrics["total_words"],
+                "action_items_detected": state.action_items_detected.count,
+                "decisions_made": state.decisions_detected.count,
+                "questions_raised": state.questions_raised.count,
+                "blockers_identified": state.blockers_identified.count,
+                "off_topic_incidents": state.off_topic_count,
+                "overtime_warnings": state.overtime_warnings,
+
+                "questions_per_minute": metrics["questions_per_minute"],
+                "decisions_per_minute": metrics["decisions_per_minute"],
+                "agenda_item_metrics": metrics["agenda_items"],
+
+                # Participation
+                "speaker_participation": participation_percentages,
+                "speaker_talk_seconds": metrics["speaker_talk_seconds"],
+                "speaker_talk_time": metrics["speaker_talk_time"],
+
+                # Quality scores
+                "meeting_quality_score": quality_score,
+                "productivity_rating": self._calculate_productivity_rating(quality_score),
+
+                # Model used
+                "ai_model": result.get("model_used"),
+                "processing_cost": result.get("cost"),
+                "action_item_extraction_calls": batcher.batches_sent if batcher is not None else 0
+            }
 
-        # Cleanup
-        del self.active_sessions[meeting_id]
+            # Cleanup
+            self._discard(meeting_id)
+            self.session_locks.pop(meeting_id, None)
+            await self.store.delete(meeting_id)
 
-        return summary
+            return summary
 
     async def generate_follow_up_email(
         self,
@@ -451,73 +717,308 @@ Return just the email body (no subject line)."""
 
         return result["response"]
 
+    # ========================================================================
+    # SESSION OWNERSHIP AND PERSISTENCE
+    # ========================================================================
+
+    async def _route(self, meeting_id: str, op: str, payload: Any = None) -> Tuple[bool, Any]:
+        """(True, result) if the meeting's owner is another worker and handled `op` there"""
+
+        await self.start()
+        if _serving_forwarded.get():
+            return False, None
+        return await self.router.call_owner(meeting_id, op, payload)
+
+    async def _handle_forwarded(self, op: str, meeting_id: str, payload: Any) -> Any:
+        """Run an op forwarded by another worker; the result must be JSON-serializable"""
+
+        _serving_forwarded.set(True)
+
+        if op == "start":
+            await self.start_session(
+                meeting_id, payload["agenda_items"], CopilotMode(payload["mode"]), payload.get("organization_id")
+            )
+            return None
+        if op == "segment":
+            insights = await self.process_transcript_segment(meeting_id, decode_segment(payload))
+            return [encode_insight(insight) for insight in insights]
+        if op == "pending_insights":
+            return [encode_insight(insight) for insight in await self.get_pending_insights(meeting_id)]
+        if op == "time_status":
+            return await self.check_time_status(meeting_id)
+        if op == "next_agenda_item":
+            await self.move_to_next_agenda_item(meeting_id)
+            return None
+        if op == "live_metrics":
+            return await self.get_live_metrics(meeting_id)
+        if op == "live_summary":
+            return await self.generate_live_summary(meeting_id)
+        if op == "end":
+            return await self.end_session(meeting_id)
+
+        raise ValueError(f"Unknown copilot op: {op}")
+
+    def _lock(self, meeting_id: str) -> asyncio.Lock:
+        lock = self.session_locks.get(meeting_id)
+        if lock is None:
+            lock = self.session_locks[meeting_id] = asyncio.Lock()
+        return lock
+
+    def _activate(self, state: CopilotState):
+        meeting_id = state.meeting_id
+        self.active_sessions[meeting_id] = state
+        self.action_item_batchers[meeting_id] = ActionItemBatcher()
+        if state.agenda_items:
+            self.agenda_trackers[meeting_id] = AgendaTracker(state.agenda_items)
+        COPILOT_ACTIVE_SESSIONS.inc()
+
+    def _discard(self, meeting_id: str):
+        """Forget this worker's copy of a session (the stored state is untouched)"""
+
+        state = self.active_sessions.pop(meeting_id, None)
+        if state is not None:
+            state.transcript_segments.release()
+            for log in state.insight_logs().values():
+                log.release()
+            COPILOT_ACTIVE_SESSIONS.dec()
+
+        self.agenda_trackers.pop(meeting_id, None)
+
+        batcher = self.action_item_batchers.pop(meeting_id, None)
+        if batcher:
+            batcher.close()
+        fold = self.summary_tasks.pop(meeting_id, None)
+        if fold:
+            fold.cancel()
+
+    async def _session(self, meeting_id: str) -> Optional[CopilotState]:
+        async with self._lock(meeting_id):
+            return await self._restore(meeting_id)
+
+    async def _restore(self, meeting_id: str) -> Optional[CopilotState]:
+        """This worker's copy of the session, loading it from Redis on first use (caller holds the lock)"""
+
+        state = self.active_sessions.get(meeting_id)
+        if state is not None:
+            return state
+
+        stored = await self.store.load(
+            meeting_id, settings.COPILOT_SEGMENT_WINDOW, settings.COPILOT_INSIGHT_WINDOW
+        )
+        if stored is None:
+            return None
+
+        state = await self._state_from_stored(meeting_id, stored)
+        self._activate(state)
+
+        logger.info(f"♻️ Copilot session for meeting {meeting_id} restored ({stored.segment_count} segments)")
+
+        return state
+
+    async def _release_moved_sessions(self):
+        """Hand off sessions whose meetings now belong to another worker"""
+
+        for meeting_id in [m for m in self.active_sessions if not self.router.owns(m)]:
+            async with self._lock(meeting_id):
+                state = self.active_sessions.get(meeting_id)
+                if state is None:
+                    continue
+
+                # Persist what's still in flight before the new owner loads the session
+                batcher = self.action_item_batchers[meeting_id]
+                insights = self._record_action_items(state, await batcher.flush())
+                await self.store.append(meeting_id, insights=insights)
+
+                fold = self.summary_tasks.pop(meeting_id, None)
+                if fold:
+                    await asyncio.gather(fold, return_exceptions=True)
+
+                self._discard(meeting_id)
+
+            self.session_locks.pop(meeting_id, None)
+            logger.info(f"🔀 Copilot session for meeting {meeting_id} handed off to another worker")
+
+    @staticmethod
+    def _state_fields(state: CopilotState) -> Dict[str, Any]:
+        """Scalar session fields as stored in Redis (segments and insights are stored as lists)"""
+
+        return {
+            "mode": state.mode.value,
+            "start_time": to_epoch(state.start_time),
+            "organization_id": state.organization_id,
+            "agenda_items": state.agenda_items,
+            **MeetingCopilot._agenda_fields(state),
+            "off_topic_count": state.off_topic_count,
+            "overtime_warnings": state.overtime_warnings
+        }
+
+    @staticmethod
+    def _agenda_fields(state: CopilotState) -> Dict[str, Any]:
+        return {
+            "current_agenda_index": state.current_agenda_index,
+            "agenda_start_times": {str(i): to_epoch(t) for i, t in state.agenda_start_times.items()}
+        }
+
+    @staticmethod
+    def _summary_tree_fields(tree: SummaryTree) -> Dict[str, Any]:
+        # The unsummarized buffer is rebuilt from the stored segment list on load
+        data = tree.to_dict()
+        data["buffer"] = []
+        return data
+
+    async def _state_from_stored(self, meeting_id: str, stored: StoredSession) -> CopilotState:
+        fields = stored.fields
+
+        # Rebuild the summary buffer from the segments not yet folded into a summary
+        tree = SummaryTree.from_dict(fields["summary_tree"]) if "summary_tree" in fields else SummaryTree()
+        folded = sum(node.segment_count for node in tree.nodes())
+        tail_start = stored.segment_count - len(stored.segments)
+        if folded < tail_start:
+            async for seg in self.store.iter_segments(meeting_id, folded, tail_start):
+                tree.add_segment(seg.text, seg.start_time, seg.end_time, seg.speaker_id)
+        for seg in stored.segments[max(folded - tail_start, 0):]:
+            tree.add_segment(seg.text, seg.start_time, seg.end_time, seg.speaker_id)
+
+        state = CopilotState(
+            meeting_id=meeting_id,
+            mode=CopilotMode(fields["mode"]),
+            start_time=from_epoch(fields["start_time"]),
+            organization_id=fields.get("organization_id"),
+            summary_tree=tree,
+            off_topic_count=fields.get("off_topic_count", 0),
+            overtime_warnings=fields.get("overtime_warnings", 0),
+            participation_by_speaker=stored.participation,
+            metrics=MeetingMetrics.from_fields(stored.metrics),
+            agenda_items=fields.get("agenda_items", []),
+            current_agenda_index=fields.get("current_agenda_index", 0),
+            agenda_start_times={int(i): from_epoch(t) for i, t in fields.get("agenda_start_times", {}).items()}
+        )
+
+        state.transcript_segments.extend(stored.segments)
+        state.transcript_segments.count = stored.segment_count
+
+        logs = state.insight_logs()
+        for data in stored.insights:
+            insight = MeetingInsight.decode(data)
+            if insight.type in logs:
+                logs[insight.type].append(insight)
+        for insight_type, log in logs.items():
+            log.count = stored.insight_counts.get(insight_type, 0)
+
+        return state
+
     # ========================================================================
     # HELPER METHODS
     # ========================================================================
 
-    async def _extract_action_items(self, text: str) -> List[str]:
-        """Extract potential action items from text"""
+    def _schedule_summary_fold(self, meeting_id: str, state: CopilotState):
+        """Fold ready summary chunks in the background (one fold task per session)"""
 
-        # Quick keyword check
-        action_keywords = [
-            "will", "should", "need to", "have to", "must",
-            "todo", "to do", "action item", "follow up",
-            "assign", "responsible for"
-        ]
+        if not state.summary_tree.has_pending_work:
+            return
 
-        if not any(keyword in text.lower() for keyword in action_keywords):
-            return []
+        running = self.summary_tasks.get(meeting_id)
+        if running and not running.done():
+            return
 
-        # Use AI for more accurate extraction
-        prompt = f"""Extract action items from this text. Return only the action item descriptions, one per line.
+        self.summary_tasks[meeting_id] = asyncio.create_task(self._fold_summary(meeting_id, state))
 
-Text: {text}
+    async def _fold_summary(self, meeting_id: str, state: CopilotState):
+        await state.summary_tree.fold(self._summarize_span)
+        await self.store.update_fields(meeting_id, summary_tree=self._summary_tree_fields(state.summary_tree))
 
-If no action items, return empty."""
+    async def _summarize_span(self, texts: List[str], level: int) -> str:
+        """Summarize raw segments (level 1) or lower-level summaries into one summary"""
+
+        if level == 1:
+            source = "meeting transcript excerpt"
+            content = "\n".join(texts)
+            length = "3-5 short bullet points"
+        else:
+            source = "consecutive summaries of one part of a meeting"
+            content = "\n\n".join(texts)
+            length = "5-8 short bullet points"
+
+        prompt = f"""Summarize this {source} in {length}.
+Keep decisions, action items (with owners), open questions and blockers.
+
+{content}"""
 
         result = await orchestrator.generate(
             prompt,
             model_type=ModelType.SUMMARY,
-            prefer_speed=True,
-            max_cost=0.005
+            prefer_speed=True
         )
 
-        items = [
-            line.strip() for line in result["response"].split("\n")
-            if line.strip() and not line.strip().lower().startswith("no ")
-        ]
+        return result["response"]
 
-        return items[:3]  # Max 3 per segment
+    async def _earlier_context(self, state: CopilotState, text: str) -> List[MeetingInsight]:
+        """Passages of the organization's earlier meetings semantically close to `text`"""
 
-    async def _is_decision(self, text: str) -> bool:
-        """Check if text contains a decision"""
+        try:
+            partition = await asyncio.to_thread(vector_index.partition, state.organization_id)
+            hits = await asyncio.to_thread(
+                partition.search, text, settings.COPILOT_CONTEXT_HITS, None, state.meeting_id
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Context lookup failed for meeting {state.meeting_id}: {e}")
+            return []
 
-        decision_keywords = [
-            "decided", "decision", "agreed", "going with",
-            "chosen", "selected", "approved", "confirmed"
-        ]
+        insights = []
+        for hit in hits:
+            if hit.score < settings.VECTOR_MIN_SIMILARITY:
+                continue
+            source = hit.passage.meta.get("title") or "Earlier meeting"
+            if hit.passage.meta.get("date"):
+                source += f" ({str(hit.passage.meta['date'])[:10]})"
+            insights.append(MeetingInsight(
+                type="context",
+                content=f"{source}: {hit.passage.text}",
+                confidence=round(hit.score, 3),
+                timestamp=datetime.utcnow(),
+                context=hit.passage.meeting_id
+            ))
+        return insights
 
-        return any(keyword in text.lower() for keyword in decision_keywords)
+    def _advance_agenda(self, state: CopilotState, index: int, agenda: AgendaScore) -> MeetingInsight:
+        """Move the session to a later agenda item the discussion has moved on to"""
 
-    async def _is_off_topic(self, text: str, state: CopilotState) -> bool:
-        """Check if discussion is off the current agenda topic"""
+        state.current_agenda_index = index
+        state.agenda_start_times[index] = datetime.utcnow()
 
-        if state.current_agenda_index >= len(state.agenda_items):
-            return False
+        title = state.agenda_items[index].get("title", f"Item {index + 1}")
+        logger.info(f"📋 Discussion moved to agenda item {index + 1} ({title}) in meeting {state.meeting_id}")
 
-        current_topic = state.agenda_items[state.current_agenda_index].get("title", "")
+        return MeetingInsight(
+            type="agenda_transition",
+            content=f"Moved on to agenda item {index + 1}: {title}",
+            confidence=round(float(agenda.similarities[index]), 2),
+            timestamp=state.agenda_start_times[index],
+            context=str(index)
+        )
 
-        if not current_topic:
-            return False
+    def _record_action_items(
+        self,
+        state: CopilotState,
+        results: List[BatchResult]
+    ) -> List[MeetingInsight]:
+        """Turn batched extraction results into insights on their originating segments"""
 
-        # Simple relevance check (could be enhanced with embeddings)
-        topic_keywords = current_topic.lower().split()
-        text_lower = text.lower()
+        insights = []
 
-        # If topic keywords appear in text, likely on topic
-        matches = sum(1 for keyword in topic_keywords if keyword in text_lower)
+        for result in results:
+            for item in result.items:
+                insight = MeetingInsight(
+                    type="action_item",
+                    content=item,
+                    confidence=0.8,
+                    timestamp=datetime.utcnow(),
+                    context=result.text
+                )
+                state.action_items_detected.append(insight)
+                insights.append(insight)
 
-        return matches == 0 and len(text.split()) > 10
+        return insights
 
     async def _calculate_quality_score(self, state: CopilotState) -> int:
         """
@@ -552,17 +1053,15 @@ If no action items, return empty."""
                     score += 10
 
         # Productive (decisions made)
-        score += min(len(state.decisions_detected) * 5, 10)
+        score += min(state.decisions_detected.count * 5, 10)
 
         # Actionable (action items created)
-        score += min(len(state.action_items_detected) * 3, 10)
+        score += min(state.action_items_detected.count * 3, 10)
 
         return min(score, 100)
 
-    async def _calculate_productivity_rating(self, state: CopilotState) -> str:
-        """Calculate productivity rating"""
-
-        score = await self._calculate_quality_score(state)
+    def _calculate_productivity_rating(self, score: int) -> str:
+        """Calculate productivity rating from the quality score"""
 
         if score >= 80:
             return "Excellent"
@@ -7,10 +7,10 @@ from datetime import datetime
 from typing import Optional, List
 from sqlalchemy import (
     Column, String, Integer, Boolean, DateTime, Text, JSON, ARRAY,
-    ForeignKey, Index, CheckConstraint, UniqueConstraint, BigInteger, Float, Date
+    ForeignKey, Index, CheckConstraint, UniqueConstraint, BigInteger, Float, Date, LargeBinary, Sequence
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR, INET
-from sqlalchemy.orm import relationship, declarative_base
+from sqlalchemy.orm import relationship, declarative_base, deferred
 from sqlalchemy.sql import func
 from sqlalchemy.ext.hybrid import hybrid_property
 
@@ -185,6 +185,7 @@ class Meeting(Base):
     # AI Analysis Results
     transcript = Column(Text, nullable=True)
     transcript_segments = Column(JSONB, nullable=True)  # [{speaker, text, timestamp, confidence}]
+    transcript_columnar = deferred(Column(LargeBinary, nullable=True))  # CompactTranscript bytes (transcript_store.py)
     speakers = Column(JSONB, nullable=True)  # [{name, role, total_time, sentiment}]
     sentiment_analysis = Column(JSONB, nullable=True)  # {overall, by_speaker, by_topic}
     key_moments = Column(JSONB, nullable=True)  # [{timestamp, description, importance}]
@@ -337,9 +338,17 @@ class MediaFile(Base):
     original_filename = Column(String(255), nullable=False)
     storage_path = Column(Text, nullable=False)
 
+    # Resumable Upload
+    upload_status = Column(String(50), default="complete")  # uploading, complete, aborted
+    upload_offset = Column(BigInteger, default=0, nullable=False)
+    storage_backend = Column(String(20), default="local")  # local, azure
+    content_sha256 = Column(String(64), nullable=True)
+
     # Processing Status
     transcription_status = Column(String(50), default="pending")  # pending, processing, completed, failed
     transcription_job_id = Column(String(255), nullable=True)
+    transcription_progress = Column(Integer, default=0)  # percent
+    transcription_attempts = Column(Integer, default=0)
     transcription_error = Column(Text, nullable=True)
 
     # Metadata
@@ -351,6 +360,37 @@ class MediaFile(Base):
     meeting = relationship("Meeting", back_populates="media_files")
 
 
+# ============================================================================
+# Project Classification
+# ============================================================================
+
+# Registry-wide version stamps: every insert or update of a classifier project takes the next value
+CLASSIFIER_PROJECT_VERSIONS = Sequence("classifier_project_versions")
+
+
+class ClassifierProject(Base):
+    """A project registered for meeting classification, with its cached classifier artifacts"""
+    __tablename__ = "classifier_projects"
+
+    id = Column(String(255), primary_key=True)  # caller-assigned project ID
+    name = Column(String(255), nullable=False)
+    description = Column(Text, nullable=True)
+
+    # Classifier Artifacts (see ai/project_classifier.py)
+    keywords = Column(JSONB, default=[])
+    keywords_extracted = Column(Boolean, default=False)  # by the model; reused while name and description are unchanged
+    centroid = Column(LargeBinary, nullable=True)  # float32 TF-IDF centroid
+    centroid_embedder = Column(String(50), nullable=True)  # vector space of the centroid, e.g. hashing-1024
+
+    # Versioning
+    version = Column(BigInteger, CLASSIFIER_PROJECT_VERSIONS, nullable=False, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<ClassifierProject {self.id} v{self.version}>"
+
+
 # ============================================================================
 # Integrations
 # ============================================================================
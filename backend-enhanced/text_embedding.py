@@ -0,0 +1,136 @@
+"""
+Local Text Embeddings
+Feature-hashing TF-IDF vectors: no model download, no network, microseconds per sentence
+"""
+import math
+import re
+import zlib
+from collections import Counter
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from config import settings
+
+_TOKEN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+# Truncation stemming: "budgets"/"budgeting"/"budgeted" all become "budget"
+STEM_LENGTH = 6
+
+BIGRAM_WEIGHT = 0.5
+
+STOPWORDS = frozenset("""
+a about above after again all also am an and any are as at be because been before being
+below between both but by can could did do does doing down during each few for from further
+had has have having he her here hers him his how i if in into is it its itself just let me
+more most my no nor not now of off on once only or other our ours out over own really right
+same she should so some such than that the their theirs them then there these they this those
+through to too under until up very was we well were what when where which while who whom why
+will with would yeah yes you your yours okay ok um uh like gonna going get got think know
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased content-word stems"""
+    return [
+        token[:STEM_LENGTH]
+        for token in _TOKEN.findall(text.lower())
+        if token not in STOPWORDS and len(token) > 1
+    ]
+
+
+def _terms(tokens: Sequence[str]) -> Iterable[Tuple[str, float]]:
+    for token in tokens:
+        yield token, 1.0
+    for first, second in zip(tokens, tokens[1:]):
+        yield f"{first} {second}", BIGRAM_WEIGHT
+
+
+def idf_weights(documents: Sequence[str]) -> Dict[str, float]:
+    """Smoothed IDF per term over a (small) document set, e.g. a meeting agenda"""
+
+    document_frequency: Counter = Counter()
+    for document in documents:
+        document_frequency.update({term for term, _ in _terms(tokenize(document))})
+
+    n = len(documents)
+    return {term: math.log((1 + n) / (1 + df)) + 1.0 for term, df in document_frequency.items()}
+
+
+class HashingEmbedder:
+    """
+    Signed feature hashing of stems and stem bigrams into `dim` buckets
+
+    Term weights are sublinear TF times an optional IDF table; vectors are
+    L2-normalized so a dot product is cosine similarity. Hashing uses CRC32,
+    so vectors are identical across processes and workers.
+    """
+
+    def __init__(self, dim: int = settings.EMBEDDING_HASH_DIM):
+        self.dim = dim
+        self.name = f"hashing-{dim}"  # identifies the vector space (see ai/vector_index.py)
+
+    def embed_sparse(
+        self,
+        text: str,
+        idf: Optional[Mapping[str, float]] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """(bucket indices, values) of the normalized vector; empty for text without content words"""
+
+        counts: Counter = Counter()
+        for term, weight in _terms(tokenize(text)):
+            counts[term] += weight
+
+        if not counts:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        buckets: Dict[int, float] = {}
+        for term, count in counts.items():
+            digest = zlib.crc32(term.encode())
+            bucket = digest % self.dim
+            sign = 1.0 if digest & 0x80000000 else -1.0
+            weight = (1.0 + math.log(count)) if count >= 1 else count
+            if idf is not None:
+                weight *= idf.get(term, 1.0)
+            buckets[bucket] = buckets.get(bucket, 0.0) + sign * weight
+
+        indices = np.fromiter(buckets.keys(), dtype=np.int64, count=len(buckets))
+        values = np.fromiter(buckets.values(), dtype=np.float32, count=len(buckets))
+
+        norm = float(np.linalg.norm(values))
+        if norm == 0.0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        return indices, values / norm
+
+    def embed(self, text: str, idf: Optional[Mapping[str, float]] = None) -> np.ndarray:
+        vector = np.zeros(self.dim, dtype=np.float32)
+        indices, values = self.embed_sparse(text, idf)
+        vector[indices] = values
+        return vector
+
+    def embed_many(self, texts: Sequence[str], idf: Optional[Mapping[str, float]] = None) -> np.ndarray:
+        """(len(texts), dim) float32 matrix, one normalized row per text"""
+
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            indices, values = self.embed_sparse(text, idf)
+            matrix[row, indices] = values
+        return matrix
+
+    def similarities(
+        self,
+        matrix: np.ndarray,
+        text: str,
+        idf: Optional[Mapping[str, float]] = None
+    ) -> np.ndarray:
+        """Cosine similarity of `text` to every row of `matrix` at once"""
+
+        indices, values = self.embed_sparse(text, idf)
+        if not len(indices):
+            return np.zeros(matrix.shape[0], dtype=np.float32)
+        # Only the text's non-zero buckets contribute
+        return matrix[:, indices] @ values
+
+
+# Shared default embedder
+embedder = HashingEmbedder()
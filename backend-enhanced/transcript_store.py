@@ -0,0 +1,275 @@
+"""
+Compact Time-Indexed Transcript Store
+Columnar transcript segments with binary-searchable time and speaker lookups
+"""
+import json
+import struct
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+
+MAGIC = b"TSEG"
+FORMAT_VERSION = 1
+NO_SPEAKER = 0xFFFF
+
+# magic, version, n_segments, n_speakers, speaker table bytes, blob bytes
+_HEADER = struct.Struct("<4sHIIII")
+_ALIGN = 8
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+def _pad(length: int) -> int:
+    return (-length) % _ALIGN
+
+
+class CompactTranscript:
+    """
+    Columnar transcript representation
+
+    Layout (little-endian, 8-byte aligned sections):
+    - header + JSON speaker table
+    - starts     float32[n]   (sorted)
+    - ends       float32[n]
+    - offsets    uint32[n+1]  (byte offsets into the text blob)
+    - speakers   uint16[n]    (index into speaker table, 0xFFFF = unknown)
+    - confidence float16[n]
+    - text blob  utf-8
+
+    Loading from bytes creates zero-copy NumPy views; segment text is only
+    decoded for the segments a query returns.
+    """
+
+    def __init__(
+        self,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        offsets: np.ndarray,
+        speaker_ids: np.ndarray,
+        confidences: np.ndarray,
+        blob: BytesLike,
+        speakers: List[str]
+    ):
+        self.starts = starts
+        self.ends = ends
+        self.offsets = offsets
+        self.speaker_ids = speaker_ids
+        self.confidences = confidences
+        self.blob = memoryview(blob)
+        self.speakers = speakers
+        self._speaker_index = {name: i for i, name in enumerate(speakers)}
+
+        # Segments can overlap, so window lookups search the running max of ends
+        self._max_ends = np.maximum.accumulate(ends) if len(ends) else ends
+
+    # ========================================================================
+    # CONSTRUCTION & SERIALIZATION
+    # ========================================================================
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[Any]) -> "CompactTranscript":
+        """
+        Build from segment dicts or TranscriptSegment objects
+
+        Accepts the shapes stored in Meeting.transcript_segments
+        ({start|timestamp, end, speaker|speaker_id, text, confidence}).
+        """
+
+        rows = sorted((_normalize(seg) for seg in segments), key=lambda r: r[0])
+
+        speakers: List[str] = []
+        speaker_index: Dict[str, int] = {}
+        encoded_texts = []
+        speaker_ids = np.full(len(rows), NO_SPEAKER, dtype=np.uint16)
+
+        for i, (_, _, speaker, text, _) in enumerate(rows):
+            if speaker is not None:
+                if speaker not in speaker_index:
+                    speaker_index[speaker] = len(speakers)
+                    speakers.append(speaker)
+                speaker_ids[i] = speaker_index[speaker]
+            encoded_texts.append(text.encode("utf-8"))
+
+        offsets = np.zeros(len(rows) + 1, dtype=np.uint32)
+        np.cumsum([len(t) for t in encoded_texts], out=offsets[1:])
+
+        return cls(
+            starts=np.array([r[0] for r in rows], dtype=np.float32),
+            ends=np.array([r[1] for r in rows], dtype=np.float32),
+            offsets=offsets,
+            speaker_ids=speaker_ids,
+            confidences=np.array([r[4] for r in rows], dtype=np.float16),
+            blob=b"".join(encoded_texts),
+            speakers=speakers
+        )
+
+    def to_bytes(self) -> bytes:
+        """Serialize to the binary layout described on the class"""
+
+        speaker_table = json.dumps(self.speakers).encode("utf-8")
+        n = len(self.starts)
+
+        parts = [
+            _HEADER.pack(MAGIC, FORMAT_VERSION, n, len(self.speakers), len(speaker_table), len(self.blob)),
+            speaker_table,
+            b"\0" * _pad(_HEADER.size + len(speaker_table)),
+        ]
+
+        for array in (
+            self.starts.astype("<f4"),
+            self.ends.astype("<f4"),
+            self.offsets.astype("<u4"),
+            self.speaker_ids.astype("<u2"),
+            self.confidences.astype("<f2"),
+        ):
+            raw = array.tobytes()
+            parts.append(raw)
+            parts.append(b"\0" * _pad(len(raw)))
+
+        parts.append(bytes(self.blob))
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: BytesLike) -> "CompactTranscript":
+        """Load with zero-copy array views over `data`"""
+
+        buffer = memoryview(data)
+        magic, version, n, _, table_len, blob_len = _HEADER.unpack_from(buffer, 0)
+
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("Not a compact transcript (bad magic or version)")
+
+        position = _HEADER.size
+        speakers = json.loads(bytes(buffer[position:position + table_len]).decode("utf-8"))
+        position += table_len
+        position += _pad(position)
+
+        def take(dtype: str, count: int) -> np.ndarray:
+            nonlocal position
+            array = np.frombuffer(buffer, dtype=dtype, count=count, offset=position)
+            position += array.nbytes
+            position += _pad(array.nbytes)
+            return array
+
+        starts = take("<f4", n)
+        ends = take("<f4", n)
+        offsets = take("<u4", n + 1)
+        speaker_ids = take("<u2", n)
+        confidences = take("<f2", n)
+        blob = buffer[position:position + blob_len]
+
+        return cls(starts, ends, offsets, speaker_ids, confidences, blob, speakers)
+
+    # ========================================================================
+    # QUERIES
+    # ========================================================================
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    @property
+    def duration_seconds(self) -> float:
+        return float(self._max_ends[-1]) if len(self) else 0.0
+
+    def window(self, start: Optional[float] = None, end: Optional[float] = None) -> np.ndarray:
+        """Indices of segments overlapping [start, end) - O(log n) bounds"""
+
+        lo = 0 if start is None else int(np.searchsorted(self._max_ends, start, side="right"))
+        hi = len(self) if end is None else int(np.searchsorted(self.starts, end, side="left"))
+
+        if lo >= hi:
+            return np.arange(0)
+
+        indices = np.arange(lo, hi)
+        if start is not None:
+            # Only needed when segments overlap (running max > own end)
+            indices = indices[self.ends[lo:hi] > start]
+        return indices
+
+    def segment_at(self, t: float) -> Optional[int]:
+        """Index of the segment being spoken at time t (seek)"""
+
+        i = int(np.searchsorted(self.starts, t, side="right")) - 1
+        while i >= 0 and self._max_ends[i] > t:
+            if self.ends[i] > t:
+                return i
+            i -= 1
+        return None
+
+    def speaker_indices(
+        self,
+        speaker: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None
+    ) -> np.ndarray:
+        """Indices of a speaker's segments, optionally within a time window"""
+
+        speaker_id = self._speaker_index.get(speaker)
+        if speaker_id is None:
+            return np.arange(0)
+
+        indices = self.window(start, end)
+        return indices[self.speaker_ids[indices] == speaker_id]
+
+    def speaker_stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-speaker segment count, talk time and text size (vectorized)"""
+
+        known = self.speaker_ids != NO_SPEAKER
+        ids = self.speaker_ids[known].astype(np.intp)
+        n_speakers = len(self.speakers)
+
+        durations = (self.ends - self.starts)[known].astype(np.float64)
+        counts = np.bincount(ids, minlength=n_speakers)
+        talk_time = np.bincount(ids, weights=durations, minlength=n_speakers)
+        text_bytes = np.bincount(
+            ids, weights=np.diff(self.offsets.astype(np.int64))[known], minlength=n_speakers
+        )
+
+        return {
+            name: {
+                "segments": int(counts[i]),
+                "talk_time_seconds": round(float(talk_time[i]), 2),
+                "text_bytes": int(text_bytes[i])
+            }
+            for i, name in enumerate(self.speakers)
+        }
+
+    def text(self, index: int) -> str:
+        return bytes(self.blob[self.offsets[index]:self.offsets[index + 1]]).decode("utf-8")
+
+    def segment(self, index: int) -> Dict[str, Any]:
+        speaker_id = int(self.speaker_ids[index])
+        return {
+            "start": float(self.starts[index]),
+            "end": float(self.ends[index]),
+            "speaker": self.speakers[speaker_id] if speaker_id != NO_SPEAKER else None,
+            "text": self.text(index),
+            "confidence": float(self.confidences[index])
+        }
+
+    def iter_segments(self, indices: Optional[Sequence[int]] = None) -> Iterator[Dict[str, Any]]:
+        """Decode segments lazily, one at a time"""
+
+        for i in (range(len(self)) if indices is None else indices):
+            yield self.segment(int(i))
+
+    def segments(self, indices: Sequence[int]) -> List[Dict[str, Any]]:
+        return list(self.iter_segments(indices))
+
+
+def _normalize(seg: Any):
+    """(start, end, speaker, text, confidence) from a dict or object segment"""
+
+    if isinstance(seg, dict):
+        start = seg.get("start", seg.get("start_time", seg.get("timestamp", 0.0)))
+        end = seg.get("end", seg.get("end_time", start))
+        speaker = seg.get("speaker", seg.get("speaker_id"))
+        text = seg.get("text", "")
+        confidence = seg.get("confidence", 1.0)
+    else:
+        start, end = seg.start_time, seg.end_time
+        speaker, text, confidence = seg.speaker_id, seg.text, seg.confidence
+
+    confidence = 1.0 if confidence is None else confidence
+    return float(start or 0.0), float(end or start or 0.0), speaker, text or "", float(confidence)
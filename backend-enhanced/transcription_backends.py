@@ -0,0 +1,308 @@
+"""
+Transcription Backends
+Pluggable speech-to-text engines: OpenAI Whisper API or local int8 CPU inference
+"""
+import asyncio
+import logging
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Union
+
+import openai
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+AudioInput = Union[str, BinaryIO]
+ProgressCallback = Callable[[float], None]
+
+
+@dataclass
+class RawTranscript:
+    """Backend-neutral transcription output"""
+    text: str
+    segments: List[Dict[str, Any]] = field(default_factory=list)  # [{start, end, text, confidence}]
+    language: str = "en"
+    duration: Optional[float] = None
+    model: str = ""
+    backend: str = ""
+
+
+class TranscriptionBackend(ABC):
+    """Interface every speech-to-text engine implements"""
+
+    name: str = ""
+
+    @abstractmethod
+    async def transcribe(
+        self,
+        audio: AudioInput,
+        language: Optional[str] = None,
+        prompt: Optional[str] = None,
+        on_progress: Optional[ProgressCallback] = None
+    ) -> RawTranscript:
+        """
+        Transcribe audio
+
+        Args:
+            audio: File path or readable binary file
+            language: Language code (detected when omitted)
+            prompt: Context to improve accuracy
+            on_progress: Called with the fraction of audio processed (0.0-1.0),
+                from a worker thread, by engines that can report it
+
+        Returns:
+            RawTranscript with segment timestamps
+        """
+
+
+def _field(item: Any, name: str) -> Any:
+    """A field of an API response item: verbose_json segments are plain dicts in older openai clients"""
+    if isinstance(item, dict):
+        return item.get(name)
+    return getattr(item, name, None)
+
+
+class OpenAIWhisperBackend(TranscriptionBackend):
+    """Hosted Whisper via the OpenAI API"""
+
+    name = "openai"
+
+    def __init__(self, model: str = "whisper-1"):
+        self.model = model
+        self.client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+
+    async def transcribe(
+        self,
+        audio: AudioInput,
+        language: Optional[str] = None,
+        prompt: Optional[str] = None,
+        on_progress: Optional[ProgressCallback] = None
+    ) -> RawTranscript:
+        if isinstance(audio, str):
+            with open(audio, "rb") as f:
+                return await self._transcribe(f, language, prompt)
+        return await self._transcribe(audio, language, prompt)
+
+    async def _transcribe(self, audio_file: BinaryIO, language: Optional[str], prompt: Optional[str]) -> RawTranscript:
+        kwargs = {}
+        if language:
+            kwargs["language"] = language
+        if prompt:
+            kwargs["prompt"] = prompt
+
+        transcript = await self.client.audio.transcriptions.create(
+            model=self.model,
+            file=audio_file,
+            response_format="verbose_json",
+            timestamp_granularities=["segment"],
+            **kwargs
+        )
+
+        segments = []
+        for seg in getattr(transcript, "segments", None) or []:
+            avg_logprob = _field(seg, "avg_logprob")
+            segments.append({
+                "start": _field(seg, "start"),
+                "end": _field(seg, "end"),
+                "text": (_field(seg, "text") or "").strip(),
+                "confidence": math.exp(avg_logprob) if avg_logprob is not None else 1.0
+            })
+
+        return RawTranscript(
+            text=transcript.text,
+            segments=segments,
+            language=getattr(transcript, "language", None) or language or "en",
+            duration=getattr(transcript, "duration", None),
+            model=self.model,
+            backend=self.name
+        )
+
+
+class LocalWhisperBackend(TranscriptionBackend):
+    """
+    On-prem Whisper on CPU via CTranslate2 (faster-whisper)
+
+    - int8-quantized weights (configurable compute type)
+    - Batched decoding of VAD-split chunks
+    - Configurable intra-op thread count
+    - Model loaded lazily once per process
+    """
+
+    name = "local"
+
+    def __init__(
+        self,
+        model_size: str = settings.LOCAL_WHISPER_MODEL,
+        compute_type: str = settings.LOCAL_WHISPER_COMPUTE_TYPE,
+        cpu_threads: int = settings.LOCAL_WHISPER_CPU_THREADS,
+        batch_size: int = settings.LOCAL_WHISPER_BATCH_SIZE,
+        max_concurrency: int = settings.LOCAL_WHISPER_MAX_CONCURRENCY
+    ):
+        self.model_size = model_size
+        self.compute_type = compute_type
+        self.cpu_threads = cpu_threads
+        self.batch_size = batch_size
+
+        self._pipeline = None
+        self._load_lock = threading.Lock()
+        # Each inference already uses cpu_threads cores; cap parallel jobs
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+
+    def _get_pipeline(self):
+        if self._pipeline is None:
+            with self._load_lock:
+                if self._pipeline is None:
+                    try:
+                        from faster_whisper import BatchedInferencePipeline, WhisperModel
+                    except ImportError as e:
+                        raise RuntimeError(
+                            "Local transcription requires the faster-whisper package"
+                        ) from e
+
+                    logger.info(
+                        f"🧠 Loading local Whisper '{self.model_size}' "
+                        f"({self.compute_type}, {self.cpu_threads} threads)"
+                    )
+                    model = WhisperModel(
+                        self.model_size,
+                        device="cpu",
+                        compute_type=self.compute_type,
+                        cpu_threads=self.cpu_threads
+                    )
+                    self._pipeline = BatchedInferencePipeline(model=model)
+
+        return self._pipeline
+
+    async def transcribe(
+        self,
+        audio: AudioInput,
+        language: Optional[str] = None,
+        prompt: Optional[str] = None,
+        on_progress: Optional[ProgressCallback] = None
+    ) -> RawTranscript:
+        return await asyncio.to_thread(self._transcribe_sync, audio, language, prompt, on_progress)
+
+    def _transcribe_sync(
+        self,
+        audio: AudioInput,
+        language: Optional[str],
+        prompt: Optional[str],
+        on_progress: Optional[ProgressCallback] = None
+    ) -> RawTranscript:
+        pipeline = self._get_pipeline()
+
+        with self._slots:
+            segments_iter, info = pipeline.transcribe(
+                audio,
+                language=language,
+                initial_prompt=prompt,
+                batch_size=self.batch_size
+            )
+
+            # Decoding happens lazily while the generator is consumed
+            segments = []
+            for seg in segments_iter:
+                segments.append({
+                    "start": seg.start,
+                    "end": seg.end,
+                    "text": seg.text.strip(),
+                    "confidence": math.exp(seg.avg_logprob)
+                })
+                if on_progress and info.duration:
+                    on_progress(min(seg.end / info.duration, 1.0))
+
+        return RawTranscript(
+            text=" ".join(seg["text"] for seg in segments),
+            segments=segments,
+            language=info.language,
+            duration=info.duration,
+            model=f"faster-whisper-{self.model_size}-{self.compute_type}",
+            backend=self.name
+        )
+
+
+# ============================================================================
+# BACKEND REGISTRY
+# ============================================================================
+
+TRANSCRIPTION_BACKENDS = {
+    OpenAIWhisperBackend.name: OpenAIWhisperBackend,
+    LocalWhisperBackend.name: LocalWhisperBackend,
+}
+
+_backend_instances: Dict[str, TranscriptionBackend] = {}
+
+
+def get_transcription_backend(name: Optional[str] = None) -> TranscriptionBackend:
+    """Get the (shared) backend instance by name, defaulting to TRANSCRIPTION_BACKEND"""
+
+    name = name or settings.TRANSCRIPTION_BACKEND
+
+    if name not in TRANSCRIPTION_BACKENDS:
+        raise ValueError(f"Unknown transcription backend: {name}")
+
+    if name not in _backend_instances:
+        _backend_instances[name] = TRANSCRIPTION_BACKENDS[name]()
+
+    return _backend_instances[name]
+
+
+def resolve_transcription_backend(org_settings: Optional[Dict] = None) -> str:
+    """Per-tenant routing: Organization.settings["transcription_backend"] overrides the default"""
+
+    if org_settings:
+        name = org_settings.get("transcription_backend")
+        if name in TRANSCRIPTION_BACKENDS:
+            return name
+    return settings.TRANSCRIPTION_BACKEND
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+async def benchmark_real_time_factor(audio_path: str, backends: Optional[List[str]] = None) -> List[Dict]:
+    """
+    Compare real-time factor (processing seconds / audio seconds) across backends
+
+    RTF < 1.0 means faster than real time.
+    """
+
+    results = []
+
+    for name in backends or list(TRANSCRIPTION_BACKENDS):
+        backend = get_transcription_backend(name)
+
+        start = time.perf_counter()
+        try:
+            transcript = await backend.transcribe(audio_path)
+        except Exception as e:
+            results.append({"backend": name, "error": str(e)})
+            continue
+        elapsed = time.perf_counter() - start
+
+        results.append({
+            "backend": name,
+            "model": transcript.model,
+            "audio_seconds": transcript.duration,
+            "processing_seconds": round(elapsed, 2),
+            "real_time_factor": round(elapsed / transcript.duration, 3) if transcript.duration else None,
+            "segments": len(transcript.segments)
+        })
+
+    return results
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python transcription_backends.py <audio_file> [backend ...]")
+        sys.exit(1)
+
+    for row in asyncio.run(benchmark_real_time_factor(sys.argv[1], sys.argv[2:] or None)):
+        print(row)
@@ -7,14 +7,16 @@ import asyncio
 import os
 import tempfile
 import logging
-from typing import Dict, List, Optional, BinaryIO, AsyncIterator
+from typing import Dict, List, Optional, BinaryIO, AsyncIterator, Iterable, Iterator
 from pathlib import Path
 import time
+import wave
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
-import openai
 from config import settings
+from diarization import DiarizationEngine, DiarizationError
+from transcription_backends import get_transcription_backend
 
 logger = logging.getLogger(__name__)
 
@@ -47,18 +49,23 @@ class TranscriptionService:
     """
     Real-time audio transcription service
 
+    Speech-to-text runs on a pluggable backend (OpenAI Whisper API or local
+    int8 CPU inference, see transcription_backends.py), selectable per call.
+
     Features:
     - Real-time streaming transcription
-    - Speaker diarization (who said what)
+    - Acoustic speaker diarization (who said what)
     - Multi-language support
     - Timestamp tracking
     - High accuracy (Whisper large-v3)
     """
 
     def __init__(self):
-        self.client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
         self.temp_dir = Path(tempfile.gettempdir()) / "meeting-transcripts"
         self.temp_dir.mkdir(exist_ok=True)
+        self.diarization_engine = DiarizationEngine(
+            max_speakers=settings.DIARIZATION_MAX_SPEAKERS
+        )
 
         logger.info("🎤 Transcription service initialized")
 
@@ -67,7 +74,8 @@ class TranscriptionService:
         audio_file: BinaryIO,
         language: Optional[str] = None,
         prompt: Optional[str] = None,
-        enable_diarization: bool = True
+        enable_diarization: bool = True,
+        backend: Optional[str] = None
     ) -> TranscriptionResult:
         """
         Transcribe an audio file
@@ -77,6 +85,7 @@ class TranscriptionService:
             language: Language code (e.g., 'en', 'es', 'fr')
             prompt: Context to improve accuracy
             enable_diarization: Detect different speakers
+            backend: Transcription backend name (default: TRANSCRIPTION_BACKEND)
 
         Returns:
             TranscriptionResult with full text and segments
@@ -87,45 +96,43 @@ class TranscriptionService:
         logger.info("🎙️  Starting transcription...")
 
         try:
-            # Transcribe with Whisper
-            transcript = self.client.audio.transcriptions.create(
-                model="whisper-1",
-                file=audio_file,
+            # Transcribe with the selected backend
+            transcript = await get_transcription_backend(backend).transcribe(
+                audio_file,
                 language=language,
-                prompt=prompt,
-                response_format="verbose_json",  # Get timestamps
-                timestamp_granularities=["segment"]
+                prompt=prompt
             )
 
             # Parse segments
             segments = []
-            full_text = ""
 
             for seg in transcript.segments:
                 segment = TranscriptSegment(
-                    text=seg.text.strip(),
-                    start_time=seg.start,
-                    end_time=seg.end,
-                    confidence=seg.get("confidence", 1.0)
+                    text=seg["text"],
+                    start_time=seg["start"],
+                    end_time=seg["end"],
+                    confidence=seg.get("confidence", 1.0),
+                    language=transcript.language
                 )
                 segments.append(segment)
-                full_text += segment.text + " "
+
+            full_text = " ".join(seg.text for seg in segments)
 
             # Speaker diarization (if enabled)
             if enable_diarization and len(segments) > 0:
-                segments = await self._add_speaker_labels(segments)
+                segments = await self._add_speaker_labels(segments, audio_file)
 
             processing_time_ms = int((time.time() - start_time) * 1000)
 
             result = TranscriptionResult(
-                full_text=full_text.strip(),
+                full_text=full_text,
                 segments=segments,
                 language=transcript.language,
-                duration_seconds=transcript.duration,
+                duration_seconds=transcript.duration or (segments[-1].end_time if segments else 0.0),
                 word_count=len(full_text.split()),
                 speakers_detected=self._count_unique_speakers(segments),
                 processing_time_ms=processing_time_ms,
-                model_used="whisper-1"
+                model_used=transcript.model
             )
 
             logger.info(
@@ -202,14 +209,75 @@ class TranscriptionService:
 
     async def _add_speaker_labels(
         self,
-        segments: List[TranscriptSegment]
+        segments: List[TranscriptSegment],
+        audio_file: Optional[BinaryIO] = None
     ) -> List[TranscriptSegment]:
         """
-        Add speaker labels using simple diarization heuristics
+        Add speaker labels using acoustic diarization
 
-        Note: For production, integrate with pyannote.audio or similar
+        Clusters spectral embeddings of the audio itself and aligns the
+        resulting speaker turns to segment timestamps. Falls back to text
+        heuristics when the audio cannot be decoded.
         """
 
+        if audio_file is not None and settings.DIARIZATION_ENABLED:
+            try:
+                audio_file.seek(0)
+                await asyncio.to_thread(
+                    self.diarization_engine.label_segments,
+                    audio_file,
+                    segments
+                )
+                return segments
+            except (DiarizationError, OSError, EOFError, wave.Error) as e:  # undecodable / truncated audio
+                logger.warning(f"Acoustic diarization failed, using text heuristics: {e}")
+
+        return await self._add_heuristic_speaker_labels(segments)
+
+    async def label_stored_segments(self, segments: List[Dict], audio_path: str) -> List[Dict]:
+        """
+        Set `speaker` on backend segment dicts ({start, end, text}) in place
+
+        Same acoustic diarization with heuristic fallback as transcribe_file,
+        for callers that hold a local audio file and raw backend segments.
+        """
+
+        labelled = [
+            TranscriptSegment(text=seg.get("text", ""), start_time=seg["start"], end_time=seg["end"])
+            for seg in segments
+        ]
+        if not labelled:
+            return segments
+
+        with open(audio_path, "rb") as audio_file:
+            labelled = await self._add_speaker_labels(labelled, audio_file)
+
+        for seg, labelled_seg in zip(segments, labelled):
+            seg["speaker"] = labelled_seg.speaker_id
+
+        return segments
+
+    @staticmethod
+    def speaker_summary(segments: Iterable[Dict]) -> List[Dict]:
+        """Meeting.speakers entries ({name, role, total_time, sentiment}) from labelled segments"""
+
+        talk_time: Dict[str, float] = {}
+        for seg in segments:
+            speaker = seg.get("speaker")
+            if speaker:
+                talk_time[speaker] = talk_time.get(speaker, 0.0) + max(0.0, seg["end"] - seg["start"])
+
+        return [
+            {"name": name, "role": None, "total_time": round(seconds, 2), "sentiment": None}
+            for name, seconds in sorted(talk_time.items(), key=lambda item: -item[1])
+        ]
+
+    async def _add_heuristic_speaker_labels(
+        self,
+        segments: List[TranscriptSegment]
+    ) -> List[TranscriptSegment]:
+        """Add speaker labels from pauses and text cues (fallback only)"""
+
         # Simple speaker detection based on:
         # 1. Pauses (>2 seconds = likely different speaker)
         # 2. Tone/style analysis via AI
@@ -323,25 +391,48 @@ Transcript:
             Formatted transcript text
         """
 
-        lines = []
+        return "".join(self.iter_format_transcript(result, include_timestamps, include_speakers))
 
-        lines.append("=" * 60)
-        lines.append("MEETING TRANSCRIPT")
-        lines.append("=" * 60)
-        lines.append(f"Duration: {self._format_duration(result.duration_seconds)}")
-        lines.append(f"Language: {result.language.upper()}")
-        lines.append(f"Words: {result.word_count:,}")
-        lines.append(f"Speakers: {result.speakers_detected}")
-        lines.append("=" * 60)
-        lines.append("")
+    def iter_format_transcript(
+        self,
+        result: TranscriptionResult,
+        include_timestamps: bool = True,
+        include_speakers: bool = True
+    ) -> Iterator[str]:
+        """Yield the formatted transcript (header, one line per segment, footer)"""
+
+        rule = "=" * 60
+
+        yield (
+            f"{rule}\n"
+            f"MEETING TRANSCRIPT\n"
+            f"{rule}\n"
+            f"Duration: {self._format_duration(result.duration_seconds)}\n"
+            f"Language: {result.language.upper()}\n"
+            f"Words: {result.word_count:,}\n"
+            f"Speakers: {result.speakers_detected}\n"
+            f"{rule}\n"
+            f"\n"
+        )
+
+        yield from self.iter_transcript_lines(result.segments, include_timestamps, include_speakers)
+
+        yield f"\n{rule}\nEND OF TRANSCRIPT\n{rule}"
 
-        for segment in result.segments:
+    def iter_transcript_lines(
+        self,
+        segments: Iterable[TranscriptSegment],
+        include_timestamps: bool = True,
+        include_speakers: bool = True
+    ) -> Iterator[str]:
+        """Yield one "[MM:SS] Speaker: text" line per segment"""
+
+        for segment in segments:
             parts = []
 
             # Timestamp
             if include_timestamps:
-                timestamp = self._format_timestamp(segment.start_time)
-                parts.append(f"[{timestamp}]")
+                parts.append(f"[{self._format_timestamp(segment.start_time)}]")
 
             # Speaker
             if include_speakers and segment.speaker_id:
@@ -350,14 +441,13 @@ Transcript:
             # Text
             parts.append(segment.text)
 
-            lines.append(" ".join(parts))
+            yield " ".join(parts) + "\n"
 
-        lines.append("")
-        lines.append("=" * 60)
-        lines.append("END OF TRANSCRIPT")
-        lines.append("=" * 60)
+    def iter_plain_text(self, segments: Iterable[TranscriptSegment]) -> Iterator[str]:
+        """Yield the bare transcript text, one segment per line"""
 
-        return "\n".join(lines)
+        for segment in segments:
+            yield segment.text + "\n"
 
     def _format_duration(self, seconds: float) -> str:
         """Format duration as HH:MM:SS"""
@@ -380,26 +470,46 @@ Transcript:
             SRT formatted string
         """
 
-        srt_lines = []
+        return "".join(self.iter_srt(result.segments))
 
-        for i, segment in enumerate(result.segments, 1):
-            # Subtitle number
-            srt_lines.append(str(i))
+    def iter_srt(self, segments: Iterable[TranscriptSegment]) -> Iterator[str]:
+        """Yield SRT cues, one per segment"""
 
-            # Timestamp
+        for i, segment in enumerate(segments, 1):
             start = self._format_srt_timestamp(segment.start_time)
             end = self._format_srt_timestamp(segment.end_time)
-            srt_lines.append(f"{start} --> {end}")
 
             # Text (with speaker if available)
             text = segment.text
             if segment.speaker_id:
                 text = f"[{segment.speaker_id}] {text}"
 
-            srt_lines.append(text)
-            srt_lines.append("")  # Blank line
+            yield f"{i}\n{start} --> {end}\n{text}\n\n"
+
+    def export_to_vtt(self, result: TranscriptionResult) -> str:
+        """
+        Export transcript to WebVTT subtitle format
 
-        return "\n".join(srt_lines)
+        Returns:
+            WebVTT formatted string
+        """
+
+        return "".join(self.iter_vtt(result.segments))
+
+    def iter_vtt(self, segments: Iterable[TranscriptSegment]) -> Iterator[str]:
+        """Yield a WebVTT document; speakers become <v> voice spans"""
+
+        yield "WEBVTT\n\n"
+
+        for segment in segments:
+            start = self._format_srt_timestamp(segment.start_time).replace(",", ".")
+            end = self._format_srt_timestamp(segment.end_time).replace(",", ".")
+
+            text = segment.text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+            if segment.speaker_id:
+                text = f"<v {segment.speaker_id}>{text}"
+
+            yield f"{start} --> {end}\n{text}\n\n"
 
     def _format_srt_timestamp(self, seconds: float) -> str:
         """Format timestamp for SRT (HH:MM:SS,mmm)"""
@@ -411,6 +521,23 @@ Transcript:
         return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
 
 
+def iter_chunks(pieces: Iterable[str], chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Coalesce small formatter outputs into ~chunk_size byte chunks for streaming"""
+
+    buffer: List[str] = []
+    size = 0
+
+    for piece in pieces:
+        buffer.append(piece)
+        size += len(piece)
+        if size >= chunk_size:
+            yield "".join(buffer).encode("utf-8")
+            buffer, size = [], 0
+
+    if buffer:
+        yield "".join(buffer).encode("utf-8")
+
+
 # Global transcription service instance
 transcription_service = TranscriptionService()
 
@@ -418,7 +545,8 @@ transcription_service = TranscriptionService()
 # Convenience function
 async def transcribe_audio(
     audio_file: BinaryIO,
-    language: Optional[str] = None
+    language: Optional[str] = None,
+    backend: Optional[str] = None
 ) -> TranscriptionResult:
     """Quick transcription function"""
-    return await transcription_service.transcribe_file(audio_file, language)
+    return await transcription_service.transcribe_file(audio_file, language, backend=backend)
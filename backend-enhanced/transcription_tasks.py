@@ -0,0 +1,191 @@
+"""
+Transcription Jobs
+Celery tasks driving MediaFile.transcription_status (pending → processing → completed | failed)
+"""
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from celery.signals import worker_process_init
+from sqlalchemy import and_, func, or_, select, update
+
+from ai.passage_index import passage_index, meeting_document
+from ai.vector_index import vector_index
+from ai_orchestrator import ai_orchestrator
+from celery_app import celery_app, TRANSCRIBE_MEDIA_FILE_TASK
+from config import settings
+from database import SessionLocal, engine
+from media_storage import MEDIA_STORAGE_BACKENDS
+from models import ActionItem, MediaFile, Organization
+from transcript_store import CompactTranscript
+from transcription_backends import resolve_transcription_backend
+from transcription_service import transcription_service
+
+logger = logging.getLogger(__name__)
+
+# Progress milestones (percent); the transcription itself spans the gap between them
+PROGRESS_CLAIMED = 5
+PROGRESS_AUDIO_READY = 10
+PROGRESS_TRANSCRIBED = 90
+PROGRESS_DONE = 100
+
+PROGRESS_WRITE_INTERVAL_SECONDS = 5.0
+
+
+# One event loop per worker process, kept across jobs: shared async SDK clients (the
+# cached transcription backends) hold connection pools bound to the loop that created them
+_event_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+@worker_process_init.connect
+def _reset_db_pool(**_):
+    # Never share pooled connections inherited from the parent process
+    engine.dispose()
+
+
+def _run(coroutine):
+    """Run a coroutine on this process's persistent event loop"""
+    global _event_loop
+    if _event_loop is None or _event_loop.is_closed():
+        _event_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_event_loop)
+    return _event_loop.run_until_complete(coroutine)
+
+
+def _set_status(media_id: str, **values):
+    db = SessionLocal()
+    try:
+        db.execute(update(MediaFile).where(MediaFile.id == media_id).values(**values))
+        db.commit()
+    finally:
+        db.close()
+
+
+class _ProgressReporter:
+    """Maps backend progress (0-1) onto the transcription span, throttling DB writes"""
+
+    def __init__(self, media_id: str):
+        self.media_id = media_id
+        self.last_percent = PROGRESS_AUDIO_READY
+        self.last_write = 0.0
+
+    def __call__(self, fraction: float):
+        percent = PROGRESS_AUDIO_READY + int(fraction * (PROGRESS_TRANSCRIBED - PROGRESS_AUDIO_READY))
+        now = time.monotonic()
+
+        if percent > self.last_percent and now - self.last_write >= PROGRESS_WRITE_INTERVAL_SECONDS:
+            self.last_percent, self.last_write = percent, now
+            _set_status(self.media_id, transcription_progress=percent)
+
+
+@celery_app.task(
+    bind=True,
+    name=TRANSCRIBE_MEDIA_FILE_TASK,
+    max_retries=settings.TRANSCRIPTION_MAX_RETRIES,
+    time_limit=settings.TRANSCRIPTION_TASK_TIME_LIMIT
+)
+def transcribe_media_file(self, media_id: str):
+    """Transcribe an uploaded recording and attach the transcript to its meeting"""
+
+    db = SessionLocal()
+    try:
+        # Claim the job; a redelivery of this same job (worker crash) may re-claim it
+        claimed = db.execute(
+            update(MediaFile)
+            .where(and_(
+                MediaFile.id == media_id,
+                or_(
+                    MediaFile.transcription_status == "pending",
+                    and_(
+                        MediaFile.transcription_status == "processing",
+                        MediaFile.transcription_job_id == self.request.id
+                    )
+                )
+            ))
+            .values(
+                transcription_status="processing",
+                transcription_job_id=self.request.id,
+                transcription_progress=PROGRESS_CLAIMED,
+                transcription_attempts=func.coalesce(MediaFile.transcription_attempts, 0) + 1
+            )
+        ).rowcount
+        db.commit()
+
+        if not claimed:
+            logger.info(f"Transcription job for media {media_id} already handled, skipping")
+            return {"media_id": media_id, "skipped": True}
+
+        media = db.execute(select(MediaFile).where(MediaFile.id == media_id)).scalar_one()
+        meeting = media.meeting
+        organization = db.execute(
+            select(Organization).where(Organization.id == meeting.organization_id)
+        ).scalar_one_or_none()
+        backend = resolve_transcription_backend(organization.settings if organization else None)
+
+        result = _run(_transcribe(media, backend, _ProgressReporter(media_id)))
+
+        if not result.get("success"):
+            raise RuntimeError(result.get("error") or "Transcription failed")
+
+        meeting.transcript = result["text"]
+        meeting.transcript_segments = result.get("segments", [])
+        meeting.speakers = transcription_service.speaker_summary(meeting.transcript_segments)
+        meeting.transcript_columnar = CompactTranscript.from_segments(
+            meeting.transcript_segments
+        ).to_bytes()
+
+        if result.get("duration"):
+            media.duration_seconds = int(result["duration"])
+        media.transcription_status = "completed"
+        media.transcription_progress = PROGRESS_DONE
+        media.transcription_error = None
+        db.commit()
+
+        logger.info(f"✅ Transcription completed for media {media_id} ({result.get('backend')})")
+
+        try:
+            action_items = db.execute(
+                select(ActionItem).where(ActionItem.meeting_id == meeting.id)
+            ).scalars().all()
+            document = meeting_document(meeting, action_items)
+            passage_index.partition(meeting.organization_id).index_meeting(document)
+            if settings.VECTOR_SEARCH_ENABLED:
+                vector_index.partition(meeting.organization_id).index_meeting(document)
+        except Exception as e:
+            logger.warning(f"⚠️ Search indexing failed for meeting {meeting.id}: {e}")
+
+        return {"media_id": media_id, "segments": len(meeting.transcript_segments)}
+
+    except Exception as e:
+        db.rollback()
+
+        if self.request.retries < self.max_retries:
+            logger.warning(f"⚠️ Transcription attempt failed for media {media_id}, retrying: {e}")
+            _set_status(media_id, transcription_status="pending", transcription_error=str(e))
+            raise self.retry(
+                exc=e,
+                countdown=settings.TRANSCRIPTION_RETRY_BACKOFF_SECONDS * (2 ** self.request.retries)
+            )
+
+        logger.error(f"❌ Transcription failed for media {media_id}: {e}")
+        _set_status(media_id, transcription_status="failed", transcription_error=str(e))
+        raise
+
+    finally:
+        db.close()
+
+
+async def _transcribe(media: MediaFile, backend: str, on_progress: _ProgressReporter) -> dict:
+    # Fresh storage client per job
+    storage = MEDIA_STORAGE_BACKENDS[media.storage_backend or "local"]()
+
+    async with storage.open_local(media.storage_path) as path:
+        _set_status(str(media.id), transcription_progress=PROGRESS_AUDIO_READY)
+        result = await ai_orchestrator.transcribe_audio(path, backend=backend, on_progress=on_progress)
+
+        # Diarize while the local copy still exists
+        if result.get("success"):
+            await transcription_service.label_stored_segments(result.get("segments") or [], path)
+
+        return result